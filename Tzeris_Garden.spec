@@ -5,7 +5,15 @@ a = Analysis(
     ['code\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[
+        # packed images + SFX (build with: python code/asset_bundle.py build)
+        ('assets.bundle', '.'),
+        # maps, fonts and music are still read from disk
+        ('audio', 'audio'),
+        ('data', 'data'),
+        ('font', 'font'),
+        ('graphics', 'graphics'),
+    ],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -32,6 +40,8 @@ exe = EXE(
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
+    # keep data beside the exe, which is where main.py chdirs to
+    contents_directory='.',
 )
 coll = COLLECT(
     exe,
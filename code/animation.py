@@ -0,0 +1,32 @@
+class AnimationSet:
+	"""Looping frames shown in lockstep by every sprite that uses them"""
+	def __init__(self, frames, speed):
+		self.frames = frames
+		self.speed = speed
+		self.frame_index = 0
+		self.frame = frames[0]
+
+	def advance(self, dt):
+		self.frame_index += self.speed * dt
+		if self.frame_index >= len(self.frames):
+			self.frame_index = 0
+		self.frame = self.frames[int(self.frame_index)]
+
+class AnimationClock:
+	"""Advances each shared animation once per frame instead of once per sprite"""
+	def __init__(self):
+		self.sets = {}
+
+	def get(self, name, frames, speed):
+		if name not in self.sets:
+			self.sets[name] = AnimationSet(frames, speed)
+		return self.sets[name]
+
+	def update(self, dt):
+		for animation in self.sets.values():
+			animation.advance(dt)
+
+	def clear(self):
+		self.sets = {}
+
+animation_clock = AnimationClock()
@@ -0,0 +1,198 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import threading
+from os import walk
+import pygame
+
+# Packed asset bundle
+# One file holding every image under graphics/ as raw RGBA pixels plus the
+# small sound effects as mixer-ready PCM. Loading from it skips os.walk and
+# PNG/MP3 decoding entirely: surfaces are created straight from the
+# memory-mapped file with pygame.image.frombuffer.
+#
+# Layout:  magic (4) | version (u32) | index length (u32) | index (json) | blobs
+#
+# Rebuild after changing any art or sound:  python code/asset_bundle.py build
+
+BUNDLE_PATH = 'assets.bundle'
+BUNDLE_MAGIC = b'TZGB'
+BUNDLE_VERSION = 1
+BUNDLE_IMAGE_ROOT = 'graphics'
+BUNDLE_SOUND_ROOT = 'audio'
+BUNDLE_SOUND_MAX_BYTES = 64 * 1024  # only small SFX, music stays streamed from disk
+BUNDLE_ALIGN = 16
+
+def normalize_path(path):
+	return path.replace('\\', '/').rstrip('/')
+
+class AssetBundle:
+	def __init__(self, path = BUNDLE_PATH):
+		self.path = path
+		self.file = open(path, 'rb')
+		self.data = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+		self.view = memoryview(self.data)
+
+		magic, version, index_len = struct.unpack_from('<4sII', self.data, 0)
+		if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+			self.close()
+			raise ValueError(f'{path} is not a version {BUNDLE_VERSION} asset bundle')
+
+		index = json.loads(bytes(self.view[12:12 + index_len]).decode('utf-8'))
+		self.images = index['images']    # path -> [offset, length, width, height]
+		self.folders = index['folders']  # folder -> file names in os.walk order
+		self.sounds = index['sounds']    # path -> [offset, length]
+
+		# blob offsets are relative to the aligned end of the index
+		header_len = 12 + index_len
+		self.blobs = self.view[header_len + (-header_len % BUNDLE_ALIGN):]
+		self.mixer_format = tuple(index['mixer']) if index['mixer'] else None
+
+	def close(self):
+		if hasattr(self, 'blobs'):
+			self.blobs.release()
+		self.view.release()
+		self.data.close()
+		self.file.close()
+
+	def has_folder(self, path):
+		return normalize_path(path) in self.folders
+
+	def has_image(self, path):
+		return normalize_path(path) in self.images
+
+	def has_sound(self, path):
+		return normalize_path(path) in self.sounds
+
+	def image_size(self, path):
+		return tuple(self.images[normalize_path(path)][2:4])
+
+	def load_image(self, path):
+		"""Surface backed by the mapped file (call convert/convert_alpha to detach it)"""
+		offset, length, width, height = self.images[normalize_path(path)]
+		return pygame.image.frombuffer(self.blobs[offset:offset + length], (width, height), 'RGBA')
+
+	def load_folder(self, path):
+		"""List of (file name, surface) pairs in the same order import_folder walks them"""
+		folder = normalize_path(path)
+		return [(name, self.load_image(f'{folder}/{name}')) for name in self.folders[folder]]
+
+	def load_sound(self, path):
+		"""Sound built from the stored PCM, or None if the mixer format differs"""
+		if pygame.mixer.get_init() != self.mixer_format:
+			return None
+		offset, length = self.sounds[normalize_path(path)]
+		return pygame.mixer.Sound(buffer = self.blobs[offset:offset + length])
+
+_bundle = None
+_bundle_checked = False
+_bundle_lock = threading.Lock()  # the preloader's workers ask for it all at once
+
+def get_bundle():
+	"""The shared bundle, or None when there is no (valid) bundle next to the game"""
+	global _bundle, _bundle_checked
+	if _bundle_checked:
+		return _bundle
+	with _bundle_lock:
+		if not _bundle_checked:
+			if not os.environ.get('TZERI_NO_BUNDLE') and os.path.exists(BUNDLE_PATH):
+				try:
+					_bundle = AssetBundle(BUNDLE_PATH)
+				except Exception as e:
+					print(f"⚠️ Ignoring asset bundle: {e}")
+			_bundle_checked = True
+	return _bundle
+
+def build_bundle(path = BUNDLE_PATH):
+	"""Decode every image and small SFX once and pack them into a single file"""
+	if not pygame.mixer.get_init():
+		pygame.mixer.init()
+
+	images, folders, sounds = {}, {}, {}
+	blobs = []
+	size = 0
+
+	def add_blob(data):
+		nonlocal size
+		offset = size
+		blobs.append(data)
+		size += len(data)
+		padding = -size % BUNDLE_ALIGN
+		if padding:
+			blobs.append(bytes(padding))
+			size += padding
+		return offset
+
+	for folder, _, files in walk(BUNDLE_IMAGE_ROOT):
+		folder = normalize_path(folder)
+		names = [name for name in files if name.lower().endswith('.png')]
+		if names:
+			folders[folder] = names
+		for name in names:
+			surf = pygame.image.load(f'{folder}/{name}')
+			pixels = pygame.image.tobytes(surf, 'RGBA')
+			images[f'{folder}/{name}'] = [add_blob(pixels), len(pixels), *surf.get_size()]
+
+	for folder, _, files in walk(BUNDLE_SOUND_ROOT):
+		folder = normalize_path(folder)
+		for name in files:
+			full_path = f'{folder}/{name}'
+			if os.path.getsize(full_path) <= BUNDLE_SOUND_MAX_BYTES:
+				pcm = pygame.mixer.Sound(full_path).get_raw()
+				sounds[full_path] = [add_blob(pcm), len(pcm)]
+
+	index = {'images': images, 'folders': folders, 'sounds': sounds, 'mixer': list(pygame.mixer.get_init())}
+	index_bytes = json.dumps(index, separators = (',', ':')).encode('utf-8')
+	header_len = 12 + len(index_bytes)
+
+	with open(path, 'wb') as f:
+		f.write(struct.pack('<4sII', BUNDLE_MAGIC, BUNDLE_VERSION, len(index_bytes)))
+		f.write(index_bytes)
+		f.write(bytes(-header_len % BUNDLE_ALIGN))
+		for blob in blobs:
+			f.write(blob)
+
+	print(f"📦 Bundled {len(images)} images and {len(sounds)} sounds into {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+def benchmark(path = BUNDLE_PATH):
+	"""Time loading every bundled image and sound from loose files vs the bundle"""
+	if not pygame.mixer.get_init():
+		pygame.mixer.init()
+	pygame.display.set_mode((1, 1))
+	bundle = AssetBundle(path)
+
+	start = time.perf_counter()
+	for folder, names in bundle.folders.items():
+		for _, __, img_files in walk(folder):
+			for image in img_files:
+				pygame.image.load(folder + '/' + image).convert_alpha()
+			break
+	for sound_path in bundle.sounds:
+		pygame.mixer.Sound(sound_path)
+	loose_time = time.perf_counter() - start
+
+	start = time.perf_counter()
+	for folder in bundle.folders:
+		for _, surf in bundle.load_folder(folder):
+			surf.convert_alpha()
+	for sound_path in bundle.sounds:
+		bundle.load_sound(sound_path)
+	bundle_time = time.perf_counter() - start
+
+	print(f"⏱️ loose files: {loose_time * 1000:.1f} ms")
+	print(f"⏱️ asset bundle: {bundle_time * 1000:.1f} ms ({loose_time / bundle_time:.1f}x faster)")
+
+if __name__ == '__main__':
+	# run from the project root like main.py does
+	os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+	pygame.init()
+	command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+	if command == 'build':
+		build_bundle()
+	elif command == 'bench':
+		benchmark()
+	else:
+		print('usage: python code/asset_bundle.py [build|bench]')
@@ -0,0 +1,122 @@
+import os
+import time
+from os import walk
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from asset_bundle import get_bundle, normalize_path
+from support import store_preloaded
+
+# What to decode up front, grouped so the timing report shows where start-up goes.
+# A folder loads every image in it, 'folder/*' loads each of its sub folders,
+# a .png is a single image and anything else is a sound effect.
+ASSET_MANIFEST = {
+	'player': ['graphics/character/*'],
+	'dog': ['graphics/dog/*'],
+	'soil': ['graphics/soil', 'graphics/soil_water'],
+	'crops': ['graphics/fruit/*', 'graphics/fruit/apple.png', 'graphics/stumps/small.png', 'graphics/stumps/large.png'],
+	'water': ['graphics/water'],
+	'rain': ['graphics/rain/drops', 'graphics/rain/floor'],
+	'overlay': ['graphics/overlay', 'graphics/cursor.png'],
+	'sfx': ['audio/axe.mp3', 'audio/water.mp3', 'audio/hoe.wav', 'audio/plant.wav', 'audio/success.wav'],
+}
+
+def decode_image(path):
+	"""Decode an image without converting it (convert needs the main thread)"""
+	start = time.perf_counter()
+	bundle = get_bundle()
+	if bundle and bundle.has_image(path):
+		surf = bundle.load_image(path)
+	else:
+		surf = pygame.image.load(path)
+	return surf, time.perf_counter() - start
+
+def decode_sound(path):
+	start = time.perf_counter()
+	bundle = get_bundle()
+	sound = bundle.load_sound(path) if bundle and bundle.has_sound(path) else None
+	if sound is None:
+		sound = pygame.mixer.Sound(path)
+	return sound, time.perf_counter() - start
+
+def expand_entry(entry):
+	"""Turn a manifest entry into (folders, image paths, sound paths)"""
+	entry = normalize_path(entry)
+	if entry.endswith('/*'):
+		root = entry[:-2]
+		folders = []
+		for _, sub_folders, __ in walk(root):
+			folders = [f'{root}/{name}' for name in sub_folders]
+			break
+		return folders, [], []
+	if os.path.isdir(entry):
+		return [entry], [], []
+	if entry.lower().endswith('.png'):
+		return [], [entry], []
+	return [], [], [entry]
+
+class AssetPreloader:
+	def __init__(self, manifest = ASSET_MANIFEST, workers = None):
+		self.manifest = manifest
+		self.workers = workers or min(8, (os.cpu_count() or 1) + 1)
+		self.executor = None
+		self.jobs = {}  # group -> list of (kind, path, future)
+		self.start_time = 0
+
+	def start(self):
+		"""Queue every manifest entry on the worker threads and return right away"""
+		self.executor = ThreadPoolExecutor(max_workers = self.workers, thread_name_prefix = 'asset')
+		self.start_time = time.perf_counter()
+		for group, entries in self.manifest.items():
+			jobs = self.jobs.setdefault(group, [])
+			for entry in entries:
+				folders, images, sounds = expand_entry(entry)
+				for folder in folders:
+					for _, __, img_files in walk(folder):
+						names = [name for name in img_files if name.lower().endswith('.png')]
+						jobs.append(('folder', folder, names))
+						for name in names:
+							jobs.append(('image', f'{folder}/{name}', self.executor.submit(decode_image, f'{folder}/{name}')))
+						break
+				for path in images:
+					if os.path.exists(path):
+						jobs.append(('image', path, self.executor.submit(decode_image, path)))
+				for path in sounds:
+					if os.path.exists(path):
+						jobs.append(('sound', path, self.executor.submit(decode_sound, path)))
+		return self
+
+	def finish(self):
+		"""Wait for the workers, convert the surfaces on this thread and hand them to support"""
+		if not self.executor:
+			self.start()
+
+		images, folders, sounds = {}, {}, {}
+		for group, jobs in self.jobs.items():
+			decode_time = 0
+			convert_time = 0
+			count = 0
+			for kind, path, job in jobs:
+				if kind == 'folder':
+					folders[path] = [f'{path}/{name}' for name in job]
+					continue
+				try:
+					asset, seconds = job.result()
+				except Exception as e:
+					print(f"⚠️ Preload failed for {path}: {e}")
+					continue
+				decode_time += seconds
+				count += 1
+				if kind == 'image':
+					convert_start = time.perf_counter()
+					images[path] = asset.convert_alpha()
+					convert_time += time.perf_counter() - convert_start
+				else:
+					sounds[path] = asset
+			print(f"⏱️ {group}: {count} assets, {decode_time * 1000:.0f} ms decode, {convert_time * 1000:.0f} ms convert")
+
+		self.executor.shutdown()
+		# a folder is only served from the cache if every image in it decoded
+		folders = {folder: paths for folder, paths in folders.items() if all(path in images for path in paths)}
+		store_preloaded(images, folders, sounds)
+		wall_time = time.perf_counter() - self.start_time
+		print(f"⏱️ Preloaded {len(images)} images and {len(sounds)} sounds in {wall_time * 1000:.0f} ms on {self.workers} threads")
@@ -0,0 +1,217 @@
+import os
+import sys
+import csv
+import json
+import time
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from headless import HeadlessRun, PROJECT_ROOT
+
+# Balance sweeps
+# Plays many headless games (see headless.py), one per parameter set and seed, across
+# a pool of worker processes, and writes what came out of each: the day every cleanse
+# stage was reached, money and crop losses day by day.
+#
+#   python code/batch_sim.py --days 5 --seeds 4 --set spread_interval=30,60 --set surge_chance=0.2,0.5 \
+#       [--workers N] [--json sweep.json] [--csv sweep.csv]
+#
+# Every combination of the --set values is played once per seed. Each game gets a fresh
+# worker process, as the level keeps module-level state (clocks, caches, settings).
+
+def scale_sale_prices(level, scale):
+	import settings
+	for crop, price in settings.SALE_PRICES.items():
+		if isinstance(price, dict):
+			for quality in price:
+				price[quality] = round(price[quality] * scale)
+		else:
+			settings.SALE_PRICES[crop] = round(price * scale)
+
+def scale_grow_times(level, scale):
+	import settings
+	for crop in settings.GROW_TIMES:
+		settings.GROW_TIMES[crop] *= scale
+
+# what --set name=value changes, applied once the level is built
+PARAMETERS = {
+	'spread_interval': lambda level, value: setattr(level.corruption_spread, 'spread_interval', value),
+	'tiles_per_spread': lambda level, value: setattr(level.corruption_spread, 'tiles_per_spread', int(value)),
+	'surge_chance': lambda level, value: setattr(level.corruption_surge, 'surge_chance', value),
+	'surge_destruction': lambda level, value: setattr(level.corruption_surge, 'destruction_percentage', value),
+	'grow_time_scale': scale_grow_times,
+	'sale_price_scale': scale_sale_prices,
+}
+
+def set_setting(path, value):
+	"""SALE_PRICES.corn.gold=60 style names: a settings constant, or a value inside one"""
+	import settings
+	name, *keys = path.split('.')
+	if not keys:
+		# every module has its own copy from `from settings import *`
+		for module in list(sys.modules.values()):
+			if module is not settings and getattr(module, name, None) is getattr(settings, name):
+				setattr(module, name, value)
+		setattr(settings, name, value)
+		return
+	target = getattr(settings, name)
+	for key in keys[:-1]:
+		target = target[key]
+	target[keys[-1]] = value
+
+def is_parameter(name):
+	return name in PARAMETERS or name.split('.')[0].isupper()
+
+def apply_parameter(level, name, value):
+	if name in PARAMETERS:
+		PARAMETERS[name](level, value)
+	else:
+		set_setting(name, value)
+
+def simulate(job):
+	"""Play one game in this worker process and return its outcome"""
+	with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+		run = HeadlessRun(job['seed'])
+		for name, value in job['params'].items():
+			apply_parameter(run.level, name, value)
+		seconds = run.run(job['days'])
+	report = run.report(seconds)
+	return {
+		'params': job['params'],
+		'seed': job['seed'],
+		'days_to_cleanse': report['stage_days'].get('cleansed'),
+		'stage_days': report['stage_days'],
+		'stage': report['stage'],
+		'money': report['money'],
+		'harvests': report['harvests'],
+		'crops_lost': report['crops_lost'],
+		'corrupted_tiles': report['corrupted_tiles'],
+		'deaths': report['deaths'],
+		'seconds': report['seconds'],
+		'history': run.history,
+	}
+
+def parse_value(text):
+	try:
+		return json.loads(text)
+	except ValueError:
+		return text
+
+def make_jobs(sweep, seeds, days):
+	names = list(sweep)
+	jobs = []
+	for values in itertools.product(*(sweep[name] for name in names)):
+		for seed in range(seeds):
+			jobs.append({'params': dict(zip(names, values)), 'seed': seed, 'days': days})
+	return jobs
+
+def run_batch(jobs, workers = None):
+	"""Play every job across a process pool, results in job order"""
+	# spawn, as every game needs a clean interpreter (a forked one would inherit this one's state)
+	context = multiprocessing.get_context('spawn')
+	results = [None] * len(jobs)
+	start = time.perf_counter()
+	with ProcessPoolExecutor(max_workers = workers, mp_context = context, max_tasks_per_child = 1) as pool:
+		futures = {pool.submit(simulate, job): i for i, job in enumerate(jobs)}
+		for done, future in enumerate(as_completed(futures), 1):
+			i = futures[future]
+			results[i] = result = future.result()
+			cleansed = f"cleansed on day {result['days_to_cleanse']}" if result['days_to_cleanse'] else f"stage {result['stage']}"
+			print(f"✓ {done}/{len(jobs)} {format_params(result['params'])} seed {result['seed']}: "
+				f"{cleansed}, ${result['money']}, {result['crops_lost']} crops lost ({result['seconds']} s)")
+	print(f"⏱️ {len(jobs)} games in {time.perf_counter() - start:.1f} s")
+	return results
+
+def format_params(params):
+	return ' '.join(f"{name}={value}" for name, value in params.items()) or 'defaults'
+
+def summarize(results):
+	"""Mean outcome per parameter set"""
+	groups = {}
+	for result in results:
+		groups.setdefault(json.dumps(result['params'], sort_keys = True), []).append(result)
+
+	summary = []
+	for group in groups.values():
+		cleansed = [result['days_to_cleanse'] for result in group if result['days_to_cleanse']]
+		summary.append({
+			'params': group[0]['params'],
+			'games': len(group),
+			'cleansed': len(cleansed),
+			'mean_days_to_cleanse': round(sum(cleansed) / len(cleansed), 2) if cleansed else None,
+			'mean_money': round(sum(result['money'] for result in group) / len(group)),
+			'mean_crops_lost': round(sum(result['crops_lost'] for result in group) / len(group), 1),
+			'mean_corrupted_tiles': round(sum(result['corrupted_tiles'] for result in group) / len(group), 1),
+		})
+	return summary
+
+def write_csv(path, results):
+	"""One row per game: its parameters, outcome and money at the end of each day"""
+	names = sorted({name for result in results for name in result['params']})
+	days = max((len(result['history']) for result in results), default = 0)
+	fields = ['days_to_cleanse', 'stage', 'money', 'harvests', 'crops_lost', 'corrupted_tiles', 'deaths']
+	with open(path, 'w', newline = '') as file:
+		writer = csv.writer(file)
+		writer.writerow(names + ['seed'] + fields + [f"money_day_{day + 1}" for day in range(days)])
+		for result in results:
+			money = [entry['money'] for entry in result['history']]
+			writer.writerow([result['params'].get(name) for name in names] + [result['seed']] +
+				[result[field] for field in fields] + money + [''] * (days - len(money)))
+
+def main(argv):
+	days = 3
+	seeds = 2
+	workers = None
+	sweep = {}
+	json_path = None
+	csv_path = None
+	args = list(argv)
+	try:
+		while args:
+			arg = args.pop(0)
+			if arg == '--days':
+				days = int(args.pop(0))
+			elif arg == '--seeds':
+				seeds = int(args.pop(0))
+			elif arg == '--workers':
+				workers = int(args.pop(0))
+			elif arg == '--set':
+				name, values = args.pop(0).split('=', 1)
+				if not is_parameter(name):
+					raise ValueError(name)
+				sweep[name] = [parse_value(value) for value in values.split(',')]
+			elif arg == '--json':
+				json_path = os.path.abspath(args.pop(0))
+			elif arg == '--csv':
+				csv_path = os.path.abspath(args.pop(0))
+			else:
+				raise ValueError(arg)
+	except (ValueError, IndexError):
+		print('usage: python code/batch_sim.py [--days N] [--seeds N] [--set name=v1,v2 ...] [--workers N] [--json file] [--csv file]')
+		print(f"parameters: {', '.join(PARAMETERS)} or SETTINGS.key paths (e.g. SALE_PRICES.corn.gold)")
+		return 2
+
+	# run from the project root like main.py does (the workers start there too)
+	os.chdir(PROJECT_ROOT)
+	jobs = make_jobs(sweep, seeds, days)
+	print(f"🎲 {len(jobs)} games of {days} days on {workers or os.cpu_count()} workers")
+	results = run_batch(jobs, workers)
+	summary = summarize(results)
+
+	for entry in summary:
+		days_text = entry['mean_days_to_cleanse'] if entry['cleansed'] else '-'
+		print(f"📊 {format_params(entry['params'])}: cleansed {entry['cleansed']}/{entry['games']} (mean day {days_text}), "
+			f"money ${entry['mean_money']}, crops lost {entry['mean_crops_lost']}, corrupted tiles {entry['mean_corrupted_tiles']}")
+
+	if json_path:
+		with open(json_path, 'w') as file:
+			json.dump({'days': days, 'seeds': seeds, 'summary': summary, 'games': results}, file, indent = 2)
+		print(f"💾 Wrote {json_path}")
+	if csv_path:
+		write_csv(csv_path, results)
+		print(f"💾 Wrote {csv_path}")
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
@@ -1,7 +1,89 @@
 import pygame
 from settings import *
 from random import randint, choice
-from sprites import Generic
+from support import import_image_size
+from hud import Meter
+from text_cache import get_font, render_text
+from radial_overlay import faded
+from display_updates import display_updates
+from timer import sim_clock
+from jobs import jobs, PRIORITY_LOW
+
+CORRUPTION_CHUNK_TILES = 8  # overlay chunks are 8x8 tiles (512px)
+
+class CorruptionOverlay:
+    """Corrupted tiles painted into a few large chunk surfaces"""
+    def __init__(self, tile_surf):
+        self.tile_surf = tile_surf
+        self.chunk_size = CORRUPTION_CHUNK_TILES * TILE_SIZE
+        self.chunks = {}  # (chunk x, chunk y) -> [surface, tile count]
+        self.scaled_chunks = {}  # (chunk key, scale) -> chunk scaled for the camera
+        self.alpha = 255
+
+    def tile_slot(self, grid_x, grid_y):
+        chunk_key = (grid_x // CORRUPTION_CHUNK_TILES, grid_y // CORRUPTION_CHUNK_TILES)
+        local_pos = ((grid_x % CORRUPTION_CHUNK_TILES) * TILE_SIZE, (grid_y % CORRUPTION_CHUNK_TILES) * TILE_SIZE)
+        return chunk_key, local_pos
+
+    def add_tile(self, grid_x, grid_y):
+        chunk_key, local_pos = self.tile_slot(grid_x, grid_y)
+        if chunk_key not in self.chunks:
+            self.chunks[chunk_key] = [pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA), 0]
+        chunk = self.chunks[chunk_key]
+        # adding onto transparent pixels copies the tile exactly (a normal blit would darken it)
+        chunk[0].blit(self.tile_surf, local_pos, special_flags = pygame.BLEND_RGBA_ADD)
+        chunk[1] += 1
+        self.forget_scaled(chunk_key)
+
+    def remove_tile(self, grid_x, grid_y):
+        chunk_key, local_pos = self.tile_slot(grid_x, grid_y)
+        chunk = self.chunks.get(chunk_key)
+        if not chunk:
+            return
+        chunk[0].fill((0, 0, 0, 0), (local_pos, (TILE_SIZE, TILE_SIZE)))
+        chunk[1] -= 1
+        self.forget_scaled(chunk_key)
+        if chunk[1] <= 0:
+            del self.chunks[chunk_key]
+
+    def clear(self):
+        self.chunks = {}
+        self.scaled_chunks = {}
+
+    def get_scaled_chunk(self, chunk_key, scale):
+        """Chunk surface at the camera's scale, rescaled only after its tiles change"""
+        chunk = self.chunks[chunk_key][0]
+        if scale == 1:
+            return chunk
+        key = (chunk_key, scale)
+        if key not in self.scaled_chunks:
+            size = round(self.chunk_size * scale)
+            self.scaled_chunks[key] = pygame.transform.smoothscale(chunk, (size, size))
+        return self.scaled_chunks[key]
+
+    def forget_scaled(self, chunk_key):
+        for key in [key for key in self.scaled_chunks if key[0] == chunk_key]:
+            del self.scaled_chunks[key]
+
+    def draw(self, surface, camera):
+        """Blit the chunks that overlap the screen, pulsing them with one alpha value"""
+        if not self.chunks:
+            return
+        view = camera.view
+        first_x = view.left // self.chunk_size
+        first_y = view.top // self.chunk_size
+        last_x = view.right // self.chunk_size
+        last_y = view.bottom // self.chunk_size
+
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk:
+                    # offset the same way CameraGroup offsets sprites so tiles line up with the ground
+                    rect = chunk[0].get_rect(topleft = (chunk_x * self.chunk_size, chunk_y * self.chunk_size))
+                    image = self.get_scaled_chunk((chunk_x, chunk_y), camera.scale)
+                    image.set_alpha(self.alpha)
+                    camera.blit_scaled(surface, image, rect)
 
 class CorruptionSpread:
     def __init__(self, all_sprites, collision_sprites):
@@ -11,12 +93,16 @@ class CorruptionSpread:
         
         # Corrupted tiles tracking
         self.corrupted_tiles = []  # List of (x, y) grid positions
-        self.corrupted_sprites = pygame.sprite.Group()
+        self.corruption_map = set()  # Same positions, for O(1) lookups
+        self.tile_listeners = []  # called with (grid x, grid y) when a tile is corrupted or cleansed
         
         # Spread settings
         self.spread_interval = 60  # Spread every 1 minute
         self.spread_timer = 0
         self.tiles_per_spread = 10  # Spread to 10 tiles each time
+        self.spread_job = None  # the spread and crop scan run as a job, a few tiles per frame
+        self.plants_per_slice = 50  # plants the crop scan checks between yields
+        self.crops_destroyed = 0  # crops lost to spreading corruption this game
         
         # Punishment for sleeping during day
         self.day_sleep_punishment = 10  # Extra tiles when sleeping during day
@@ -28,7 +114,7 @@ class CorruptionSpread:
 
         # Notification settings
         self.show_spread_notification = False
-        self.notification_timer = 0
+        self.notification_call = None
         self.notification_duration = 3.0  # Show for 3 seconds
         self.last_spread_count = 0
         self.notifications_enabled = True
@@ -65,21 +151,22 @@ class CorruptionSpread:
                     
         # Map bounds (get from ground image)
         try:
-            ground = pygame.image.load('graphics/world/ground.png')
-            self.map_width = ground.get_width() // TILE_SIZE
-            self.map_height = ground.get_height() // TILE_SIZE
+            ground_w, ground_h = import_image_size('graphics/world/ground.png')
+            self.map_width = ground_w // TILE_SIZE
+            self.map_height = ground_h // TILE_SIZE
         except:
             self.map_width = 100
             self.map_height = 100
+
+        # Corruption is drawn as one overlay split into chunks, not a sprite per tile
+        self.overlay = CorruptionOverlay(self.corruption_surf)
+        self.all_sprites.add_draw_hook(LAYERS['main'] + 0.7, self.overlay.draw)  # Draw ABOVE everything including player
     
     def update_corruption_visuals(self):
         """Make corruption tiles pulse for visibility"""
         import math
         pulse = abs(math.sin(pygame.time.get_ticks() / 1000.0))
-        
-        for sprite in self.corrupted_sprites.sprites():
-            # Make the sprite pulse by adjusting alpha
-            sprite.image.set_alpha(int(180 + 75 * pulse))
+        self.overlay.alpha = int(180 + 75 * pulse)
     
     def tint_surface(self, surface, color):
         """Tint a surface with a color"""
@@ -87,6 +174,10 @@ class CorruptionSpread:
         tinted.fill(color + (0,), special_flags=pygame.BLEND_RGBA_MULT)
         return tinted
     
+    def notify_tile(self, grid_x, grid_y):
+        for listener in self.tile_listeners:
+            listener(grid_x, grid_y)
+
     def is_valid_tile(self, grid_x, grid_y):
         """Check if tile position is valid"""
         if grid_x < 0 or grid_y < 0:
@@ -105,28 +196,19 @@ class CorruptionSpread:
             return
         
         # Don't add if already corrupted
-        if (grid_x, grid_y) in self.corrupted_tiles:
+        if (grid_x, grid_y) in self.corruption_map:
             return
         
         # Add to tracking
         self.corrupted_tiles.append((grid_x, grid_y))
+        self.corruption_map.add((grid_x, grid_y))
         
-        # Create visual sprite
-        pos = (grid_x * TILE_SIZE, grid_y * TILE_SIZE)
-        
-        try:
-            corruption_sprite = Generic(
-            pos=pos,
-            surf=self.corruption_surf,
-            groups=[self.all_sprites, self.corrupted_sprites],
-            z=LAYERS['main'] + 0.7  # Draw ABOVE everything including player
-        )
-        except Exception as e:
-            self.corrupted_tiles.remove((grid_x, grid_y))
-            return
+        # Paint the tile into the overlay
+        self.overlay.add_tile(grid_x, grid_y)
+        self.notify_tile(grid_x, grid_y)
     
-    def spread_corruption(self, num_tiles=None, ward_system=None):
-        """Spread corruption to random tiles"""
+    def spread_steps(self, num_tiles=None, ward_system=None):
+        """Spread corruption to random tiles, as a job that yields after each tile"""
         
         if num_tiles is None:
             num_tiles = self.tiles_per_spread
@@ -137,6 +219,7 @@ class CorruptionSpread:
                 grid_x = randint(0, self.map_width - 1)
                 grid_y = randint(0, self.map_height - 1)
                 self.add_corrupted_tile(grid_x, grid_y, ward_system)
+                yield
             return
 
         # Spread from existing corruption
@@ -165,7 +248,7 @@ class CorruptionSpread:
                 new_x = source_x + dx
                 new_y = source_y + dy
 
-                if self.is_valid_tile(new_x, new_y) and (new_x, new_y) not in self.corrupted_tiles:
+                if self.is_valid_tile(new_x, new_y) and (new_x, new_y) not in self.corruption_map:
                     self.add_corrupted_tile(new_x, new_y, ward_system)
                     found = True
                     break
@@ -179,43 +262,43 @@ class CorruptionSpread:
                     new_x = randint(0, self.map_width - 1)
                     new_y = randint(0, self.map_height - 1)
 
-                    if (new_x, new_y) not in self.corrupted_tiles:
+                    if (new_x, new_y) not in self.corruption_map:
                         self.add_corrupted_tile(new_x, new_y, ward_system)
                         break
 
                     attempts += 1
 
-       
+            yield
             
         return True
     
     def remove_corrupted_tile(self, grid_x, grid_y):
         """Remove a corrupted tile"""
-        if (grid_x, grid_y) in self.corrupted_tiles:
+        if (grid_x, grid_y) in self.corruption_map:
             self.corrupted_tiles.remove((grid_x, grid_y))
+            self.corruption_map.discard((grid_x, grid_y))
             
-            # Remove sprite
-            for sprite in self.corrupted_sprites.sprites():
-                if hasattr(sprite, 'rect'):
-                    sprite_grid_x = sprite.rect.x // TILE_SIZE
-                    sprite_grid_y = sprite.rect.y // TILE_SIZE
-                    if sprite_grid_x == grid_x and sprite_grid_y == grid_y:
-                        sprite.kill()
-                        break
+            # Erase it from the overlay
+            self.overlay.remove_tile(grid_x, grid_y)
+            self.notify_tile(grid_x, grid_y)
     
-    def check_and_destroy_crops(self, soil_layer):
-        """Check if any crops are on corrupted tiles and destroy them"""
+    def crop_scan_steps(self, soil_layer):
+        """Check if any crops are on corrupted tiles and destroy them, as a job that
+        yields every plants_per_slice plants"""
         if not soil_layer or not soil_layer.plant_sprites:
             return
         
         # Use a set for faster lookup
-        corrupted_set = set(self.corrupted_tiles)
+        corrupted_set = self.corruption_map
         
         destroyed_count = 0
         plants_to_destroy = []
         
         # First pass - identify plants to destroy
-        for plant in soil_layer.plant_sprites.sprites():
+        for i, plant in enumerate(soil_layer.plant_sprites.sprites(), 1):
+            if i % self.plants_per_slice == 0:
+                yield
+
             # Get plant grid position
             plant_grid_x = plant.rect.centerx // TILE_SIZE
             plant_grid_y = plant.rect.centery // TILE_SIZE
@@ -224,8 +307,10 @@ class CorruptionSpread:
             if (plant_grid_x, plant_grid_y) in corrupted_set:
                 plants_to_destroy.append(plant)
         
-        # Second pass - destroy identified plants
+        # Second pass - destroy identified plants (skipping any harvested since the scan started)
         for plant in plants_to_destroy:
+            if not plant.alive():
+                continue
             plant_grid_x = plant.rect.centerx // TILE_SIZE
             plant_grid_y = plant.rect.centery // TILE_SIZE
             
@@ -234,11 +319,12 @@ class CorruptionSpread:
                 cell = soil_layer.grid[plant_grid_y][plant_grid_x]
                 while 'P' in cell:
                     cell.remove('P')
+                soil_layer.notify_tile(plant_grid_x, plant_grid_y)
             
             # Create particle effect
             try:
                 from sprites import Particle
-                Particle(
+                Particle.spawn(
                     plant.rect.topleft,
                     plant.image,
                     [self.all_sprites],
@@ -251,16 +337,36 @@ class CorruptionSpread:
             # Destroy plant
             plant.kill()
             destroyed_count += 1
+
+        self.crops_destroyed += destroyed_count
     
-    def punish_day_sleep(self):
+    def spread_and_scan_steps(self, soil_layer, ward_system):
+        """The timed spread: new tiles, the notification, then crops on corruption are destroyed"""
+        count_before = len(self.corrupted_tiles)
+        
+        yield from self.spread_steps(ward_system=ward_system)
+        
+        # Calculate how many tiles were added
+        count_after = len(self.corrupted_tiles)
+        self.last_spread_count = count_after - count_before
+        
+        # Show notification
+        if self.last_spread_count > 0:
+            self.show_notification()
+        
+        # Check and destroy crops when corruption spreads
+        if soil_layer:
+            yield from self.crop_scan_steps(soil_layer)
+
+    def punish_day_sleep_steps(self):
         """Spread extra corruption when player sleeps during day"""
-        self.spread_corruption(self.day_sleep_punishment)
+        return self.spread_steps(self.day_sleep_punishment)
     
     def is_player_on_corruption(self, player_rect):
         """Check if player is standing on corrupted tile"""
         player_grid_x = player_rect.centerx // TILE_SIZE
         player_grid_y = player_rect.centery // TILE_SIZE
-        return (player_grid_x, player_grid_y) in self.corrupted_tiles
+        return (player_grid_x, player_grid_y) in self.corruption_map
     
     def damage_player(self, player_health_system):
         """Damage player if on corrupted tile"""
@@ -269,36 +375,15 @@ class CorruptionSpread:
     
     def update(self, dt, soil_layer=None, player=None, player_health=None, ward_system=None):
         """Update corruption spread"""
-        # Update notification timer
         # Add this line at the start
         self.update_corruption_visuals()
-        if self.show_spread_notification:
-            self.notification_timer += dt
-            if self.notification_timer >= self.notification_duration:
-                self.show_spread_notification = False
-        
         # Spread timer
         self.spread_timer += dt
         
         if self.spread_timer >= self.spread_interval:
             self.spread_timer = 0
-            
-            count_before = len(self.corrupted_tiles)
-            
-            self.spread_corruption(ward_system=ward_system)
-            
-            # Calculate how many tiles were added
-            count_after = len(self.corrupted_tiles)
-            self.last_spread_count = count_after - count_before
-            
-            # Show notification
-            if self.last_spread_count > 0:
-                self.show_spread_notification = True
-                self.notification_timer = 0
-            
-            # Check and destroy crops when corruption spreads
-            if soil_layer:
-                self.check_and_destroy_crops(soil_layer)
+            if not (self.spread_job and self.spread_job.waiting()):
+                self.spread_job = jobs.add(self.spread_and_scan_steps(soil_layer, ward_system), PRIORITY_LOW, name='corruption spread')
         
         # Damage timer
         if player and player_health:
@@ -310,13 +395,24 @@ class CorruptionSpread:
             else:
                 self.damage_timer = 0
 
+    def show_notification(self):
+        """Show the spread notification for notification_duration seconds of game time"""
+        self.show_spread_notification = True
+        if self.notification_call:
+            self.notification_call.cancel()
+        self.notification_call = sim_clock.schedule(self.notification_duration * 1000, self.hide_notification)
+
+    def hide_notification(self):
+        self.show_spread_notification = False
+        self.notification_call = None
+
     def draw_spread_notification(self):
         """Draw notification when corruption spreads"""
         if not self.show_spread_notification or not self.notifications_enabled:  # ADD this check
             return
         
         # Calculate fade based on timer
-        fade_progress = self.notification_timer / self.notification_duration
+        fade_progress = 1 - self.notification_call.remaining() / (self.notification_duration * 1000)
         alpha = int(255 * (1 - fade_progress))  # Fade out over time
         
         # Position at top center
@@ -325,13 +421,8 @@ class CorruptionSpread:
         
         # Text
         spread_text = f"🦠 Corruption Spread! +{self.last_spread_count} tiles"
-        try:
-            font = pygame.font.Font('font/LycheeSoda.ttf', 24)
-        except:
-            font = pygame.font.Font(None, 24)
-        
-        text_surf = font.render(spread_text, True, (255, 100, 100))
-        text_surf.set_alpha(alpha)
+        font = get_font(24)
+        text_surf = faded(render_text(font, spread_text, (255, 100, 100)), alpha)
         text_rect = text_surf.get_rect(center=(x, y))
         
         # Background box
@@ -372,16 +463,12 @@ class CorruptionSpread:
             pygame.draw.rect(self.display_surface, (200, 50, 50, alpha), fill_rect, border_radius=4)
         
         # Percentage text
-        try:
-            small_font = pygame.font.Font('font/LycheeSoda.ttf', 16)
-        except:
-            small_font = pygame.font.Font(None, 16)
-        
+        small_font = get_font(16)
         percent_text = f"{int(corruption_percent * 100)}% Corrupted"
-        percent_surf = small_font.render(percent_text, True, (255, 150, 150))
-        percent_surf.set_alpha(alpha)
+        percent_surf = faded(render_text(small_font, percent_text, (255, 150, 150)), alpha)
         percent_rect = percent_surf.get_rect(center=(x, bar_y + bar_height + 12))
         self.display_surface.blit(percent_surf, percent_rect)
+        display_updates.add(bg_rect.unionall([bar_bg, percent_rect]))
     
     def draw(self):
         """Draw corruption UI elements"""
@@ -389,9 +476,14 @@ class CorruptionSpread:
 
     def clear_all_corruption(self):
         """Clear all corrupted tiles (for testing or cleansing)"""
-        self.corrupted_tiles.clear()
-        for sprite in self.corrupted_sprites.sprites():
-            sprite.kill()
+        if self.spread_job:
+            self.spread_job.cancel()
+        cleared = self.corrupted_tiles
+        self.corrupted_tiles = []
+        self.corruption_map.clear()
+        self.overlay.clear()
+        for grid_x, grid_y in cleared:
+            self.notify_tile(grid_x, grid_y)
     
     def get_corruption_count(self):
         """Get number of corrupted tiles"""
@@ -405,7 +497,7 @@ class CorruptionSpread:
 class HealthSystem:
     def __init__(self, on_death=None):
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font('font/LycheeSoda.ttf', 20)
+        self.font = get_font(20)
         
         # Health settings
         self.max_health = 100
@@ -418,11 +510,16 @@ class HealthSystem:
         self.bar_width = 200
         self.bar_height = 24
         self.padding = 20
+
+        # Bar in the bottom-right corner above the energy bar, re-rendered only when the health changes
+        x = SCREEN_WIDTH - self.bar_width - self.padding
+        y = SCREEN_HEIGHT - (self.bar_height * 2) - self.padding - 60
+        self.meter = Meter((x, y), (self.bar_width, self.bar_height), self.font, "Health",
+                           lambda: self.current_health, lambda: self.max_health, self.get_health_color)
         
         # Invulnerability for damage cooldown
         self.invulnerable = False
         self.invuln_duration = 0.5
-        self.invuln_timer = 0
     
     def take_damage(self, amount):
         """Take damage"""
@@ -431,7 +528,7 @@ class HealthSystem:
         
         self.current_health = max(0, self.current_health - amount)
         self.invulnerable = True
-        self.invuln_timer = 0
+        sim_clock.schedule(self.invuln_duration * 1000, self.end_invulnerability)
         
         if self.current_health <= 0:
             print("💀 Player died!")
@@ -450,16 +547,13 @@ class HealthSystem:
         """Check if player is dead"""
         return self.current_health <= 0
     
-    def update(self, dt):
-        """Update invulnerability timer"""
-        if self.invulnerable:
-            self.invuln_timer += dt
-            if self.invuln_timer >= self.invuln_duration:
-                self.invulnerable = False
+    def end_invulnerability(self):
+        self.invulnerable = False
     
-    def get_health_color(self):
+    def get_health_color(self, health_percent=None):
         """Get color based on health level"""
-        health_percent = self.current_health / self.max_health
+        if health_percent is None:
+            health_percent = self.current_health / self.max_health
         
         if health_percent > 0.5:
             # Green
@@ -473,57 +567,10 @@ class HealthSystem:
     
     def draw(self):
         """Draw health bar in bottom-right corner (above energy bar)"""
-        # Position in bottom-right, above energy bar
-        x = SCREEN_WIDTH - self.bar_width - self.padding
-        y = SCREEN_HEIGHT - (self.bar_height * 2) - self.padding - 60
-        
-        # Background bar (darker)
-        bg_rect = pygame.Rect(x - 4, y - 4, self.bar_width + 8, self.bar_height + 8)
-        pygame.draw.rect(self.display_surface, (20, 20, 20), bg_rect, border_radius=6)
-        pygame.draw.rect(self.display_surface, (100, 100, 100), bg_rect, 2, border_radius=6)
-        
-        # Health bar background (empty portion)
-        bar_bg_rect = pygame.Rect(x, y, self.bar_width, self.bar_height)
-        pygame.draw.rect(self.display_surface, (40, 40, 40), bar_bg_rect, border_radius=4)
-        
-        # Health bar fill
-        health_percent = self.current_health / self.max_health
-        fill_width = int(self.bar_width * health_percent)
-        
-        if fill_width > 0:
-            fill_rect = pygame.Rect(x, y, fill_width, self.bar_height)
-            health_color = self.get_health_color()
-            pygame.draw.rect(self.display_surface, health_color, fill_rect, border_radius=4)
-            
-            # Add a highlight effect on top
-            highlight_rect = pygame.Rect(x, y, fill_width, self.bar_height // 3)
-            highlight_color = tuple(min(255, c + 30) for c in health_color)
-            pygame.draw.rect(self.display_surface, highlight_color, highlight_rect, border_radius=4)
-        
-        # Health text (centered in bar)
-        health_text = f"{int(self.current_health)}/{self.max_health}"
-        text_surf = self.font.render(health_text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=(x + self.bar_width // 2, y + self.bar_height // 2))
-        
-        # Text shadow for better readability
-        shadow_surf = self.font.render(health_text, True, (0, 0, 0))
-        shadow_rect = shadow_surf.get_rect(center=(text_rect.centerx + 1, text_rect.centery + 1))
-        self.display_surface.blit(shadow_surf, shadow_rect)
-        self.display_surface.blit(text_surf, text_rect)
-        
-        # Label above bar
-        label_text = "Health"
-        label_surf = self.font.render(label_text, True, (200, 200, 200))
-        label_rect = label_surf.get_rect(midtop=(x + self.bar_width // 2, y - 24))
-        
-        # Label shadow
-        label_shadow = self.font.render(label_text, True, (0, 0, 0))
-        label_shadow_rect = label_shadow.get_rect(midtop=(label_rect.centerx + 1, label_rect.top + 1))
-        self.display_surface.blit(label_shadow, label_shadow_rect)
-        self.display_surface.blit(label_surf, label_rect)
+        self.meter.draw(self.display_surface)
         
         # Warning indicator when health is low
-        if health_percent < 0.2:
+        if self.current_health / self.max_health < 0.2:
             self.draw_low_health_warning()
     
     def draw_low_health_warning(self):
@@ -535,11 +582,11 @@ class HealthSystem:
         
         # Warning text
         warning_text = "Low Health!"
-        warning_surf = self.font.render(warning_text, True, (255, 100, 100))
-        warning_surf.set_alpha(alpha)
+        warning_surf = faded(render_text(self.font, warning_text, (255, 100, 100)), alpha)
         
         x = SCREEN_WIDTH - self.bar_width - self.padding
         y = SCREEN_HEIGHT - (self.bar_height * 2) - self.padding - 110
         
         warning_rect = warning_surf.get_rect(midtop=(x + self.bar_width // 2, y))
-        self.display_surface.blit(warning_surf, warning_rect)
\ No newline at end of file
+        self.display_surface.blit(warning_surf, warning_rect)
+        display_updates.add(warning_rect)
\ No newline at end of file
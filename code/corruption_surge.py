@@ -1,13 +1,18 @@
 import pygame
 from settings import *
 from random import randint, choice
+from post_effects import post_effects
+from display_updates import display_updates
+from text_cache import get_font, render_text
+from timer import sim_clock
+from jobs import jobs, PRIORITY_HIGH
 
 class CorruptionSurge:
     def __init__(self, soil_layer):
         self.display_surface = pygame.display.get_surface()
         self.soil_layer = soil_layer
-        self.font = pygame.font.Font('font/LycheeSoda.ttf', 24)
-        self.title_font = pygame.font.Font('font/LycheeSoda.ttf', 48)
+        self.font = get_font(24)
+        self.title_font = get_font(48)
         # Report UI
         self.destroyed_crops = {}
         self.report_active = False
@@ -21,12 +26,11 @@ class CorruptionSurge:
         # Warning phase
         self.warning_active = False
         self.warning_duration = 10.0  # 10 seconds warning
-        self.warning_timer = 0
+        self.phase_call = None  # ends the warning or the surge
         
         # Surge execution
         self.surge_active = False
         self.surge_duration = 5.0  # 5 seconds of surge effect
-        self.surge_timer = 0
         
         # Visual effects
         self.shake_intensity = 0
@@ -35,6 +39,8 @@ class CorruptionSurge:
         
         # Crop destruction settings
         self.destruction_percentage = 0.3  # Destroy 30% of crops
+        self.crops_destroyed = 0  # crops lost to surges this game
+        self.destroy_job = None  # plants are destroyed a few per frame
         
         # Sound (optional - will work if file exists)
         try:
@@ -73,7 +79,7 @@ class CorruptionSurge:
     def start_warning(self):
         """Start the warning phase"""
         self.warning_active = True
-        self.warning_timer = 0
+        self.phase_call = sim_clock.schedule(self.warning_duration * 1000, self.start_surge)
         if self.warning_sound:
             self.warning_sound.play()
         
@@ -81,14 +87,16 @@ class CorruptionSurge:
         """Start the actual surge"""
         self.warning_active = False
         self.surge_active = True
-        self.surge_timer = 0
+        self.phase_call = sim_clock.schedule(self.surge_duration * 1000, self.end_surge)
         if self.surge_sound:
             self.surge_sound.play()
         self.destroyed_crops = {}
-        self.destroy_crops()
+        # counted when the surge starts, the destruction job may be dropped half way
+        self.surge_happened_today = True
+        self.destroy_job = jobs.add(self.destroy_crops_steps(), PRIORITY_HIGH, name='surge')
     
-    def destroy_crops(self):
-        """Destroy a percentage of player's crops"""
+    def destroy_crops_steps(self):
+        """Destroy a percentage of player's crops, as a job that yields after each plant"""
         if not self.soil_layer or not self.soil_layer.plant_sprites:
             return
         
@@ -105,8 +113,10 @@ class CorruptionSurge:
             plants_to_destroy.append(plant)
             all_plants.remove(plant)
         
-        destroyed_count = 0
         for plant in plants_to_destroy:
+            if not plant.alive():  # harvested since the surge started
+                continue
+
             cell_y = plant.rect.centery // TILE_SIZE
             cell_x = plant.rect.centerx // TILE_SIZE
             
@@ -114,12 +124,13 @@ class CorruptionSurge:
                 cell = self.soil_layer.grid[cell_y][cell_x]
                 while 'P' in cell:
                     cell.remove('P')
+                self.soil_layer.notify_tile(cell_x, cell_y)
             
             from sprites import Particle
-            Particle(
+            Particle.spawn(
                 plant.rect.topleft,
                 plant.image,
-                [sprite for group in plant.groups() for sprite in [group]],
+                [self.soil_layer.all_sprites],
                 LAYERS['main'],
                 duration=300
             )
@@ -131,27 +142,19 @@ class CorruptionSurge:
                 self.destroyed_crops[plant_type] = 0
             self.destroyed_crops[plant_type] += 1
 
-            destroyed_count += 1
-        
-        self.surge_happened_today = True
+            self.crops_destroyed += 1
+            yield
     
     def update(self, dt):
-        """Update surge state"""
+        """Shake and flash while a warning or surge is on (sim_clock moves between the phases)"""
         # Warning phase
         if self.warning_active:
-            self.warning_timer += dt
-            
             # Pulsing effect during warning
             import math
             self.flash_alpha = int(50 + 50 * abs(math.sin(pygame.time.get_ticks() / 200.0)))
-            
-            if self.warning_timer >= self.warning_duration:
-                self.start_surge()
         
         # Surge phase
         elif self.surge_active:
-            self.surge_timer += dt
-            
             # Screen shake effect
             import math
             shake_amount = 8
@@ -160,14 +163,13 @@ class CorruptionSurge:
             
             # Flash effect
             self.flash_alpha = int(100 + 100 * abs(math.sin(pygame.time.get_ticks() / 100.0)))
-            
-            if self.surge_timer >= self.surge_duration:
-                self.end_surge()
     
     def end_surge(self):
         """End the surge"""
         self.surge_active = False
-        self.surge_timer = 0
+        self.phase_call = None
+        if self.destroy_job:
+            jobs.finish(self.destroy_job)  # the report lists every plant lost
         self.shake_offset = pygame.math.Vector2(0, 0)
         self.flash_alpha = 0
         self.report_active = True
@@ -178,9 +180,7 @@ class CorruptionSurge:
             return
         
         # Semi-transparent red overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((150, 0, 0, self.flash_alpha))
-        self.display_surface.blit(overlay, (0, 0))
+        post_effects.blend(self.display_surface, (150, 0, 0), self.flash_alpha)
         
         # Warning box
         box_width = 600
@@ -197,23 +197,24 @@ class CorruptionSurge:
         
         pygame.draw.rect(self.display_surface, (20, 0, 0), box_rect, border_radius=12)
         pygame.draw.rect(self.display_surface, border_color, box_rect, 4, border_radius=12)
+        display_updates.add(box_rect)
         
         # Warning title
         title_text = "⚠ CORRUPTION SURGE ⚠"
-        title_surf = self.title_font.render(title_text, True, (255, 200, 0))
+        title_surf = render_text(self.title_font, title_text, (255, 200, 0))
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, box_y + 50))
         self.display_surface.blit(title_surf, title_rect)
         
         # Warning message
         message_text = "Incoming in..."
-        message_surf = self.font.render(message_text, True, (255, 255, 255))
+        message_surf = render_text(self.font, message_text, (255, 255, 255))
         message_rect = message_surf.get_rect(center=(SCREEN_WIDTH // 2, box_y + 100))
         self.display_surface.blit(message_surf, message_rect)
         
         # Countdown
-        time_left = max(0, self.warning_duration - self.warning_timer)
+        time_left = self.phase_call.remaining() / 1000
         countdown_text = f"{time_left:.1f}s"
-        countdown_surf = self.title_font.render(countdown_text, True, (255, 50, 50))
+        countdown_surf = render_text(self.title_font, countdown_text, (255, 50, 50))
         countdown_rect = countdown_surf.get_rect(center=(SCREEN_WIDTH // 2, box_y + 145))
         self.display_surface.blit(countdown_surf, countdown_rect)
     
@@ -223,17 +224,15 @@ class CorruptionSurge:
             return
         
         # Dark red overlay with high opacity
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((100, 0, 0, self.flash_alpha))
-        self.display_surface.blit(overlay, (0, 0))
+        post_effects.blend(self.display_surface, (100, 0, 0), self.flash_alpha)
         
         # Surge text
         surge_text = "CORRUPTION SURGE!"
-        surge_surf = self.title_font.render(surge_text, True, (255, 0, 0))
+        surge_surf = render_text(self.title_font, surge_text, (255, 0, 0))
         surge_rect = surge_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
         
         # Shadow for text
-        shadow_surf = self.title_font.render(surge_text, True, (0, 0, 0))
+        shadow_surf = render_text(self.title_font, surge_text, (0, 0, 0))
         shadow_rect = shadow_surf.get_rect(center=(surge_rect.centerx + 3, surge_rect.centery + 3))
         self.display_surface.blit(shadow_surf, shadow_rect)
         self.display_surface.blit(surge_surf, surge_rect)
@@ -258,9 +257,7 @@ class CorruptionSurge:
             return
 
         # Dark background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.display_surface.blit(overlay, (0, 0))
+        post_effects.blend(self.display_surface, (0, 0, 0), 180)
 
         # Window box  ✅ MUST COME BEFORE button
         box = pygame.Rect(0, 0, 520, 360)
@@ -281,12 +278,12 @@ class CorruptionSurge:
         pygame.draw.rect(self.display_surface, (120, 0, 0), self.close_button_rect, border_radius=6)
         pygame.draw.rect(self.display_surface, (255, 80, 80), self.close_button_rect, 2, border_radius=6)
 
-        x_text = self.font.render("X", True, (255, 200, 200))
+        x_text = render_text(self.font, "X", (255, 200, 200))
         x_rect = x_text.get_rect(center=self.close_button_rect.center)
         self.display_surface.blit(x_text, x_rect)
 
         # Title
-        title = self.title_font.render("Corruption Surge Report", True, (255, 80, 80))
+        title = render_text(self.title_font, "Corruption Surge Report", (255, 80, 80))
         title_rect = title.get_rect(center=(box.centerx, box.top + 40))
         self.display_surface.blit(title, title_rect)
 
@@ -294,16 +291,16 @@ class CorruptionSurge:
         y = box.top + 90
 
         if not self.destroyed_crops:
-            text = self.font.render("No crops were destroyed.", True, (220, 220, 220))
+            text = render_text(self.font, "No crops were destroyed.", (220, 220, 220))
             self.display_surface.blit(text, (box.left + 40, y))
         else:
             for crop, amount in self.destroyed_crops.items():
                 line = f"- {crop.capitalize()}: {amount}"
-                text = self.font.render(line, True, (255, 220, 220))
+                text = render_text(self.font, line, (255, 220, 220))
                 self.display_surface.blit(text, (box.left + 40, y))
                 y += 35
 
-        hint = self.font.render("Click X to close", True, (180, 180, 180))
+        hint = render_text(self.font, "Click X to close", (180, 180, 180))
         hint_rect = hint.get_rect(center=(box.centerx, box.bottom - 30))
         self.display_surface.blit(hint, hint_rect)
 
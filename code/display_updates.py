@@ -0,0 +1,48 @@
+import pygame
+
+# input that can change more of the screen than the UI element under the mouse
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL)
+
+class DisplayUpdates:
+	"""Collects the screen rects that changed this frame so the main loop only pushes those.
+	Each frame also pushes the previous frame's rects, so anything that moved or stopped
+	being drawn (the cursor, a fading text) gets cleared on the screen too"""
+	def __init__(self):
+		self.rects = []
+		self.last_rects = []
+		self.full = True  # the first frame always goes out whole
+
+		# pixels pushed by the last flush, shown in the perf overlay
+		self.pixels = 0
+
+	def add(self, rect):
+		"""Mark one screen rect as changed"""
+		if rect:
+			self.rects.append(pygame.Rect(rect))
+
+	def add_full(self):
+		"""Mark the whole screen as changed (scrolling, fades, screen changes)"""
+		self.full = True
+
+	def flush(self):
+		"""Push this frame's changes to the window"""
+		screen_rect = pygame.display.get_surface().get_rect()
+		if self.full:
+			pygame.display.update()
+			self.pixels = screen_rect.width * screen_rect.height
+		else:
+			# most rects repeat from frame to frame, drop the ones another rect already covers
+			rects = []
+			for rect in sorted(self.rects + self.last_rects, key = lambda rect: rect.width * rect.height, reverse = True):
+				rect = rect.clip(screen_rect)
+				if rect.width and rect.height and not any(kept.contains(rect) for kept in rects):
+					rects.append(rect)
+			if rects:
+				pygame.display.update(rects)
+			self.pixels = sum(rect.width * rect.height for rect in rects)
+
+		self.last_rects = self.rects
+		self.rects = []
+		self.full = False
+
+display_updates = DisplayUpdates()
@@ -1,8 +1,12 @@
 import pygame
 from settings import *
 from support import import_folder
+from radial_overlay import get_radial_overlay, get_glow_overlay, draw_radial_overlay, faded
 from random import randint, choice
 import math
+from text_cache import get_font, render_text
+from timer import sim_clock
+from jobs import jobs, PRIORITY_NORMAL
 
 class DogNPC(pygame.sprite.Sprite):
     def __init__(self, pos, groups, collision_sprites, corruption_system):
@@ -23,7 +27,7 @@ class DogNPC(pygame.sprite.Sprite):
         self.is_sitting = False
         self.is_sleeping = False
         self.sleep_location = None
-        self.sleep_timer = 0
+        self.wake_call = None  # wakes the dog once it has slept sleep_duration
         self.sleep_decision_cooldown = 0
         self.sleep_decision_interval = 15.0  # Check every 2 minutes if should sleep
         
@@ -84,6 +88,8 @@ class DogNPC(pygame.sprite.Sprite):
         self.current_path = []  # List of (x, y) positions
         self.path_index = 0
         self.pathfinding_cooldown = 0
+        self.path_job = None  # A* runs as a job, the dog keeps its old path until it's done
+        self.path_iterations_per_slice = 10
         
         # Hash maps for A* algorithm (explained in pathfinding method)
         self.open_set = {}      # Hash map: position -> f_score
@@ -344,6 +350,8 @@ class DogNPC(pygame.sprite.Sprite):
         
         Time Complexity: O(b^d) where b=branching factor, d=depth
         Space Complexity: O(b^d) - hash maps store visited nodes
+
+        Runs as a job (see request_path), yielding every path_iterations_per_slice nodes
         """
         
         # Convert positions to grid coordinates
@@ -368,6 +376,8 @@ class DogNPC(pygame.sprite.Sprite):
         
         while self.open_set and iterations < max_iterations:
             iterations += 1
+            if iterations % self.path_iterations_per_slice == 0:
+                yield
             
             # Find node with lowest f_score in open set
             # Hash map lookup: O(1) for each node
@@ -408,6 +418,23 @@ class DogNPC(pygame.sprite.Sprite):
         # No path found
         return []
     
+    def request_path(self, goal_pos):
+        """Start finding a path to goal_pos, it's followed once the job is done"""
+        self.cancel_path()
+        self.path_job = jobs.add(self.find_path_astar(tuple(self.pos), goal_pos), PRIORITY_NORMAL, self.set_path, 'dog path')
+
+    def set_path(self, path):
+        self.current_path = path
+        self.path_index = 0
+
+    def cancel_path(self):
+        if self.path_job:
+            self.path_job.cancel()
+            self.path_job = None
+
+    def finding_path(self):
+        return bool(self.path_job and self.path_job.waiting())
+
     def reconstruct_path(self, current):
         """
         Reconstruct path from came_from hash map
@@ -494,7 +521,7 @@ class DogNPC(pygame.sprite.Sprite):
         - Hash map cache gives O(1) lookup for previously checked tiles
         - Reduces repeated calculations
         """
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = sim_clock.get_ticks() / 1000.0
         tile_key = (grid_x, grid_y)
         
         # Check cache first (O(1) hash map lookup)
@@ -554,7 +581,7 @@ class DogNPC(pygame.sprite.Sprite):
         Mark tile as visited using hash map
         O(1) insertion
         """
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = sim_clock.get_ticks() / 1000.0
         self.visited_tiles[(grid_x, grid_y)] = current_time
     
     def is_tile_recently_visited(self, grid_x, grid_y):
@@ -562,7 +589,7 @@ class DogNPC(pygame.sprite.Sprite):
         Check if tile was recently visited using hash map
         O(1) lookup
         """
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = sim_clock.get_ticks() / 1000.0
         tile_key = (grid_x, grid_y)
         
         if tile_key in self.visited_tiles:
@@ -580,7 +607,7 @@ class DogNPC(pygame.sprite.Sprite):
         Clean up old visited tiles from hash map
         Prevents memory bloat
         """
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = sim_clock.get_ticks() / 1000.0
         
         # Create list of tiles to remove (can't modify dict during iteration)
         to_remove = []
@@ -646,7 +673,7 @@ class DogNPC(pygame.sprite.Sprite):
             distance = self.pos.distance_to(self.sleep_location)
             
             # Check if arrived (either close enough OR path completed)
-            path_completed = (not self.current_path or self.path_index >= len(self.current_path))
+            path_completed = not self.finding_path() and (not self.current_path or self.path_index >= len(self.current_path))
             
             if distance < 50 or path_completed:  # Increased threshold to 50 pixels
                 print("🐕 Arrived at sleep location!")
@@ -654,22 +681,19 @@ class DogNPC(pygame.sprite.Sprite):
             elif path_completed and distance >= 50:
                 # Path ended but not close enough - recalculate path
                 print("🐕 Path ended but not at destination, recalculating...")
-                self.current_path = self.find_path_astar(self.pos, self.sleep_location)
-                self.path_index = 0
+                self.request_path(self.sleep_location)
     def update_sleeping(self, dt, behavior_props):
         self.direction = pygame.math.Vector2(0, 0)
-        self.sleep_timer += dt          
-
         self.ward_pulse_timer += dt
-        if self.sleep_timer >= behavior_props.get('sleep_duration', 60.0):
-            self.wake_up()
 
     def wake_up(self):
+        if self.wake_call:
+            self.wake_call.cancel()
+            self.wake_call = None
 
         self.is_sleeping = False
         self.ward_active = False
         self.current_behavior = 'following'
-        self.sleep_timer = 0
         print("🐕 Dog woke up!")
 
     def update_wandering(self, dt, behavior_props):
@@ -684,8 +708,7 @@ class DogNPC(pygame.sprite.Sprite):
             goal_y = self.spawn_pos.y + randint(-max_dist, max_dist)
             
             # Find path to goal
-            self.current_path = self.find_path_astar(self.pos, (goal_x, goal_y))
-            self.path_index = 0
+            self.request_path((goal_x, goal_y))
     
     def update_following(self, player, dt, behavior_props):
         """Follow player behavior"""
@@ -697,8 +720,7 @@ class DogNPC(pygame.sprite.Sprite):
             # Update path periodically
             if self.behavior_timer >= behavior_props['path_update_interval']:
                 self.behavior_timer = 0
-                self.current_path = self.find_path_astar(self.pos, player_pos)
-                self.path_index = 0
+                self.request_path(player_pos)
         
         # If player is close and idle, circle around
         elif distance < behavior_props['follow_distance'] and player.direction.magnitude() == 0:
@@ -793,6 +815,9 @@ class DogNPC(pygame.sprite.Sprite):
     
     def update(self, dt, player):
         """Main update method"""
+        # where the last step left the dog, for drawing between steps
+        self.prev_pos = self.pos.copy()
+
         # Update cooldowns
         if self.feed_cooldown > 0:
             self.feed_cooldown -= dt
@@ -802,7 +827,7 @@ class DogNPC(pygame.sprite.Sprite):
             self.pathfinding_cooldown -= dt
         
         # Clean old visited tiles periodically
-        if pygame.time.get_ticks() % 5000 < 50:  # Every 5 seconds
+        if sim_clock.get_ticks() % 5000 < 50:  # Every 5 seconds
             self.clean_old_visits()
         
         # Update behavior
@@ -821,14 +846,14 @@ class DogNPC(pygame.sprite.Sprite):
         # Simple animation (bounce)
         self.animate(dt)
     
-    def draw_interaction_prompt(self, camera_offset, player):
+    def draw_interaction_prompt(self, camera, player):
         
         distance = self.pos.distance_to(pygame.math.Vector2(player.rect.center))
 
         if distance > self.interaction_range:
             return
         
-        font = pygame.font.Font('font/LycheeSoda.ttf', 16)
+        font = get_font(16)
 
         # Feeding prompt
         if self.can_feed(player):
@@ -844,7 +869,7 @@ class DogNPC(pygame.sprite.Sprite):
                 else:
                     text = "Press F to Feed"
 
-                self.draw_prompt(text, camera_offset, -20)
+                self.draw_prompt(text, camera, -20)
 
             
 
@@ -854,14 +879,14 @@ class DogNPC(pygame.sprite.Sprite):
             else:
                 text = "Press RETURN to Sit"
             
-            self.draw_prompt(text, camera_offset, -40)
+            self.draw_prompt(text, camera, -40)
             
-    def draw_prompt(self, text, camera_offset, y_offset):
-        font = pygame.font.Font('font/LycheeSoda.ttf', 16)
-        text_surf = font.render(text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(
-            center=(self.rect.centerx - camera_offset.x, self.rect.top + y_offset - camera_offset.y)
-        )
+    def draw_prompt(self, text, camera, y_offset):
+        font = get_font(16)
+        text_surf = render_text(font, text, (255, 255, 255))
+        # the prompt keeps its size at every zoom, only its position follows the dog
+        center = camera.to_screen(self.rect.midtop)
+        text_rect = text_surf.get_rect(center=(center[0], center[1] + y_offset))
         
         bg_rect = text_rect.inflate(10, 4)
         pygame.draw.rect(self.display_surface, (0, 0, 0), bg_rect, border_radius=4)
@@ -914,6 +939,7 @@ class DogNPC(pygame.sprite.Sprite):
             self.is_sitting = True
             self.current_behavior = 'sitting'
             self.direction = pygame.math.Vector2(0, 0)
+            self.cancel_path()
             self.current_path = []
             print("🐕 Dog sat down!")
         
@@ -999,8 +1025,8 @@ class DogNPC(pygame.sprite.Sprite):
         self.sleep_location = sleep_pos
         
         # Path to sleep location
-        self.current_path = self.find_path_astar(self.pos, sleep_pos)
-        self.path_index = 0
+        self.current_path = []
+        self.request_path(sleep_pos)
         self.current_behavior = 'going_to_sleep'
         
         print(f"🐕 Dog is heading to sleep at {sleep_pos}")
@@ -1011,8 +1037,10 @@ class DogNPC(pygame.sprite.Sprite):
         self.is_sleeping = True
         self.current_behavior = 'sleeping'
         self.direction = pygame.math.Vector2(0, 0)
+        self.cancel_path()
         self.current_path = []
-        self.sleep_timer = 0
+        sleep_duration = self.behavior_states['sleeping'].get('sleep_duration', 60.0)
+        self.wake_call = sim_clock.schedule(sleep_duration * 1000, self.wake_up)
         
         # Activate ward powers!
         self.ward_active = True
@@ -1065,7 +1093,7 @@ class DogNPC(pygame.sprite.Sprite):
         # """Check if tile is protected by dog's ward"""
         return (grid_x, grid_y) in self.get_protected_tiles()
     
-    def draw_ward_effect(self, camera_offset):
+    def draw_ward_effect(self, camera):
         
         if not self.ward_active or not self.sleep_location:
             return
@@ -1077,53 +1105,28 @@ class DogNPC(pygame.sprite.Sprite):
         grid_x = int(self.sleep_location.x // TILE_SIZE)
         grid_y = int(self.sleep_location.y // TILE_SIZE)
         
-        # Use actual radius for circular effect
-        for dx in range(-self.ward_radius, self.ward_radius + 1):
-            for dy in range(-self.ward_radius, self.ward_radius + 1):
-                # Calculate distance from center
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                # Only draw if within circular radius
-                if distance <= self.ward_radius:
-                    tile_x = (grid_x + dx) * TILE_SIZE
-                    tile_y = (grid_y + dy) * TILE_SIZE
-                    
-                    # Create pulsing overlay with fade based on distance
-                    overlay = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                    
-                    # Fade alpha based on distance from center
-                    alpha_multiplier = 1 - (distance / self.ward_radius)
-                    alpha = int(pulse * alpha_multiplier * 0.6)  # 0.6 makes it less intense
-                    
-                    overlay.fill((100, 200, 255, alpha))
-                    
-                    screen_pos = (tile_x - camera_offset.x, tile_y - camera_offset.y)
-                    self.display_surface.blit(overlay, screen_pos)
+        # Circular overlay fading with distance, built at full pulse (100) and
+        # scaled down to the current pulse with one alpha change
+        overlay = get_radial_overlay(self.ward_radius, (100, 200, 255), 100 * 0.6, falloff=self.ward_radius)  # 0.6 makes it less intense
+        draw_radial_overlay(self.display_surface, overlay, (grid_x * TILE_SIZE, grid_y * TILE_SIZE), camera.offset, int(255 * pulse / 100), camera.zoom)
         
         # Draw circular glow around dog (center)
-        screen_pos = (
-            int(self.rect.centerx - camera_offset.x),
-            int(self.rect.centery - camera_offset.y)
-        )
+        screen_pos = camera.to_screen(self.rect.center)
         
         # Draw multiple circles for smoother glow effect
-        glow_radius = int(self.ward_radius * TILE_SIZE * 0.8)  # 80% of ward radius
-        
-        # Outer glow (transparent)
-        for i in range(3):
-            radius = glow_radius - (i * 15)
-            alpha = int((pulse / 3) - (i * 20))
-            if alpha > 0 and radius > 0:
-                # Create surface for each glow layer
-                glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (100, 200, 255, alpha), (radius, radius), radius)
-                
-                # Blit centered on dog
-                glow_rect = glow_surf.get_rect(center=screen_pos)
-                self.display_surface.blit(glow_surf, glow_rect)
+        glow_radius = int(self.ward_radius * TILE_SIZE * 0.8 * camera.zoom)  # 80% of ward radius
+        
+        # Outer glow (transparent), three rings composited once at full pulse
+        if glow_radius > 0:
+            glow_surf = get_glow_overlay(glow_radius, (100, 200, 255), [int(100 / 3 - i * 20) for i in range(3)], 15)
+            glow_surf = faded(glow_surf, int(255 * pulse / 100))
+            
+            # Blit centered on dog
+            glow_rect = glow_surf.get_rect(center=screen_pos)
+            self.display_surface.blit(glow_surf, glow_rect)
         
         # Inner bright circle
-        inner_radius = int(30 + pulse / 4)
+        inner_radius = int((30 + pulse / 4) * camera.zoom)
         pygame.draw.circle(
             self.display_surface,
             (150, 220, 255),
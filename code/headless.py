@@ -0,0 +1,341 @@
+import os
+import sys
+import json
+import time
+import random
+
+# no window, sound card or drawing: SDL's dummy drivers stand in for them
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from contextlib import redirect_stdout
+from settings import *
+
+# Headless fast-forward
+# Runs the Level's simulation (soil, crops, corruption spread and surges, wards,
+# time, the dog) in FIXED_DT steps as fast as the CPU allows, with nothing drawn.
+# The player is driven by a FarmBot or by a script of timed actions instead of
+# the keyboard, so dozens of in-game days can be played for balance and
+# regression checks in seconds.
+#
+#   python code/headless.py [days] [--seed N] [--script actions.json] [--json] [--verbose]
+#
+# A script is a JSON list of actions run when the clock reaches their time:
+#   [{"day": 1, "time": "07:00", "do": "till", "tile": [24, 27]},
+#    {"day": 1, "time": "07:01", "do": "plant", "tile": [24, 27], "seed": "corn"},
+#    {"day": 1, "time": "23:00", "do": "sleep"}]
+# with "do" one of till, water, plant, harvest, ward, sell, buy (seed, amount) or sleep.
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SLEEP_HOUR = 23  # going to bed earlier counts as sleeping during the day
+
+class PlayerActions:
+	"""What a player can do, done through the same Player and system calls the keyboard
+	ends up in, so energy, seeds and wards are spent the same way"""
+	def __init__(self, level):
+		self.level = level
+		self.home = pygame.math.Vector2(level.player.rect.center)
+
+		self.actions = 0
+
+	@property
+	def player(self):
+		return self.level.player
+
+	def tile_center(self, tile):
+		return pygame.math.Vector2((tile[0] + 0.5) * TILE_SIZE, (tile[1] + 0.5) * TILE_SIZE)
+
+	def move_player(self, pos):
+		player = self.player
+		player.pos = pygame.math.Vector2(pos)
+		player.prev_pos = player.pos.copy()
+		player.hitbox.center = (round(player.pos.x), round(player.pos.y))
+		player.rect.center = player.hitbox.center
+
+	def use_tool(self, tool, tile):
+		self.player.selected_tool = tool
+		self.player.target_pos = self.tile_center(tile)
+		self.player.use_tool()
+		self.actions += 1
+
+	def till(self, tile):
+		self.use_tool('hoe', tile)
+
+	def water(self, tile):
+		self.use_tool('water', tile)
+
+	def ward(self, tile):
+		self.use_tool('ward', tile)
+
+	def plant(self, tile, seed):
+		self.player.selected_seed = seed
+		self.player.target_pos = self.tile_center(tile)
+		self.player.use_seed()
+		self.actions += 1
+
+	def harvest(self, tile = None):
+		"""Walk over the ripe plants (those on tile, or all of them) and back home"""
+		for plant in self.level.soil_layer.plant_sprites.sprites():
+			if getattr(plant, 'harvestable', False) and plant.alive():
+				if tile is None or plant.soil.rect.collidepoint(self.tile_center(tile)):
+					self.move_player(plant.rect.center)
+					self.level.plant_collision()
+		self.move_player(self.home)
+		self.actions += 1
+
+	def sell(self):
+		trader = self.level.trader_menu
+		for crop_key in trader.get_sellable_crops():
+			while self.player.crop_inventory.get(crop_key, 0) > 0:
+				trader.sell_crop(crop_key)
+
+	def buy(self, seed, amount = 1):
+		trader = self.level.trader_menu
+		for _ in range(amount):
+			if trader.stock[seed] <= 0 or self.player.money < PURCHASE_PRICES.get(seed, 10):
+				break
+			trader.buy_seed(seed)
+
+	def sleep(self):
+		self.move_player(self.home)
+		self.level.reset()
+
+	def do(self, action):
+		"""Run one script action"""
+		kind = action['do']
+		tile = action.get('tile')
+		if kind in ('till', 'water', 'ward'):
+			getattr(self, kind)(tile)
+		elif kind == 'plant':
+			self.plant(tile, action.get('seed', self.player.selected_seed))
+		elif kind == 'harvest':
+			self.harvest(tile)
+		elif kind == 'sell':
+			self.sell()
+		elif kind == 'buy':
+			self.buy(action['seed'], action.get('amount', 1))
+		elif kind == 'sleep':
+			self.sleep()
+		else:
+			print(f"⚠️ Unknown action: {kind}")
+
+	def on_minute(self, day, hour, minute):
+		"""Called once per in-game minute"""
+		pass
+
+class ScriptedPlayer(PlayerActions):
+	"""Plays back a list of timed actions (see the top of this file)"""
+	def __init__(self, level, actions):
+		super().__init__(level)
+		def when(action):
+			hour, minute = (int(part) for part in action.get('time', '06:00').split(':'))
+			return (action.get('day', 1), hour, minute)
+		self.script = sorted(actions, key = when)
+		self.when = when
+
+	def on_minute(self, day, hour, minute):
+		while self.script and self.when(self.script[0]) <= (day, hour, minute):
+			self.do(self.script.pop(0))
+
+class FarmBot(PlayerActions):
+	"""Simple farmer: keeps a plot of the farmable tiles closest to home tilled, planted
+	and watered, harvests every hour, walls off corruption near the plot with wards,
+	sells the crops and restocks seeds in the evening and sleeps at SLEEP_HOUR"""
+	def __init__(self, level, plot_size = 24, seed_stock = 10):
+		super().__init__(level)
+		self.plot_size = plot_size
+		self.seed_stock = seed_stock
+
+	def plot(self):
+		"""Farmable tiles nearest to home that aren't corrupted"""
+		corrupted = self.level.corruption_spread.corruption_map if self.level.corruption_spread else set()
+		tiles = [(rect.x // TILE_SIZE, rect.y // TILE_SIZE) for rect in self.level.soil_layer.hit_rects]
+		tiles = [tile for tile in tiles if tile not in corrupted]
+		tiles.sort(key = lambda tile: self.tile_center(tile).distance_squared_to(self.home))
+		return tiles[:self.plot_size]
+
+	def pick_seed(self):
+		"""Worth the most cleanse points first, of the seeds still in the bag"""
+		for seed in reversed(self.player.seeds):
+			if self.player.seed_inventory.get(seed, 0) > 0:
+				return seed
+		return None
+
+	def tend(self):
+		grid = self.level.soil_layer.grid
+		for tile in self.plot():
+			cell = grid[tile[1]][tile[0]]
+			if 'X' not in cell:
+				self.till(tile)
+			if 'P' not in cell:
+				seed = self.pick_seed()
+				if seed:
+					self.plant(tile, seed)
+			if 'W' not in cell:
+				self.water(tile)
+
+	def guard(self):
+		"""Ward the corrupted tile closest to the plot"""
+		corruption = self.level.corruption_spread
+		if not corruption or not corruption.corrupted_tiles or self.player.ward_count <= 0:
+			return
+		tile = min(corruption.corrupted_tiles, key = lambda tile: self.tile_center(tile).distance_squared_to(self.home))
+		self.ward(tile)
+
+	def restock(self):
+		self.sell()
+		for seed in reversed(self.player.seeds):
+			if self.player.seed_inventory.get(seed, 0) < self.seed_stock:
+				self.buy(seed, self.seed_stock - self.player.seed_inventory[seed])
+
+	def on_minute(self, day, hour, minute):
+		if minute != 0:
+			return
+		if hour >= SLEEP_HOUR:
+			self.restock()
+			self.sleep()
+		elif hour >= 6:
+			self.harvest()
+			self.guard()
+			self.tend()
+
+class HeadlessRun:
+	"""A Level stepped at FIXED_DT with no drawing, driven by a PlayerActions"""
+	def __init__(self, seed = None, script = None):
+		random.seed(seed)
+		pygame.init()
+		pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+		from level import Level
+		from jobs import jobs
+		jobs.time_sliced = False  # nothing to keep smooth, and runs have to be reproducible
+		self.level = Level()
+		level = self.level
+
+		# no intro or stage cutscenes, and no death screen: dying just restarts the day
+		level.visual_effects = False
+		level.has_shown_intro = True
+		level.stage_cutscene = None
+		self.deaths = 0
+		level.health_system.on_death = self.on_death
+
+		self.driver = ScriptedPlayer(level, script) if script is not None else FarmBot(level)
+		self.steps = 0
+		self.last_minute = None
+
+		# the day each cleanse stage was reached, and the state at the end of every day
+		self.day = level.time_system.day
+		self.stage_days = {level.cleanse_stage: self.day}
+		self.history = []
+
+	def on_death(self):
+		self.deaths += 1
+		self.level.restart_same_day()
+		self.driver.move_player(self.driver.home)
+
+	def step(self):
+		level = self.level
+		level.spawn_dog()
+		level.simulate(FIXED_DT)
+		level.pending_cutscene_stage = None
+		self.steps += 1
+
+		clock = level.time_system
+		minute = (clock.day, clock.hour, clock.minute)
+		if minute != self.last_minute:
+			self.last_minute = minute
+			self.driver.on_minute(*minute)
+
+		self.stage_days.setdefault(level.cleanse_stage, clock.day)
+		if clock.day != self.day:
+			self.history.append(self.snapshot(self.day))
+			self.day = clock.day
+
+	def run(self, days):
+		"""Play until the morning of day 1 + days"""
+		start = time.perf_counter()
+		last_day = self.level.time_system.day + days
+		while self.level.time_system.day < last_day:
+			self.step()
+		return time.perf_counter() - start
+
+	def crops_lost(self):
+		level = self.level
+		spread = level.corruption_spread.crops_destroyed if level.corruption_spread else 0
+		return spread + level.corruption_surge.crops_destroyed
+
+	def snapshot(self, day):
+		level = self.level
+		corruption = level.corruption_spread
+		return {
+			'day': day,
+			'stage': level.cleanse_stage,
+			'cleanse_points': level.cleanse_points,
+			'corrupted_tiles': len(corruption.corrupted_tiles) if corruption else 0,
+			'harvests': level.harvests,
+			'crops_lost': self.crops_lost(),
+			'money': level.player.money,
+		}
+
+	def report(self, seconds):
+		level = self.level
+		player = level.player
+		return {
+			**self.snapshot(level.time_system.day),
+			'wards': len(level.ward_system.ward_sprites),
+			'plants': len(level.soil_layer.plant_sprites),
+			'actions': self.driver.actions,
+			'seeds': dict(player.seed_inventory),
+			'stage_days': self.stage_days,
+			'deaths': self.deaths,
+			'steps': self.steps,
+			'seconds': round(seconds, 2),
+			'steps_per_second': round(self.steps / seconds) if seconds else None,
+		}
+
+def main(argv):
+	days = 7
+	seed = None
+	script = None
+	as_json = False
+	verbose = False
+	args = list(argv)
+	while args:
+		arg = args.pop(0)
+		if arg == '--seed':
+			seed = int(args.pop(0))
+		elif arg == '--script':
+			with open(args.pop(0)) as file:
+				script = json.load(file)
+		elif arg == '--json':
+			as_json = True
+		elif arg == '--verbose':
+			verbose = True
+		elif arg.isdigit():
+			days = int(arg)
+		else:
+			print('usage: python code/headless.py [days] [--seed N] [--script actions.json] [--json] [--verbose]')
+			return 2
+
+	# run from the project root like main.py does (after the paths above are read)
+	os.chdir(PROJECT_ROOT)
+
+	# the systems log every spread and harvest, only keep that with --verbose
+	with open(os.devnull, 'w') as devnull, redirect_stdout(sys.stdout if verbose else devnull):
+		run = HeadlessRun(seed, script)
+		seconds = run.run(days)
+	report = run.report(seconds)
+
+	if as_json:
+		print(json.dumps(report, indent = 2))
+	else:
+		print(f"🌱 {days} days simulated in {report['seconds']} s ({report['steps_per_second']} steps/s)")
+		print(f"📅 Day {report['day']}, stage {report['stage'].upper()}, cleanse {report['cleanse_points']}")
+		print(f"🟣 Corrupted tiles: {report['corrupted_tiles']}, wards: {report['wards']}")
+		print(f"🌽 Harvests: {report['harvests']}, crops lost: {report['crops_lost']}, plants growing: {report['plants']}, money: ${report['money']}")
+		print(f"💀 Deaths: {report['deaths']}")
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,165 @@
+import pygame
+from settings import *
+from ui_widgets import Widget, Label, bound
+from text_cache import get_font, render_text
+
+# The always-on HUD: every box, bar and label keeps its rendered surface and is only
+# redrawn when the values it shows change (at most once per in-game minute for most),
+# so a frame costs one small blit per element.
+
+class Badge(Widget):
+	"""Text in a black rounded box with a coloured border. pos/anchor place the text
+	itself (like the old text rects), the box is the text rect inflated by padding"""
+	def __init__(self, pos, font, text, color, border_color = None, anchor = 'topleft', padding = (10, 6), radius = 4, antialias = False):
+		super().__init__((pos, (0, 0)))
+		self.pos = pos
+		self.font = font
+		self.text = text
+		self.color = color
+		self.border_color = border_color
+		self.anchor = anchor
+		self.padding = padding
+		self.radius = radius
+		self.antialias = antialias
+
+	def get_key(self):
+		color = bound(self.color)
+		return (bound(self.text), color, bound(self.border_color) or color)
+
+	def render(self):
+		text, color, border_color = self.key
+		text_surf = render_text(self.font, text, color, self.antialias)
+		box = text_surf.get_rect().inflate(self.padding)
+		surf = pygame.Surface(box.size, pygame.SRCALPHA)
+		pygame.draw.rect(surf, 'Black', surf.get_rect(), 0, self.radius)
+		pygame.draw.rect(surf, border_color, surf.get_rect(), 2, self.radius)
+		surf.blit(text_surf, (self.padding[0] // 2, self.padding[1] // 2))
+		return surf
+
+	def draw(self, surface, mouse_pos = None):
+		surf = self.get_surf()
+		text_size = (surf.get_width() - self.padding[0], surf.get_height() - self.padding[1])
+		text_rect = pygame.Rect((0, 0), text_size)
+		setattr(text_rect, self.anchor, self.pos)
+		self.rect = text_rect.inflate(self.padding)
+		surface.blit(surf, self.rect)
+
+class Meter(Widget):
+	"""Health/energy style bar with its value written in the middle and a shadowed
+	label above it. color(percent) picks the fill colour"""
+	def __init__(self, topleft, size, font, label, value, maximum, color):
+		super().__init__((topleft[0] - 4, topleft[1] - 4, size[0] + 8, size[1] + 8))
+		self.bar_size = size
+		self.font = font
+		self.value = value
+		self.maximum = maximum
+		self.color = color
+
+		label_pos = (topleft[0] + size[0] // 2, topleft[1] - 24)
+		self.label_shadow = Label((label_pos[0] + 1, label_pos[1] + 1), font, label, (0, 0, 0), 'midtop')
+		self.label = Label(label_pos, font, label, (200, 200, 200), 'midtop')
+
+	def get_key(self):
+		return (bound(self.value), bound(self.maximum))
+
+	def render(self):
+		value, maximum = self.key
+		width, height = self.bar_size
+		surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
+		# Background bar (darker)
+		pygame.draw.rect(surf, (20, 20, 20), surf.get_rect(), border_radius=6)
+		pygame.draw.rect(surf, (100, 100, 100), surf.get_rect(), 2, border_radius=6)
+
+		# Bar background (empty portion)
+		pygame.draw.rect(surf, (40, 40, 40), (4, 4, width, height), border_radius=4)
+
+		# Bar fill with a highlight on top
+		percent = value / maximum
+		fill_width = int(width * percent)
+		if fill_width > 0:
+			fill_color = self.color(percent)
+			pygame.draw.rect(surf, fill_color, (4, 4, fill_width, height), border_radius=4)
+			highlight_color = tuple(min(255, c + 30) for c in fill_color)
+			pygame.draw.rect(surf, highlight_color, (4, 4, fill_width, height // 3), border_radius=4)
+
+		# Value text (centered in bar) with a shadow for readability
+		text = f"{int(value)}/{maximum}"
+		text_surf = render_text(self.font, text, (255, 255, 255))
+		text_rect = text_surf.get_rect(center=(4 + width // 2, 4 + height // 2))
+		surf.blit(render_text(self.font, text, (0, 0, 0)), text_rect.move(1, 1))
+		surf.blit(text_surf, text_rect)
+		return surf
+
+	def draw(self, surface, mouse_pos = None):
+		super().draw(surface)
+		self.label_shadow.draw(surface)
+		self.label.draw(surface)
+
+class ProgressBar(Widget):
+	"""Plain rounded progress bar in a black frame"""
+	def __init__(self, rect, progress, color = 'Green', bg_color = 'Gray'):
+		super().__init__(pygame.Rect(rect).inflate(4, 4))
+		self.progress = progress
+		self.color = color
+		self.bg_color = bg_color
+
+	def get_key(self):
+		return int((self.rect.width - 4) * min(bound(self.progress), 1.0))
+
+	def render(self):
+		fill_width = self.key
+		surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+		pygame.draw.rect(surf, 'Black', surf.get_rect(), 0, 4)
+		pygame.draw.rect(surf, self.bg_color, (2, 2, self.rect.width - 4, self.rect.height - 4), 0, 3)
+		if fill_width > 0:
+			pygame.draw.rect(surf, self.color, (2, 2, fill_width, self.rect.height - 4), 0, 3)
+		return surf
+
+class PaintedWidget(Widget):
+	"""Widget drawn by a callback for layouts that don't fit the others.
+	paint(key) returns the surface and the screen rect it goes to"""
+	def __init__(self, bind, paint):
+		super().__init__((0, 0, 0, 0))
+		self.bind = bind
+		self.paint = paint
+
+	def get_key(self):
+		return self.bind()
+
+	def render(self):
+		surf, self.rect = self.paint(self.key)
+		return surf
+
+class Hud:
+	"""Draws the HUD after the sky tint: quest box, cleanse progress, time, health and energy"""
+	def __init__(self, level):
+		self.level = level
+		self.display_surface = pygame.display.get_surface()
+		self.font = get_font(20)
+
+		# cleanse progress (top right)
+		self.stage_badge = Badge((SCREEN_WIDTH - 10, 10), self.font, lambda: f"Stage: {level.cleanse_stage.upper()}", 'White', anchor='topright')
+		self.cleanse_badge = Badge((SCREEN_WIDTH - 10, 40), self.font, lambda: f"Cleanse: {level.cleanse_points}/{self.points_needed()}", 'White', anchor='topright')
+		self.cleanse_bar = ProgressBar((SCREEN_WIDTH - 10 - 150, 70, 150, 15), lambda: level.cleanse_points / self.points_needed())
+
+	def points_needed(self):
+		return self.level.points_needed.get(self.level.cleanse_stage, 100)
+
+	def draw_cleanse_progress(self):
+		"""Display the current cleanse stage and progress"""
+		self.stage_badge.draw(self.display_surface)
+		# Progress bar (if not at final stage)
+		if self.level.cleanse_stage != 'cleansed':
+			self.cleanse_badge.draw(self.display_surface)
+			self.cleanse_bar.draw(self.display_surface)
+
+	def draw(self):
+		level = self.level
+		if not level.inventory_active:
+			level.quest_manager.draw()
+		self.draw_cleanse_progress()
+		level.minimap.draw()
+		level.time_system.draw()
+		level.health_system.draw()
+		level.energy_system.draw()
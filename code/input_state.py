@@ -0,0 +1,36 @@
+import pygame
+
+class InputState:
+	"""The keyboard and mouse as the level reads them, sampled once per frame. Live play
+	polls pygame, a replay sets what was recorded instead, so everything that reads
+	input through here sees the same thing in both"""
+	def __init__(self):
+		self.replaying = False
+		self.keys = None
+		self.buttons = (False, False, False)
+		self.mouse_pos = (0, 0)
+
+	def poll(self):
+		if not self.replaying:
+			self.keys = pygame.key.get_pressed()
+			self.buttons = pygame.mouse.get_pressed()
+			self.mouse_pos = pygame.mouse.get_pos()
+
+	def get_pressed(self):
+		if self.keys is None:
+			self.poll()
+		return self.keys
+
+	def get_state(self):
+		"""(pressed scancodes, mouse buttons, mouse position), as plain lists for a recording"""
+		keys = self.get_pressed()
+		return [[code for code, pressed in enumerate(keys) if pressed], list(self.buttons), list(self.mouse_pos)]
+
+	def set_state(self, state):
+		scancodes, buttons, mouse_pos = state
+		pressed = set(scancodes)
+		self.keys = pygame.key.ScancodeWrapper(code in pressed for code in range(len(pygame.key.get_pressed())))
+		self.buttons = tuple(buttons)
+		self.mouse_pos = tuple(mouse_pos)
+
+input_state = InputState()
@@ -1,12 +1,18 @@
 import pygame
 from settings import *
+from support import import_image
+from post_effects import post_effects
+from display_updates import display_updates
+from input_state import input_state
+from ui_widgets import Panel, Label, GridSlot, ScrollList
+from text_cache import get_font
 
 class InventoryUI:
     def __init__(self, player):
         self.player = player
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font('font/LycheeSoda.ttf', 24)
-        self.font_small = pygame.font.Font('font/LycheeSoda.ttf', 18)
+        self.font = get_font(24)
+        self.font_small = get_font(18)
         
         # UI settings
         self.bg_color = (20, 20, 20)
@@ -27,6 +33,30 @@ class InventoryUI:
         # Load item icons
         self.item_icons = {}
         self.load_item_icons()
+
+        # Widgets (each caches its surface until the data it shows changes)
+        self.slot_style = {'bg': (40, 40, 40), 'hover_bg': (40, 40, 40), 'border': (120, 120, 120), 'width': 2, 'radius': 0}
+        self.panel = Panel((self.x, self.y, self.width, self.height), (20, 20, 20, 200), self.border_color, 3)
+        self.panel.add(Label((self.x + self.width // 2, self.y + 15), self.font, "Inventory", self.border_color, 'midtop'))
+        self.panel.add(Label((self.x + self.width // 2, self.y + 45), self.font_small, "Press 'Tab' or 'ESC' to close", (200, 200, 200), 'midtop'))
+
+        # (header, items, inventory name, is_seed) in display order
+        self.categories = [
+            ('CROPS', ['corn', 'tomato', 'moon_melon', 'pumpkin', 'cactus'], 'item_inventory', False),
+            ('SEEDS', ['corn', 'tomato', 'moon_melon', 'pumpkin', 'cactus'], 'seed_inventory', True),
+            ('RESOURCES', ['wood', 'apple'], 'item_inventory', False)
+        ]
+        self.headers = [Label((0, 0), self.font, header, (255, 200, 100), 'topleft') for header, _, __, ___ in self.categories]
+        self.grids = [
+            ScrollList((0, 0), (self.slot_size, self.slot_size), self.slot_padding, self.slots_per_row)
+            for _ in self.categories
+        ]
+        self.ward_label = Label((0, 0), self.font, lambda: f"Wards: {self.player.ward_count}", (150, 220, 255), 'topleft')
+        self.money_label = Label(
+            (self.x + self.width - 15, self.y + self.height - 15), self.font,
+            lambda: f"Money: ${self.player.money}", (255, 215, 0), 'bottomright'
+        )
+        self.tooltip = Label((0, 0), self.font_small, '', (255, 255, 255), 'midbottom')
     
     def load_item_icons(self):
         items_to_load = [
@@ -46,7 +76,7 @@ class InventoryUI:
                 else:
                     path = f'graphics/fruit/{item}/3.png'        # fruits = stage 3
                 
-                icon = pygame.image.load(path).convert_alpha()
+                icon = import_image(path)
                 icon = pygame.transform.scale(
                     icon, (self.slot_size - 16, self.slot_size - 16)
                 )
@@ -59,156 +89,54 @@ class InventoryUI:
                 self.item_icons[item] = placeholder
     
     def draw(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.display_surface.blit(overlay, (0, 0))
-        
-        panel_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        post_effects.blend(self.display_surface, (0, 0, 0), 180)
+        mouse_pos = input_state.mouse_pos
+        self.panel.draw(self.display_surface)
+        display_updates.add(self.panel.rect)
 
-        
-        panel_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        panel_surf.fill((20, 20, 20, 200))  
-        self.display_surface.blit(panel_surf, (self.x, self.y))
-        pygame.draw.rect(self.display_surface, self.border_color, panel_rect, 3)
+        current_y = self.y + 80
+        hovered = None
+        for (header, items, inventory_name, is_seed), header_label, grid in zip(self.categories, self.headers, self.grids):
+            header_label.pos = (self.x + 20, current_y)
+            header_label.draw(self.display_surface)
+            current_y += 30
 
+            inventory_dict = getattr(self.player, inventory_name)
+            owned = [item for item in items if item in inventory_dict and inventory_dict[item] > 0]
+            grid.sync(owned, lambda item, rect, inventory_name=inventory_name, is_seed=is_seed: self.create_slot(item, rect, inventory_name, is_seed))
+            grid.move_to((self.x + 20, current_y))
+            grid_y = current_y
+            grid.draw(self.display_surface, mouse_pos)
+            if grid.hovered_key:
+                hovered = (grid.hovered_key, is_seed)
 
-        
-        title_surf = self.font.render("Inventory", True, self.border_color)
-        self.display_surface.blit(
-            title_surf,
-            title_surf.get_rect(centerx=self.x + self.width // 2, y=self.y + 15)
-        )
-        
-        close_surf = self.font_small.render(
-            "Press 'Tab' or 'ESC' to close", True, (200, 200, 200)
-        )
-        self.display_surface.blit(
-            close_surf,
-            close_surf.get_rect(centerx=self.x + self.width // 2, y=self.y + 45)
-        )
-        
-        current_y = self.y + 80
-        
-        # CROPS
-        self.display_surface.blit(
-            self.font.render("CROPS", True, (255, 200, 100)),
-            (self.x + 20, current_y)
-        )
-        current_y += 30
-        
-        crop_items = ['corn', 'tomato', 'moon_melon', 'pumpkin', 'cactus']
-        items_drawn = self.draw_category_items(
-            crop_items, self.player.item_inventory, current_y
-        )
-        current_y += max(1, (items_drawn - 1) // self.slots_per_row + 1) * (
-            self.slot_size + self.slot_padding
-        ) + 20
-        
-        # SEEDS
-        self.display_surface.blit(
-            self.font.render("SEEDS", True, (255, 200, 100)),
-            (self.x + 20, current_y)
-        )
-        current_y += 30
-        
-        seed_items = ['corn', 'tomato', 'moon_melon', 'pumpkin', 'cactus']
-        items_drawn = self.draw_category_items(
-            seed_items, self.player.seed_inventory, current_y, is_seed=True
-        )
-        current_y += max(1, (items_drawn - 1) // self.slots_per_row + 1) * (
-            self.slot_size + self.slot_padding
-        ) + 20
-        
-        # RESOURCES
-        self.display_surface.blit(
-            self.font.render("RESOURCES", True, (255, 200, 100)),
-            (self.x + 20, current_y)
-        )
-        current_y += 30
-        
-        resource_items = ['wood', 'apple']
-        self.draw_category_items(
-            resource_items, self.player.item_inventory, current_y
-        )
+            current_y += max(1, grid.rows) * (self.slot_size + self.slot_padding) + 20
 
         # Draw ward count separately
-        current_y += 80
-        ward_text = f"Wards: {self.player.ward_count}"
-        ward_surf = self.font.render(ward_text, True, (150, 220, 255))
-        self.display_surface.blit(ward_surf, (self.x + 20, current_y))
-        
+        self.ward_label.pos = (self.x + 20, grid_y + 80)
+        self.ward_label.draw(self.display_surface)
+
         if hasattr(self.player, 'money'):
-            money_surf = self.font.render(
-                f"Money: ${self.player.money}", True, (255, 215, 0)
-            )
-            self.display_surface.blit(
-                money_surf,
-                money_surf.get_rect(
-                    bottomright=(self.x + self.width - 15,
-                                 self.y + self.height - 15)
-                )
-            )
-    
-    def draw_category_items(self, items, inventory_dict, start_y, is_seed=False):
-        items_drawn = 0
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for item in items:
-            if item in inventory_dict and inventory_dict[item] > 0:
-                col = items_drawn % self.slots_per_row
-                row = items_drawn // self.slots_per_row
-                
-                slot_x = self.x + 20 + col * (self.slot_size + self.slot_padding)
-                slot_y = start_y + row * (self.slot_size + self.slot_padding)
-                
-                slot_rect = pygame.Rect(
-                    slot_x, slot_y, self.slot_size, self.slot_size
-                )
-                
-                pygame.draw.rect(self.display_surface, (40, 40, 40), slot_rect)
-                pygame.draw.rect(self.display_surface, (120, 120, 120), slot_rect, 2)
-                
-                icon_key = item if not is_seed else f"{item} seed"
-                icon = self.item_icons.get(icon_key, self.item_icons.get(item))
-                if icon:
-                    self.display_surface.blit(
-                        icon, icon.get_rect(center=slot_rect.center)
-                    )
-                
-                qty_surf = self.font_small.render(
-                    str(inventory_dict[item]), True, (255, 255, 255)
-                )
-                qty_rect = qty_surf.get_rect(
-                    bottomright=(slot_rect.right - 4, slot_rect.bottom - 4)
-                )
-                pygame.draw.rect(
-                    self.display_surface, (0, 0, 0),
-                    qty_rect.inflate(6, 4)
-                )
-                self.display_surface.blit(qty_surf, qty_rect)
-                
-                # 🔹 HOVER TOOLTIP ONLY
-                if slot_rect.collidepoint(mouse_pos):
-                    name = item.replace('_', ' ').title()
-                    if is_seed:
-                        name += " Seed"
-                    
-                    tip_surf = self.font_small.render(name, True, (255, 255, 255))
-                    tip_rect = tip_surf.get_rect(
-                        midbottom=(mouse_pos[0], mouse_pos[1] - 10)
-                    )
-                    
-                    pygame.draw.rect(
-                        self.display_surface, (0, 0, 0),
-                        tip_rect.inflate(10, 6)
-                    )
-                    pygame.draw.rect(
-                        self.display_surface, (255, 255, 255),
-                        tip_rect.inflate(10, 6), 1
-                    )
-                    self.display_surface.blit(tip_surf, tip_rect)
-                
-                items_drawn += 1
-        
-        return items_drawn
+            self.money_label.draw(self.display_surface)
+
+        # 🔹 HOVER TOOLTIP ONLY
+        if hovered:
+            self.draw_tooltip(*hovered, mouse_pos)
+
+    def create_slot(self, item, rect, inventory_name, is_seed):
+        icon_key = item if not is_seed else f"{item} seed"
+        icon = self.item_icons.get(icon_key, self.item_icons.get(item))
+        return GridSlot(rect, self.slot_style, lambda: (icon, (), getattr(self.player, inventory_name)[item]), self.font_small)
+
+    def draw_tooltip(self, item, is_seed, mouse_pos):
+        name = item.replace('_', ' ').title()
+        if is_seed:
+            name += " Seed"
+
+        self.tooltip.text = name
+        self.tooltip.pos = (mouse_pos[0], mouse_pos[1] - 10)
+        tip_rect = self.tooltip.get_surf().get_rect(midbottom=self.tooltip.pos)
+        pygame.draw.rect(self.display_surface, (0, 0, 0), tip_rect.inflate(10, 6))
+        pygame.draw.rect(self.display_surface, (255, 255, 255), tip_rect.inflate(10, 6), 1)
+        display_updates.add(tip_rect.inflate(10, 6))
+        self.tooltip.draw(self.display_surface)
@@ -0,0 +1,123 @@
+import time
+from heapq import heappush, heappop
+from itertools import count
+from settings import *
+
+# Jobs
+# Work too big for one frame (a corruption spread and the crop scan after it, a surge
+# wiping out crops, the dog's pathfinding) is written as a generator that yields between
+# small pieces of work. The scheduler resumes the waiting generators once per frame until
+# JOB_FRAME_BUDGET ms are used up, higher priority first and oldest first within a
+# priority, and hands what a generator returns to the job's on_done callback.
+#
+# How far a job gets in a frame depends on how fast the machine is, so replays and
+# headless runs turn time slicing off and every job runs to the end as soon as it's added.
+
+PRIORITY_HIGH = 0  # the player is watching it happen (a surge)
+PRIORITY_NORMAL = 1  # something waits on the result (a path)
+PRIORITY_LOW = 2  # background world changes (spreading corruption)
+
+class Job:
+	"""A generator of work waiting in the scheduler"""
+	__slots__ = ('steps', 'priority', 'on_done', 'name', 'required', 'done', 'cancelled', 'result')
+
+	def __init__(self, steps, priority, on_done, name, required = False):
+		self.steps = steps
+		self.priority = priority
+		self.on_done = on_done
+		self.name = name
+		self.required = required  # finished rather than dropped by clear()
+		self.done = False
+		self.cancelled = False
+		self.result = None
+
+	def cancel(self):
+		if not self.done and not self.cancelled:
+			self.cancelled = True
+			self.steps.close()
+
+	def waiting(self):
+		return not self.done and not self.cancelled
+
+class JobScheduler:
+	def __init__(self, budget = JOB_FRAME_BUDGET):
+		self.budget = budget / 1000
+		self.time_sliced = True
+		self.queue = []  # heap of (priority, order, job)
+		self.order = count()
+
+		# shown in the perf overlay
+		self.slices = 0
+		self.completed = 0
+		self.last_time = 0.0
+		self.longest_slice = 0.0
+
+	def add(self, steps, priority = PRIORITY_NORMAL, on_done = None, name = 'job', required = False):
+		"""Queue a generator, on_done(returned value) runs once it's exhausted. A required
+		job can't be left half done, clear() finishes it instead of dropping it"""
+		job = Job(steps, priority, on_done, name, required)
+		if self.time_sliced:
+			heappush(self.queue, (priority, next(self.order), job))
+		else:
+			self.finish(job)
+		return job
+
+	def step(self, job):
+		"""Run one slice of job, True once it's done"""
+		try:
+			next(job.steps)
+		except StopIteration as stop:
+			job.done = True
+			job.result = stop.value
+			self.completed += 1
+			if job.on_done:
+				job.on_done(job.result)
+			return True
+		return False
+
+	def finish(self, job):
+		"""Run what's left of job right now (when its result is needed this frame)"""
+		while job.waiting():
+			self.step(job)
+		return job.result
+
+	def run(self):
+		"""Resume waiting jobs until the frame budget is used up. The first slice always
+		runs, so every job gets done however slow the frame was"""
+		start = time.perf_counter()
+		deadline = start + self.budget
+		queue = self.queue
+		while queue:
+			key = heappop(queue)
+			job = key[2]
+			if not job.waiting():  # cancelled, or finished early with finish()
+				continue
+
+			slice_start = time.perf_counter()
+			if not self.step(job):
+				heappush(queue, key)
+			now = time.perf_counter()
+			self.slices += 1
+			self.longest_slice = max(self.longest_slice, now - slice_start)
+			if now >= deadline:
+				break
+		self.last_time = time.perf_counter() - start
+
+	def finish_all(self):
+		while self.queue:
+			self.finish(heappop(self.queue)[2])
+
+	def clear(self):
+		"""Drop every waiting job (the world they were working on is being replaced),
+		required ones are finished first"""
+		queue, self.queue = self.queue, []
+		for _, _, job in sorted(queue):
+			if job.required:
+				self.finish(job)
+			else:
+				job.cancel()
+
+	def pending(self):
+		return sum(1 for _, _, job in self.queue if job.waiting())
+
+jobs = JobScheduler()
@@ -4,6 +4,13 @@ from settings import *
 from player import Player
 from overlay import Overlay
 from sprites import Generic, Water, WildFlower, Tree, Interaction, Particle
+from animation import animation_clock
+from timer import sim_clock
+from jobs import jobs, PRIORITY_HIGH
+from radial_overlay import get_radial_overlay, get_glow_overlay, draw_radial_overlay
+from post_effects import post_effects
+from display_updates import display_updates, INPUT_EVENTS
+from input_state import input_state
 from pytmx.util_pygame import load_pygame
 from support import *
 from transition import TransitionStack
@@ -22,11 +29,17 @@ from ward_system import WardSystem
 from stage_cutscene import StageCutscene
 from save_load_menu import SaveLoadMenu
 from dog_npc import DogNPC
+from ui_widgets import Widget
+from hud import Hud
+from minimap import Minimap
+from text_cache import get_font, render_text, text_cache
+from scale_cache import scaled, scale_cache
+from static_chunks import StaticChunks
 
 class Level:
 	def __init__(self):
 		pygame.mouse.set_visible(False)
-		self.cursor_surf = pygame.image.load('graphics/cursor.png').convert_alpha()
+		self.cursor_surf = import_image('graphics/cursor.png')
 		# get the display surface
 		self.display_surface = pygame.display.get_surface()
 
@@ -122,7 +135,11 @@ class Level:
 		self.sky = Sky()
 
 		# ADD THESE LINES - Weather audio
-		self.rain_sound = pygame.mixer.Sound('audio/rain.mp3')
+		# the game ships without a rain track, the storm one stands in for it (quieter)
+		try:
+			self.rain_sound = pygame.mixer.Sound('audio/rain.mp3')
+		except (pygame.error, FileNotFoundError):
+			self.rain_sound = pygame.mixer.Sound('audio/thunderstorm.mp3')
 		self.rain_sound.set_volume(0.3)
 		self.thunderstorm_sound = pygame.mixer.Sound('audio/thunderstorm.mp3')
 		self.thunderstorm_sound.set_volume(0.4)
@@ -145,7 +162,7 @@ class Level:
 		self.pause_active = False
 
 		# music
-		self.success = pygame.mixer.Sound('audio/success.wav')
+		self.success = import_sound('audio/success.wav')
 		self.success.set_volume(0.3)
 
 		# Inventory UI
@@ -155,6 +172,32 @@ class Level:
 		# Time system
 		self.time_system = TimeSystem()
 
+		# HUD (redrawn only when the values it shows change)
+		self.hud = Hud(self)
+
+		# Minimap (M), repainted tile by tile as the soil, corruption and wards change
+		self.minimap = Minimap(self)
+		for system in (self.soil_layer, self.corruption_spread, self.ward_system):
+			if system:
+				self.minimap.watch(system)
+		self.minimap.refresh()
+
+		# World snapshot, reused while a menu or cutscene has the world frozen
+		self.world_snapshot = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+		self.world_snapshot_valid = False
+		self.world_snapshot_frames = 0
+		self.display_modes = None
+
+		# Fixed step simulation: real time not simulated yet, and steps run so far
+		self.sim_accumulator = 0
+		self.sim_steps = 0
+		self.visual_effects = True  # rain particles, off in headless runs where nothing is drawn
+		self.harvests = 0  # crops harvested this game, for headless reports
+
+		# Performance overlay (F3)
+		self.perf_overlay_active = False
+		self.perf_font = get_font(18)
+
 	def quick_save(self):
 		from save_load import SaveLoadSystem
 		save_system = SaveLoadSystem()
@@ -169,6 +212,8 @@ class Level:
 
 	def toggle_save_load_menu(self):
 		self.save_load_active = not self.save_load_active
+		if self.save_load_active:
+			self.save_load_menu.refresh_saves()
 		pygame.mouse.set_visible(self.save_load_active)
 
 
@@ -198,13 +243,9 @@ class Level:
 			pygame.event.clear()
 			self.display_surface.fill((0, 0, 0))
 			
-			try:
-				font = pygame.font.Font('font/LycheeSoda.ttf', 72)
-			except:
-				font = pygame.font.Font(None, 72)
-			
+			font = get_font(72)
 			text = "You Died"
-			text_surf = font.render(text, True, (255, 50, 50))
+			text_surf = render_text(font, text, (255, 50, 50))
 			text_rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 			
 			self.display_surface.blit(text_surf, text_rect)
@@ -225,8 +266,10 @@ class Level:
 
 	def restart_same_day(self):
 		"""Restart current day without advancing time"""
+		jobs.clear()
+
 		# Reset plants
-		self.soil_layer.update_plants()
+		self.soil_layer.update_plants(0)
 		
 		# Restore energy
 		self.energy_system.restore_full()
@@ -248,13 +291,13 @@ class Level:
 						apple.kill()
 				tree.create_fruit()
 		
-		# Reset sky
-		self.sky.start_color = [255, 255, 255]
-		
 		# DON'T advance day - keep same day
 
 	def setup(self):
 		"""Load ALL layers from the current stage map"""
+		# work queued for the world being replaced is dropped
+		jobs.clear()
+
 		# Map file paths for each stage
 		map_files = {
 			'corrupted': 'data/corrupted farm.tmx',
@@ -264,6 +307,10 @@ class Level:
 			'cleansed': 'data/map.tmx'
 		}
 
+		# water frames are shared by every water tile (the clock's animations are per stage too)
+		self.water_frames = import_folder('graphics/water')
+		animation_clock.clear()
+
 		# Try to load the stage-specific map
 		map_path = map_files.get(self.cleanse_stage, 'data/map.tmx')
 		self.current_map_path = map_path
@@ -444,7 +491,7 @@ class Level:
 							except:
 								water_frames = import_folder('graphics/water')
 						else:
-							water_frames = import_folder('graphics/water')
+							water_frames = self.water_frames
 						
 						if water_frames and len(water_frames) > 0:
 							Water(pos, water_frames, rule['groups'])
@@ -730,6 +777,9 @@ class Level:
 				self.soil_layer = SoilLayer(self.all_sprites, self.collision_sprites, self.current_map_path)
 				if self.player:
 					self.player.soil_layer = self.soil_layer
+				self.corruption_surge.soil_layer = self.soil_layer
+				self.minimap.watch(self.soil_layer)
+				self.minimap.refresh()
 
 			# RESTORE plants after setup
 			if self.soil_layer and saved_plants:
@@ -795,9 +845,9 @@ class Level:
 			tmx_data = load_pygame(map_path)
 			
 			# Get map dimensions
-			ground = pygame.image.load('graphics/world/ground.png')
-			h_tiles = ground.get_width() // TILE_SIZE
-			v_tiles = ground.get_height() // TILE_SIZE
+			ground_w, ground_h = import_image_size('graphics/world/ground.png')
+			h_tiles = ground_w // TILE_SIZE
+			v_tiles = ground_h // TILE_SIZE
 			
 			# Initialize empty grid
 			self.grid = [[[] for col in range(h_tiles)] for row in range(v_tiles)]
@@ -830,9 +880,9 @@ class Level:
 			
 		except Exception as e:
 			# Create empty grid as fallback
-			ground = pygame.image.load('graphics/world/ground.png')
-			h_tiles = ground.get_width() // TILE_SIZE
-			v_tiles = ground.get_height() // TILE_SIZE
+			ground_w, ground_h = import_image_size('graphics/world/ground.png')
+			h_tiles = ground_w // TILE_SIZE
+			v_tiles = ground_h // TILE_SIZE
 			self.grid = [[[] for col in range(h_tiles)] for row in range(v_tiles)]
 
 	def play_stage_transition(self):
@@ -862,13 +912,9 @@ class Level:
 			# Draw black screen with text
 			self.display_surface.fill((0, 0, 0))
 			
-			try:
-				font = pygame.font.Font('font/LycheeSoda.ttf', 48)
-			except:
-				font = pygame.font.Font(None, 48)
-			
+			font = get_font(48)
 			text = "Cleansing the Farm..."
-			text_surf = font.render(text, True, (255, 255, 255))
+			text_surf = render_text(font, text, (255, 255, 255))
 			text_rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 			
 			self.display_surface.blit(text_surf, text_rect)
@@ -908,6 +954,12 @@ class Level:
 		pygame.mouse.set_visible(self.pause_active)
 
 	def reset(self):
+		"""Roll over to the next day. It runs as a job, a stage per slice, over the frames of
+		the fade back in (the transition finishes it before the fade ends). It's required, as
+		a stage change or restart during the fade would otherwise leave the day half rolled over"""
+		return jobs.add(self.rollover_steps(), PRIORITY_HIGH, name='day rollover', required=True)
+
+	def rollover_steps(self):
 		# Stop corruption surge sound if playing
 		if hasattr(self, 'corruption_surge_active') and self.corruption_surge_active:
 			self.corruption_surge_sound.stop()
@@ -927,14 +979,16 @@ class Level:
 
 		# Restore health
 		self.health_system.restore_full()
+		yield
 		
 		# Punish day sleep ONLY if sleeping during day (between 6 AM and 11 PM)
 		# Player should sleep at night (after 11 PM or before 6 AM) to avoid penalty
 		if 6 <= self.time_system.hour < 23:
-			self.corruption_spread.punish_day_sleep()
+			yield from self.corruption_spread.punish_day_sleep_steps()
 
 		# soil
 		self.soil_layer.remove_water()
+		yield
 
 		# Stop current weather sound
 		if self.current_weather_sound == 'rain':
@@ -957,7 +1011,9 @@ class Level:
 			self.current_weather_sound = None
 
 		if self.raining or self.thunderstorm:
+			yield
 			self.soil_layer.water_all()
+		yield
 
 		# apples on the trees
 		for tree in self.tree_sprites.sprites():
@@ -966,9 +1022,7 @@ class Level:
 					for apple in tree.apple_sprites.sprites():
 						apple.kill()
 				tree.create_fruit()
-
-		# sky
-		self.sky.start_color = [255,255,255]
+				yield
 
 	def plant_collision(self):
 		"""Handles player harvesting plants with quality"""
@@ -1024,6 +1078,7 @@ class Level:
 
 				# Remove the plant
 				plant.kill()
+				self.harvests += 1
 
 				# Remove 'P' from grid (use soil position, not plant position)
 				cell_x = plant.soil.rect.x // TILE_SIZE
@@ -1033,12 +1088,13 @@ class Level:
 					cell = self.soil_layer.grid[cell_y][cell_x]
 					while 'P' in cell:
 						cell.remove('P')
+					self.soil_layer.notify_tile(cell_x, cell_y)
 
 				# Spawn particle effect (don't add to plant_sprites!)
-				Particle(plant.rect.topleft, plant.image, [self.all_sprites], z=LAYERS['main'])
+				Particle.spawn(plant.rect.topleft, plant.image, [self.all_sprites], z=LAYERS['main'])
 
-	def run(self, dt, events):
-    # Spawn dog once on day 1
+	def spawn_dog(self):
+		"""Spawn the dog once on day 1"""
 		if not self.dog_spawned and self.time_system.day >= 1:
 			spawn_pos = (self.player.rect.centerx + 100, self.player.rect.centery)    
 			self.dog = DogNPC(
@@ -1055,7 +1111,9 @@ class Level:
 			self.dog_spawned = True
 			
 			print("🐕 Dog has appeared!")
-    
+
+	def run(self, dt, events):
+		self.spawn_dog()
 
 		
 
@@ -1101,6 +1159,18 @@ class Level:
 				self.quick_save()
 				continue
 
+			if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+				self.perf_overlay_active = not self.perf_overlay_active
+				continue
+
+			if event.type == pygame.KEYDOWN and event.key == pygame.K_z and not self.world_frozen():
+				self.all_sprites.cycle_zoom()
+				continue
+
+			if event.type == pygame.KEYDOWN and event.key == pygame.K_m and not self.world_frozen():
+				self.minimap.toggle()
+				continue
+
 			if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
 				self.quick_load()
 				continue
@@ -1140,31 +1210,17 @@ class Level:
 
 			filtered_events.append(event)
 
-		# drawing logic
-		self.display_surface.fill('black')
-		self.all_sprites.custom_draw(self.player)
-
-
-		if self.dog:    
-			camera_offset = self.all_sprites.offset    
-			dog_screen_pos = self.dog.rect.move(-camera_offset.x, -camera_offset.y)     
-			self.display_surface.blit(self.dog.image, dog_screen_pos)
-
-
-		if hasattr(self, 'dog') and self.dog:
-			self.dog.draw_ward_effect(self.all_sprites.offset)
-
-
-
-		if self.player.timers['tool use'].active or self.player.timers['seed use'].active:
-			self.draw_grid_selection()
+		# simulation, in fixed steps while no menu or cutscene has the world frozen
+		if not self.world_frozen():
+			self.advance(dt)
 
-		# Draw ward radius overlay when hovering over placed wards
-		self.draw_ward_radius_on_hover()
+		# drawing logic
+		self.draw_world()
 		
 		# Update player's knowledge about camera offset to make spatial mouse control possible
 		if hasattr(self, 'player'):
 			self.player.offset = self.all_sprites.offset
+			self.player.zoom = self.all_sprites.zoom
 		
 		# updates
 		if self.save_load_active:
@@ -1184,34 +1240,6 @@ class Level:
 			self.trader_menu.update(dt)
 			self.trader_menu.handle_input(filtered_events)
 			self.trader_menu.draw()
-		elif self.inventory_active:
-			# Inventory is open - pause game updates
-			pass
-		else:
-			if self.dog:
-				self.dog.update(dt,	self.player)
-			self.all_sprites.update(dt)
-			self.soil_layer.update_plants(dt)
-			self.plant_collision()
-			self.quest_manager.update(dt)
-			self.time_system.update(dt, self.corruption_surge)
-			self.energy_system.update(dt)
-			self.health_system.update(dt)
-			self.corruption_surge.update(dt)
-
-			# Corruption surge audio management
-			if self.corruption_surge.is_active():
-				if not self.corruption_surge_active:
-					# Surge just started - play sound
-					self.corruption_surge_sound.play(loops=-1)  # Loop forever
-					self.corruption_surge_active = True
-			else:
-				if self.corruption_surge_active:
-					# Surge just ended - stop sound
-					self.corruption_surge_sound.stop()
-					self.corruption_surge_active = False
-			if self.corruption_spread:
-				self.corruption_spread.update(dt, self.soil_layer, self.player, self.health_system, self.ward_system)
 
 		# Check for pending cutscene
 		if self.pending_cutscene_stage and not self.stage_cutscene:
@@ -1226,30 +1254,11 @@ class Level:
 		# weather
 		if hasattr(self, 'player'):
 			self.overlay.display(dt, filtered_events)
-		if (self.raining or self.thunderstorm) and not (self.shop_active or self.pause_active or self.inventory_active):
-			self.rain.is_thunderstorm = self.thunderstorm  # ADD THIS
-			for _ in range(17 if self.thunderstorm else 1):  # CHANGE - 16x drops during thunderstorm
-				self.rain.update()
-		self.sky.display(self.time_system, self.corruption_surge, self.thunderstorm)  # ADD thunderstorm parameter
+		self.sky.lighting.set_lights(self.get_light_sources())
+		self.sky.display(self.time_system, self.corruption_surge, self.thunderstorm, self.all_sprites.offset, self.all_sprites.zoom)  # ADD thunderstorm parameter
 
-		# Quest UI
-		if not self.inventory_active:
-			self.quest_manager.draw()
-
-		# Display cleanse progress
-		self.display_cleanse_progress()
-
-		# Display time and day
-		self.time_system.draw()
-
-		# Display health bar
-		self.health_system.draw()
-
-		# Display energy bar
-		self.energy_system.draw()
-
-		# Display energy bar
-		self.energy_system.draw()
+		# HUD: quest, cleanse progress, time, health and energy
+		self.hud.draw()
 
 		self.corruption_surge.draw()
 		self.corruption_surge.draw_report()
@@ -1279,67 +1288,157 @@ class Level:
 
 
 		if self.dog:
-			camera_offset = self.all_sprites.offset  # Your camera offset    
-			self.dog.draw_interaction_prompt(camera_offset, self.player)
+			self.dog.draw_interaction_prompt(self.all_sprites, self.player)
+
+		post_effects.end_frame()
+		if self.perf_overlay_active:
+			self.draw_perf_overlay(dt)
+
+		# over a frozen world only the UI that reported its rects changed, unless a menu
+		# opened, closed or switched, or input (clicks, keys) may have changed anything else
+		modes = (self.save_load_active, self.pause_active, bool(self.stage_cutscene), self.shop_active, self.inventory_active)
+		if modes != self.display_modes or any(event.type in INPUT_EVENTS for event in events):
+			display_updates.add_full()
+		self.display_modes = modes
+
+	def advance(self, dt):
+		"""Run as many FIXED_DT steps as the real time since the last frame adds up to. The
+		remainder carries over, and the camera draws moving sprites that far between steps.
+		Queued jobs get their slice of the frame after the steps"""
+		self.sim_accumulator += min(dt, MAX_FRAME_TIME)
+		while self.sim_accumulator >= FIXED_DT:
+			self.simulate(FIXED_DT)
+			self.sim_accumulator -= FIXED_DT
+			self.sim_steps += 1
+		jobs.run()
+		self.all_sprites.alpha = self.sim_accumulator / FIXED_DT
+
+	def simulate(self, dt):
+		"""One step of everything in the world"""
+		sim_clock.advance(dt)
+		if self.dog:
+			self.dog.update(dt,	self.player)
+		self.all_sprites.update(dt)
+		animation_clock.update(dt)
+		if self.visual_effects:
+			self.rain.is_thunderstorm = self.thunderstorm
+			self.rain.update(dt, self.raining or self.thunderstorm)
+		self.soil_layer.update_plants(dt)
+		self.plant_collision()
+		self.time_system.update(dt, self.corruption_surge)
+		self.corruption_surge.update(dt)
+
+		# Corruption surge audio management
+		if self.corruption_surge.is_active():
+			if not self.corruption_surge_active:
+				# Surge just started - play sound
+				self.corruption_surge_sound.play(loops=-1)  # Loop forever
+				self.corruption_surge_active = True
+		else:
+			if self.corruption_surge_active:
+				# Surge just ended - stop sound
+				self.corruption_surge_sound.stop()
+				self.corruption_surge_active = False
+		if self.corruption_spread:
+			self.corruption_spread.update(dt, self.soil_layer, self.player, self.health_system, self.ward_system)
+
+	def world_frozen(self):
+		"""Menus and cutscenes stop every world update, so the world looks the same each frame"""
+		return bool(self.save_load_active or self.pause_active or self.stage_cutscene or self.shop_active or self.inventory_active)
+
+	def invalidate_world_snapshot(self):
+		"""Redraw the world on the next frame even if it's frozen (e.g. after loading a save)"""
+		self.world_snapshot_valid = False
+
+	def draw_world(self):
+		"""Camera, sprites and the world-space markers. While the world is frozen the first
+		frame is kept in a snapshot and blitted instead of redrawing the whole scene"""
+		if self.world_frozen():
+			if self.world_snapshot_valid:
+				self.display_surface.blit(self.world_snapshot, (0, 0))
+				self.world_snapshot_frames += 1
+				return
+		else:
+			self.world_snapshot_valid = False
+
+		# the world moved (or a new snapshot starts), the whole screen goes out
+		display_updates.add_full()
+		self.display_surface.fill('black')
+		self.all_sprites.custom_draw(self.player)
+
+
+		if self.dog:    
+			self.all_sprites.blit_screen(self.display_surface, self.dog.image, self.all_sprites.draw_rect(self.dog))
+
+
+		if hasattr(self, 'dog') and self.dog:
+			self.dog.draw_ward_effect(self.all_sprites)
+
+
+
+		if self.player.timers['tool use'].active or self.player.timers['seed use'].active:
+			self.draw_grid_selection()
+
+		# Draw ward radius overlay when hovering over placed wards
+		self.draw_ward_radius_on_hover()
+
+		if self.world_frozen():
+			self.world_snapshot.blit(self.display_surface, (0, 0))
+			self.world_snapshot_valid = True
+
+	def get_light_sources(self):
+		"""Night light pools: every ward, the trader and the house (bed)"""
+		lights = [('ward', ward.rect.center) for ward in self.ward_system.ward_sprites]
+		lights += [(sprite.name, sprite.rect.center) for sprite in self.interaction_sprites if sprite.name in LIGHT_SOURCES]
+		return lights
+
+	def get_perf_lines(self, dt):
+		"""Lines shown in the F3 performance overlay"""
+		return [
+			f"frame: {dt * 1000:.1f} ms, {self.sim_steps} sim steps",
+			f"timers: {sim_clock.pending()} pending, {sim_clock.fired} fired",
+			f"jobs: {jobs.pending()} waiting, {jobs.completed} done, {jobs.last_time * 1000:.2f} ms, longest slice {jobs.longest_slice * 1000:.2f} ms",
+			f"sprites: {len(self.all_sprites)}, {len(self.all_sprites.active_sprites)} updated",
+			f"post fx: {post_effects.last_passes} passes, {post_effects.last_time * 1000:.2f} ms",
+			f"display: {display_updates.pixels // 1000}k pixels pushed",
+			f"ui renders: {Widget.renders}",
+			f"world snapshot: {'on' if self.world_snapshot_valid else 'off'}, {self.world_snapshot_frames} frames reused",
+			f"text cache: {text_cache.hits} hits, {text_cache.misses} misses, {len(text_cache.surfaces)} kept",
+			f"scale cache: {scale_cache.hits} hits, {scale_cache.misses} misses, {len(scale_cache.surfaces)} kept",
+			f"minimap: {self.minimap.repaints} tiles repainted",
+			f"static chunks: {self.all_sprites.static_chunks.bakes} bakes, {self.all_sprites.static_chunks.bake_time * 1000:.1f} ms total, {self.all_sprites.static_chunks.pixels / 1e6:.1f} Mpx kept",
+			f"light map: {self.sky.lighting.rebuilds} rebuilds, {self.sky.lighting.rebuild_time * 1000:.1f} ms total",
+		]
+
+	def draw_perf_overlay(self, dt):
+		"""Draw the F3 performance overlay at the top centre of the screen"""
+		# rendered directly: these change every frame and would only churn the text cache
+		lines = [self.perf_font.render(line, False, 'White') for line in self.get_perf_lines(dt)]
+		width = max(line.get_width() for line in lines) + 16
+		height = sum(line.get_height() for line in lines) + 12
+		bg_rect = pygame.Rect(SCREEN_WIDTH // 2 - width // 2, 10, width, height)
+		pygame.draw.rect(self.display_surface, 'Black', bg_rect, 0, 4)
+		display_updates.add(bg_rect)
+
+		y = bg_rect.top + 6
+		for line in lines:
+			self.display_surface.blit(line, (bg_rect.left + 8, y))
+			y += line.get_height()
 
 
 	def display_cleanse_progress(self):
 		"""Display the current cleanse stage and progress"""
-		font = pygame.font.Font('font/LycheeSoda.ttf', 20)
-		
-		# Stage name
-		stage_text = f"Stage: {self.cleanse_stage.upper()}"
-		stage_surf = font.render(stage_text, False, 'White')
-		stage_rect = stage_surf.get_rect(topright=(SCREEN_WIDTH - 10, 10))
-		
-		# Background for stage
-		bg_rect = stage_rect.inflate(10, 6)
-		pygame.draw.rect(self.display_surface, 'Black', bg_rect, 0, 4)
-		pygame.draw.rect(self.display_surface, 'White', bg_rect, 2, 4)
-		self.display_surface.blit(stage_surf, stage_rect)
-		
-		# Progress bar (if not at final stage)
-		if self.cleanse_stage != 'cleansed':
-			points_needed = self.points_needed.get(self.cleanse_stage, 100)
-			progress = min(self.cleanse_points / points_needed, 1.0)
-			
-			# Progress text
-			progress_text = f"Cleanse: {self.cleanse_points}/{points_needed}"
-			progress_surf = font.render(progress_text, False, 'White')
-			progress_rect = progress_surf.get_rect(topright=(SCREEN_WIDTH - 10, 40))
-			
-			# Background
-			bg_rect2 = progress_rect.inflate(10, 6)
-			pygame.draw.rect(self.display_surface, 'Black', bg_rect2, 0, 4)
-			pygame.draw.rect(self.display_surface, 'White', bg_rect2, 2, 4)
-			self.display_surface.blit(progress_surf, progress_rect)
-			
-			# Progress bar
-			bar_width = 150
-			bar_height = 15
-			bar_x = SCREEN_WIDTH - 10 - bar_width
-			bar_y = 70
-			
-			# Background bar
-			pygame.draw.rect(self.display_surface, 'Black', 
-							(bar_x - 2, bar_y - 2, bar_width + 4, bar_height + 4), 0, 4)
-			pygame.draw.rect(self.display_surface, 'Gray', 
-							(bar_x, bar_y, bar_width, bar_height), 0, 3)
-			
-			# Progress fill
-			fill_width = int(bar_width * progress)
-			if fill_width > 0:
-				pygame.draw.rect(self.display_surface, 'Green', 
-								(bar_x, bar_y, fill_width, bar_height), 0, 3)
+		self.hud.draw_cleanse_progress()
 
 	def draw_cursor(self):
 		# Attempt to make mouse feel smooth
-		mouse_pos = pygame.mouse.get_pos()
+		mouse_pos = input_state.mouse_pos
 	
 		offset_x = 5
 		offset_y = 5
 		render_pos = (mouse_pos[0] - offset_x, mouse_pos[1] - offset_y)
 		self.display_surface.blit(self.cursor_surf, render_pos)
+		display_updates.add(self.cursor_surf.get_rect(topleft = render_pos))
 		# only draw custom cursor when OS cursor is hidden (e.g., not paused)
 
 	def draw_grid_selection(self):
@@ -1348,8 +1447,7 @@ class Level:
 		row = int(target_pos.y // TILE_SIZE)
 
 		current_tile_rect = pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-		offset = self.all_sprites.offset
-		pygame.draw.rect(self.display_surface, 'white', current_tile_rect.move(-offset), 3)
+		pygame.draw.rect(self.display_surface, 'white', self.all_sprites.screen_rect(current_tile_rect), 3)
 
 	def draw_ward_preview(self):
 		"""Draw ward placement preview at mouse/target position"""
@@ -1362,38 +1460,28 @@ class Level:
 		protection_radius = 6
 		offset = self.all_sprites.offset
 		
-		for dx in range(-protection_radius, protection_radius + 1):
-			for dy in range(-protection_radius, protection_radius + 1):
-				# Calculate distance for circular effect
-				distance = (dx * dx + dy * dy) ** 0.5
-				if distance <= protection_radius:
-					tile_x = (grid_x + dx) * TILE_SIZE
-					tile_y = (grid_y + dy) * TILE_SIZE
-					
-					# Semi-transparent blue overlay
-					preview_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-					alpha = int(80 * (1 - distance / protection_radius))  # Fade towards edges
-					preview_surf.fill((100, 200, 255, alpha))
-					
-					preview_rect = pygame.Rect(tile_x, tile_y, TILE_SIZE, TILE_SIZE)
-					self.display_surface.blit(preview_surf, preview_rect.move(-offset))
+		# Semi-transparent blue overlay, fading towards edges
+		preview = get_radial_overlay(protection_radius, (100, 200, 255), 80, falloff = protection_radius)
+		draw_radial_overlay(self.display_surface, preview, (grid_x * TILE_SIZE, grid_y * TILE_SIZE), offset)
 		
 		# Draw center ward indicator (brighter)
 		center_x = grid_x * TILE_SIZE
 		center_y = grid_y * TILE_SIZE
-		center_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-		
-		# Draw glowing circle in center
-		pygame.draw.circle(center_surf, (150, 220, 255, 150), (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 3)
-		pygame.draw.circle(center_surf, (200, 240, 255, 200), (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 4)
+		if not hasattr(self, 'ward_center_surf'):
+			self.ward_center_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+			
+			# Draw glowing circle in center
+			pygame.draw.circle(self.ward_center_surf, (150, 220, 255, 150), (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 3)
+			pygame.draw.circle(self.ward_center_surf, (200, 240, 255, 200), (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 4)
+		center_surf = self.ward_center_surf
 		
 		center_rect = pygame.Rect(center_x, center_y, TILE_SIZE, TILE_SIZE)
 		self.display_surface.blit(center_surf, center_rect.move(-offset))
 
 	def draw_ward_radius_on_hover(self):
 		"""Draw ward radius when hovering cursor over placed wards"""
-		mouse_pos = pygame.mouse.get_pos()
-		mouse_world_pos = pygame.math.Vector2(mouse_pos) + self.all_sprites.offset
+		mouse_pos = input_state.mouse_pos
+		mouse_world_pos = self.all_sprites.to_world(mouse_pos)
 		
 		# Check if mouse is hovering over any ward
 		for ward in self.ward_system.ward_sprites.sprites():
@@ -1402,28 +1490,15 @@ class Level:
 				# Draw protection radius for this ward
 				protection_radius = ward.protection_radius
 				offset = self.all_sprites.offset
+				zoom = self.all_sprites.zoom
 				
-				for dx in range(-protection_radius, protection_radius + 1):
-					for dy in range(-protection_radius, protection_radius + 1):
-						# Calculate distance for circular effect
-						distance = (dx * dx + dy * dy) ** 0.5
-						if distance <= protection_radius:
-							tile_x = (ward.grid_x + dx) * TILE_SIZE
-							tile_y = (ward.grid_y + dy) * TILE_SIZE
-							
-							# Semi-transparent blue overlay
-							preview_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-							alpha = int(100 * (1 - distance / (protection_radius + 1)))
-							preview_surf.fill((100, 200, 255, alpha))
-							
-							preview_rect = pygame.Rect(tile_x, tile_y, TILE_SIZE, TILE_SIZE)
-							self.display_surface.blit(preview_surf, preview_rect.move(-offset))
+				# Semi-transparent blue overlay
+				radius_surf = get_radial_overlay(protection_radius, (100, 200, 255), 100, falloff = protection_radius + 1)
+				draw_radial_overlay(self.display_surface, radius_surf, (ward.grid_x * TILE_SIZE, ward.grid_y * TILE_SIZE), offset, zoom = zoom)
 				
 				# Highlight the ward itself
-				highlight_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-				pygame.draw.circle(highlight_surf, (255, 255, 255, 100), (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 2)
-				highlight_rect = ward_rect.move(-offset)
-				self.display_surface.blit(highlight_surf, highlight_rect)
+				highlight_surf = get_glow_overlay(TILE_SIZE // 2, (255, 255, 255), [100], 0)
+				self.all_sprites.blit_screen(self.display_surface, highlight_surf, ward_rect)
 				
 				break  # Only show one ward radius at a time
 
@@ -1432,23 +1507,168 @@ class CameraGroup(pygame.sprite.Group):
 		super().__init__()
 		self.display_surface = pygame.display.get_surface()
 		self.offset = pygame.math.Vector2()
+		self.draw_hooks = {}
 
-	def custom_draw(self, player):
-		self.offset.x = player.rect.centerx - SCREEN_WIDTH / 2
-		self.offset.y = player.rect.centery - SCREEN_HEIGHT / 2
+		# how far the frame is between the last two simulation steps (0 to 1)
+		self.alpha = 1
 
-		# Get all unique Z values from sprites (not just from LAYERS dict)
-		all_z_values = set()
-		for sprite in self.sprites():
-			all_z_values.add(sprite.z)
-		
-		# Draw sprites layer by layer, sorting by Y within each layer
-		for z_value in sorted(all_z_values):
-			# Get all sprites in this Z layer
-			layer_sprites = [sprite for sprite in self.sprites() if sprite.z == z_value]
-			
-			# Sort by Y position within the layer for depth effect
-			for sprite in sorted(layer_sprites, key=lambda s: s.rect.centery):
-				offset_rect = sprite.rect.copy()
-				offset_rect.center -= self.offset
-				self.display_surface.blit(sprite.image, offset_rect)
\ No newline at end of file
+		# zoom levels (Z): the camera sees SCREEN / zoom world pixels around the player
+		self.zoom_index = 0
+		self.zoom = ZOOM_LEVELS[0]
+		self.view = pygame.Rect(0, 0, SCREEN_WIDTH + 1, SCREEN_HEIGHT + 1)
+
+		# the world is drawn into a smaller surface at RENDER_SCALE and scaled up to the screen
+		self.scale = RENDER_SCALE * self.zoom
+		self.origin = (0, 0)
+		if RENDER_SCALE == 1:
+			self.render_surface = self.display_surface
+		else:
+			self.render_surface = pygame.Surface((round(SCREEN_WIDTH * RENDER_SCALE), round(SCREEN_HEIGHT * RENDER_SCALE)))
+
+		# plain Generic sprites never change, they are drawn from baked chunks where they
+		# have a run of layers to themselves. Everything else is drawn sprite by sprite
+		self.static_chunks = StaticChunks()
+		self.static_layers = {}  # z -> plain Generic sprites
+		self.dynamic_sprites = set()
+		self.order = {}  # sprite -> when it was added, breaks y ties the way the group order did
+		self.added = 0
+		self.pending = set()  # added sprites sorted into the above at the next draw or update
+
+		# sprites whose class has its own update(), in the order they were added. The rest
+		# (tiles, soil, decorations) would only run Sprite.update, which does nothing
+		self.active_sprites = {}
+
+	def add_internal(self, sprite, layer = None):
+		# sprites join their groups before they set their image, rect and z
+		super().add_internal(sprite, layer)
+		self.added += 1
+		self.order[sprite] = self.added
+		self.pending.add(sprite)
+
+	def remove_internal(self, sprite):
+		super().remove_internal(sprite)
+		del self.order[sprite]
+		self.active_sprites.pop(sprite, None)
+		if sprite in self.pending:
+			self.pending.discard(sprite)
+		elif type(sprite) is Generic:
+			layer = self.static_layers[sprite.z]
+			layer.discard(sprite)
+			if not layer:
+				del self.static_layers[sprite.z]
+			self.static_chunks.remove(sprite)
+		else:
+			self.dynamic_sprites.discard(sprite)
+
+	def sort_pending(self):
+		for sprite in sorted(self.pending, key = self.order.get):
+			if type(sprite).update is not pygame.sprite.Sprite.update:
+				self.active_sprites[sprite] = None
+			if type(sprite) is Generic:
+				self.static_layers.setdefault(sprite.z, set()).add(sprite)
+				self.static_chunks.add(sprite)
+			else:
+				self.dynamic_sprites.add(sprite)
+		self.pending.clear()
+
+	def update(self, dt):
+		"""Update the sprites that do something in update(), like Group.update for all of them"""
+		self.sort_pending()
+		for sprite in list(self.active_sprites):
+			sprite.update(dt)
+
+	def add_draw_hook(self, z, draw):
+		"""Call draw(surface, camera) after the sprites of layer z (for non-sprite effects)"""
+		self.draw_hooks.setdefault(z, []).append(draw)
+
+	def cycle_zoom(self):
+		self.zoom_index = (self.zoom_index + 1) % len(ZOOM_LEVELS)
+		self.zoom = ZOOM_LEVELS[self.zoom_index]
+		self.scale = RENDER_SCALE * self.zoom
+		print(f"🔍 Zoom {int(self.zoom * 100)}%")
+
+	def to_render(self, pos):
+		"""Render surface position of a world position. Positions are scaled before the
+		camera origin is taken off, so baked chunks and single sprites land on the same pixels"""
+		return (round(pos[0] * self.scale) - self.origin[0], round(pos[1] * self.scale) - self.origin[1])
+
+	def to_screen(self, pos):
+		"""Screen position of a world position (for UI drawn over the world)"""
+		return (round((pos[0] - self.offset.x) * self.zoom), round((pos[1] - self.offset.y) * self.zoom))
+
+	def to_world(self, screen_pos):
+		"""World position under a screen position (e.g. the mouse)"""
+		return pygame.math.Vector2(screen_pos) / self.zoom + self.offset
+
+	def screen_rect(self, rect):
+		"""Screen rect of a world rect"""
+		return pygame.Rect(self.to_screen(rect.topleft), (round(rect.width * self.zoom), round(rect.height * self.zoom)))
+
+	def draw_rect(self, sprite):
+		"""Where to draw a sprite: sprites that keep prev_pos (the player, the dog) are drawn
+		between their last two steps, so movement stays smooth at any display rate"""
+		prev_pos = getattr(sprite, 'prev_pos', None)
+		if prev_pos is None or self.alpha == 1:
+			return sprite.rect
+		x = round(prev_pos.x + (sprite.pos.x - prev_pos.x) * self.alpha)
+		y = round(prev_pos.y + (sprite.pos.y - prev_pos.y) * self.alpha)
+		return sprite.rect.move(x - round(sprite.pos.x), y - round(sprite.pos.y))
+
+	def blit_screen(self, surface, image, rect):
+		"""Blit an image at its world rect straight onto the screen, after the world is drawn"""
+		surface.blit(scaled(image, self.zoom), self.to_screen(rect.topleft))
+
+	def blit(self, surface, image, rect):
+		"""Blit an image at its world rect onto the render surface"""
+		self.blit_scaled(surface, scaled(image, self.scale), rect)
+
+	def blit_scaled(self, surface, image, rect):
+		"""Same as blit for an image that is already at the camera's scale"""
+		if self.scale == 1:
+			offset_rect = rect.copy()
+			offset_rect.center -= self.offset
+			surface.blit(image, offset_rect)
+		else:
+			surface.blit(image, self.to_render(rect.topleft))
+
+	def custom_draw(self, player):
+		view_width, view_height = SCREEN_WIDTH / self.zoom, SCREEN_HEIGHT / self.zoom
+		player_rect = self.draw_rect(player)
+		self.offset.x = player_rect.centerx - view_width / 2
+		self.offset.y = player_rect.centery - view_height / 2
+		self.origin = (round(self.offset.x * self.scale), round(self.offset.y * self.scale))
+		self.view = pygame.Rect(int(self.offset.x), int(self.offset.y), int(view_width) + 1, int(view_height) + 1)
+		view = self.view
+
+		surface = self.render_surface
+		if surface is not self.display_surface:
+			surface.fill('black')
+
+		self.sort_pending()
+		dynamic_layers = {}
+		for sprite in self.dynamic_sprites:
+			dynamic_layers.setdefault(sprite.z, []).append(sprite)
+
+		# Draw layer by layer, sorting by Y within each layer. Layers holding only static
+		# sprites are collected into a band and drawn from its baked chunks in one go
+		band = []
+		for z_value in sorted(self.static_layers.keys() | dynamic_layers.keys() | self.draw_hooks.keys()):
+			if z_value not in dynamic_layers and z_value not in self.draw_hooks:
+				band.append(z_value)
+				continue
+			if band:
+				self.static_chunks.draw(surface, self, tuple(band), self.order)
+				band = []
+
+			layer_sprites = dynamic_layers.get(z_value, []) + list(self.static_layers.get(z_value, ()))
+			for sprite in sorted(layer_sprites, key=lambda s: (s.rect.centery, self.order[s])):
+				if view.colliderect(sprite.rect):
+					self.blit(surface, sprite.image, self.draw_rect(sprite))
+
+			for draw in self.draw_hooks.get(z_value, ()):
+				draw(surface, self)
+		if band:
+			self.static_chunks.draw(surface, self, tuple(band), self.order)
+
+		if surface is not self.display_surface:
+			pygame.transform.scale(surface, self.display_surface.get_size(), self.display_surface)
@@ -0,0 +1,93 @@
+import time
+import pygame
+from settings import *
+from post_effects import post_effects
+
+DAY_COLOR = (255, 255, 255)
+NIGHT_COLOR = (38, 101, 189)
+LIGHT_CHUNK = 256  # the light map only moves when the camera crosses one of these
+LIGHT_STEPS = 16   # rings in a light pool gradient
+
+def night_factor(current_time):
+	"""0 during the day, 1 at night, blending over sunrise (6-8) and sunset (18-20)"""
+	if 6 <= current_time < 8:
+		return 1 - (current_time - 6) / 2
+	if 18 <= current_time < 20:
+		return (current_time - 18) / 2
+	if current_time >= 20 or current_time < 6:
+		return 1
+	return 0
+
+def build_sky_lut():
+	"""Sky colour for every minute of the day"""
+	lut = []
+	for minute in range(24 * 60):
+		factor = night_factor(minute / 60)
+		lut.append(tuple(int(day + (night - day) * factor) for day, night in zip(DAY_COLOR, NIGHT_COLOR)))
+	return lut
+
+SKY_LUT = build_sky_lut()
+
+light_pools = {}
+
+def get_light_pool(radius, color):
+	"""Opaque gradient from color at the centre to black at radius, stamped with BLEND_RGB_MAX"""
+	key = (radius, tuple(color))
+	if key not in light_pools:
+		surf = pygame.Surface((radius * 2, radius * 2))
+		for i in range(LIGHT_STEPS):
+			strength = (i + 1) / LIGHT_STEPS
+			ring_color = [int(channel * strength) for channel in color]
+			pygame.draw.circle(surf, ring_color, (radius, radius), int(radius * (1 - i / LIGHT_STEPS)))
+		light_pools[key] = surf
+	return light_pools[key]
+
+class Lighting:
+	"""Screen multiply from a cached light map: the sky colour with light pools stamped in.
+	The map is a chunk larger than the screen and only rebuilt when the lights, the sky colour
+	or the camera's chunk change, so each frame costs one multiply blit like the old flat tint"""
+	def __init__(self):
+		self.light_map = pygame.Surface((SCREEN_WIDTH + LIGHT_CHUNK, SCREEN_HEIGHT + LIGHT_CHUNK))
+		self.lights = ()
+		self.key = None  # (chunk origin, sky colour, lights, zoom) the map was built for
+
+		self.rebuilds = 0
+		self.rebuild_time = 0
+
+	def sky_color(self, hour, minute):
+		return SKY_LUT[(hour % 24) * 60 + minute % 60]
+
+	def set_lights(self, lights):
+		"""lights: iterable of (LIGHT_SOURCES name, world centre)"""
+		self.lights = tuple(sorted((name, (int(x), int(y))) for name, (x, y) in lights if name in LIGHT_SOURCES))
+
+	def rebuild(self, origin, color, zoom):
+		start = time.perf_counter()
+		self.light_map.fill(color)
+		for name, (x, y) in self.lights:
+			radius, light_color = LIGHT_SOURCES[name]
+			pool = get_light_pool(max(1, round(radius * zoom)), light_color)
+			# the map is in screen pixels, origin is the world position of its top-left
+			pool_rect = pool.get_rect(center = (round((x - origin[0]) * zoom), round((y - origin[1]) * zoom)))
+			if pool_rect.colliderect(self.light_map.get_rect()):
+				self.light_map.blit(pool, pool_rect, special_flags = pygame.BLEND_RGB_MAX)
+
+		self.key = (origin, color, self.lights, zoom)
+		self.rebuilds += 1
+		self.rebuild_time += time.perf_counter() - start
+
+	def draw(self, surface, offset, color, zoom = 1):
+		color = tuple(color)[:3]
+		if color == DAY_COLOR:
+			# multiplying by white changes nothing, and light pools can't outshine daylight
+			return
+
+		# zoomed out, a light chunk covers more of the world
+		chunk = round(LIGHT_CHUNK / zoom)
+		x, y = int(offset.x), int(offset.y)
+		origin = (x // chunk * chunk, y // chunk * chunk)
+		if (origin, color, self.lights, zoom) != self.key:
+			self.rebuild(origin, color, zoom)
+
+		area = pygame.Rect(round((x - origin[0]) * zoom), round((y - origin[1]) * zoom), *surface.get_size())
+		post_effects.multiply_surface(surface, self.light_map, area)
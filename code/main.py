@@ -16,19 +16,42 @@ from title_screen import TitleScreen
 from level import Level
 from intro_cutscene import IntroCutscene
 import pygame
+import time
 from settings import *
+from asset_bundle import get_bundle
+from asset_preloader import AssetPreloader
+from display_updates import display_updates
+from input_state import input_state
+from replay import ReplayRecorder
 
 class Game:
 	def __init__(self):
 		pygame.init()
-		self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+		self.screen = self.create_window()
 		pygame.display.set_caption('Tzeri\'s Garden')
 		self.clock = pygame.time.Clock()
+
+		# decode level assets on worker threads while the intro and title play
+		self.preloader = AssetPreloader().start()
 		
 		self.state = 'intro'  # States: 'intro', 'title', 'playing'
 		self.intro_cutscene = IntroCutscene('intro')
 		self.title_screen = None
 		self.level = None
+		self.recorder = None
+
+	def create_window(self):
+		"""The game always draws at SCREEN_WIDTH x SCREEN_HEIGHT, other window sizes are scaled by SDL"""
+		if WINDOW_SIZE == (SCREEN_WIDTH, SCREEN_HEIGHT):
+			return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+		screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.RESIZABLE)
+		try:
+			from pygame._sdl2.video import Window
+			Window.from_display_module().size = WINDOW_SIZE
+		except Exception as e:
+			print(f"⚠️ Could not resize the window to {WINDOW_SIZE}: {e}")
+		return screen
 
 	def run(self):
 		while True:
@@ -38,6 +61,8 @@ class Game:
 			# Check for quit
 			for event in events:
 				if event.type == pygame.QUIT:
+					if self.recorder:
+						self.recorder.close(self.level)
 					pygame.quit()
 					sys.exit()
 			
@@ -52,16 +77,26 @@ class Game:
 				if result == 'start':
 					# Title finished, start game
 					self.state = 'playing'
+					start = time.perf_counter()
+					self.preloader.finish()
+					if RECORD_REPLAYS:
+						self.recorder = ReplayRecorder()
 					self.level = Level()
+					source = 'asset bundle' if get_bundle() else 'loose files'
+					print(f"⏱️ Level loaded in {(time.perf_counter() - start) * 1000:.0f} ms ({source})")
 				elif result == 'quit':
 					pygame.quit()
 					exit()
 			
 			elif self.state == 'playing':
 				if self.level:
+					input_state.poll()
+					if self.recorder:
+						self.recorder.record(dt, events)
 					self.level.run(dt, events)
 			
-			pygame.display.update()
+			# push only what the screens reported as changed
+			display_updates.flush()
 
 if __name__ == '__main__':
 	game = Game()
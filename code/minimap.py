@@ -0,0 +1,102 @@
+import pygame
+from settings import *
+from support import import_image_size
+
+MINIMAP_WATER = (60, 120, 170)  # under the ground tiles, water is animated so it isn't baked
+
+# tile states, most important first (a corrupted crop shows as corruption)
+MINIMAP_COLORS = {
+	'corrupted': (90, 30, 110),
+	'ward': (150, 220, 255),
+	'planted': (70, 200, 60),
+	'watered': (60, 80, 140),
+	'tilled': (120, 80, 45),
+}
+
+class Minimap:
+	"""Farm overview with MINIMAP_TILE pixels per tile. The soil layer, corruption spread
+	and ward system report the tiles they change and only those get repainted, so drawing
+	the minimap is one blit whatever the farm looks like"""
+	def __init__(self, level):
+		self.level = level
+		self.display_surface = pygame.display.get_surface()
+		self.visible = True
+
+		ground_w, ground_h = import_image_size('graphics/world/ground.png')
+		self.cols, self.rows = ground_w // TILE_SIZE, ground_h // TILE_SIZE
+		size = (self.cols * MINIMAP_TILE, self.rows * MINIMAP_TILE)
+		self.base = pygame.Surface(size)  # the map without tile states, from the static sprites
+		self.surf = pygame.Surface(size)
+		self.rect = self.surf.get_rect(topright = (SCREEN_WIDTH - 12, 98))
+
+		# tiles repainted so far, shown in the perf overlay
+		self.repaints = 0
+
+	def watch(self, system):
+		"""Repaint the tiles system reports changed (anything with tile_listeners)"""
+		if self.update_tile not in system.tile_listeners:
+			system.tile_listeners.append(self.update_tile)
+
+	def refresh(self):
+		"""Redraw the map and repaint every tile (after the map or a system is replaced)"""
+		camera = self.level.all_sprites
+		camera.sort_pending()
+		self.base.fill(MINIMAP_WATER)
+		band = tuple(sorted(camera.static_layers))
+		camera.static_chunks.draw_all(self.base, MINIMAP_TILE / TILE_SIZE, band, camera.order)
+
+		wards = self.ward_tiles()
+		for y in range(self.rows):
+			for x in range(self.cols):
+				self.paint_tile(x, y, wards)
+
+	def ward_tiles(self):
+		return {(ward.grid_x, ward.grid_y) for ward in self.level.ward_system.ward_sprites}
+
+	def tile_state(self, x, y, wards):
+		level = self.level
+		if level.corruption_spread and (x, y) in level.corruption_spread.corruption_map:
+			return 'corrupted'
+		if (x, y) in wards:
+			return 'ward'
+		soil_layer = level.soil_layer
+		if soil_layer and y < len(soil_layer.grid) and x < len(soil_layer.grid[0]):
+			cell = soil_layer.grid[y][x]
+			if 'P' in cell:
+				return 'planted'
+			if 'W' in cell:
+				return 'watered'
+			if 'X' in cell:
+				return 'tilled'
+		return None
+
+	def paint_tile(self, x, y, wards):
+		rect = pygame.Rect(x * MINIMAP_TILE, y * MINIMAP_TILE, MINIMAP_TILE, MINIMAP_TILE)
+		state = self.tile_state(x, y, wards)
+		if state:
+			self.surf.fill(MINIMAP_COLORS[state], rect)
+		else:
+			self.surf.blit(self.base, rect, rect)
+		self.repaints += 1
+
+	def update_tile(self, x, y):
+		if 0 <= x < self.cols and 0 <= y < self.rows:
+			self.paint_tile(x, y, self.ward_tiles())
+
+	def toggle(self):
+		self.visible = not self.visible
+
+	def draw(self):
+		if not self.visible:
+			return
+		self.display_surface.blit(self.surf, self.rect)
+		pygame.draw.rect(self.display_surface, 'White', self.rect.inflate(4, 4), 2)
+
+		# what the camera sees and where the player is
+		scale = MINIMAP_TILE / TILE_SIZE
+		view = self.level.all_sprites.view
+		view_rect = pygame.Rect(self.rect.left + view.left * scale, self.rect.top + view.top * scale, view.width * scale, view.height * scale)
+		pygame.draw.rect(self.display_surface, (255, 255, 255), view_rect.clip(self.rect), 1)
+		player = self.level.player.rect.center
+		player_pos = (self.rect.left + int(player[0] * scale), self.rect.top + int(player[1] * scale))
+		pygame.draw.circle(self.display_surface, (255, 60, 60), player_pos, 2)
@@ -1,5 +1,10 @@
 import pygame
 from settings import *
+from support import import_image
+from hud import Badge
+from text_cache import get_font, render_text
+from display_updates import display_updates
+from input_state import input_state
 
 class Overlay:
 	def __init__(self,player,show_objective: bool = False):
@@ -14,7 +19,7 @@ class Overlay:
 		self.tools_surf = {}
 		for tool in ['hoe', 'axe', 'water', 'ward']:  # Hardcode the tools that have overlay images
 			try:
-				self.tools_surf[tool] = pygame.image.load(f'{overlay_path}{tool}.png').convert_alpha()
+				self.tools_surf[tool] = import_image(f'{overlay_path}{tool}.png')
 			except Exception as e:
 				print(f"❌ Failed to load {tool}.png: {e}")
 				placeholder = pygame.Surface((64, 64))
@@ -25,7 +30,7 @@ class Overlay:
 		self.seeds_surf = {}
 		for seed in player.seeds:
 			try:
-				self.seeds_surf[seed] = pygame.image.load(f'{overlay_path}{seed}.png').convert_alpha()
+				self.seeds_surf[seed] = import_image(f'{overlay_path}{seed}.png')
 			except Exception as e:
 				print(f"❌ Failed to load {seed}.png: {e}")
 				placeholder = pygame.Surface((64, 64))
@@ -34,16 +39,23 @@ class Overlay:
 
 		# objective box
 		try:
-			self.objective_surf = pygame.image.load(f'{overlay_path}objective_textbox.png').convert_alpha()
+			self.objective_surf = import_image(f'{overlay_path}objective_textbox.png')
 		except Exception:
 			self.objective_surf = None
 
-		self.objective_font = pygame.font.Font('font/LycheeSoda.ttf', 20)
+		self.objective_font = get_font(20)
 		self.objective_text = "Plant various seeds, grow, and sell them to the Trader"
 		self.show_objective = show_objective
 		self.objective_timer = 10.0
 		self.button_rect = None
 
+		# ward counts, re-rendered only when the count changes
+		ward_text = lambda: f"Wards: {self.player.ward_count}"
+		tool_pos = OVERLAY_POSITIONS['tool']
+		self.tool_ward_badge = Badge((tool_pos[0], tool_pos[1] + 10), get_font(18), ward_text, 'White', anchor='midtop')
+		self.seed_ward_badge = Badge((OVERLAY_POSITIONS['seed'][0] + 100, SCREEN_HEIGHT - 10), self.objective_font, ward_text, (150, 220, 255),
+			anchor='midbottom', padding=(10, 4), antialias=True)
+
 	def _wrap_text(self, text, font, max_width):
 		words = text.split(' ')
 		lines = []
@@ -62,19 +74,7 @@ class Overlay:
 	
 	def display_ward_count(self):
 		"""Display ward count next to tool overlay"""
-		font = pygame.font.Font('font/LycheeSoda.ttf', 18)
-		ward_text = f"Wards: {self.player.ward_count}"
-		ward_surf = font.render(ward_text, False, 'White')
-		
-		# Position next to tool overlay
-		tool_pos = OVERLAY_POSITIONS['tool']
-		ward_rect = ward_surf.get_rect(midtop=(tool_pos[0], tool_pos[1] + 10))
-		
-		# Background
-		bg_rect = ward_rect.inflate(10, 6)
-		pygame.draw.rect(self.display_surface, 'Black', bg_rect, 0, 4)
-		pygame.draw.rect(self.display_surface, 'White', bg_rect, 2, 4)
-		self.display_surface.blit(ward_surf, ward_rect)
+		self.tool_ward_badge.draw(self.display_surface)
 
 	def display(self, dt: float = 0, events = None):
 
@@ -93,16 +93,7 @@ class Overlay:
 
 		# Ward count display
 		if hasattr(self.player, 'ward_count'):
-			ward_text = f"Wards: {self.player.ward_count}"
-			ward_surf = self.objective_font.render(ward_text, True, (150, 220, 255))
-			ward_rect = ward_surf.get_rect(midbottom=(OVERLAY_POSITIONS['seed'][0] + 100, SCREEN_HEIGHT - 10))
-			
-			# Background
-			bg_rect = ward_rect.inflate(10, 4)
-			pygame.draw.rect(self.display_surface, (0, 0, 0), bg_rect, border_radius=4)
-			pygame.draw.rect(self.display_surface, (150, 220, 255), bg_rect, 2, border_radius=4)
-			
-			self.display_surface.blit(ward_surf, ward_rect)
+			self.seed_ward_badge.draw(self.display_surface)
 
 		# objective box (show once at level start)
 		if self.show_objective and self.objective_surf:
@@ -116,6 +107,7 @@ class Overlay:
 			box_surf = pygame.transform.smoothscale(self.objective_surf, (target_w, target_h))
 			box_rect = box_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 			self.display_surface.blit(box_surf, box_rect)
+			display_updates.add(box_rect)
 
 			# render text inside the box
 			padding = 16
@@ -132,7 +124,7 @@ class Overlay:
 
 			y = start_y
 			for line in lines:
-				surf = self.objective_font.render(line, True, (0, 0, 0))
+				surf = render_text(self.objective_font, line, (0, 0, 0))
 				rect = surf.get_rect()
 				rect.centerx = box_rect.centerx
 				rect.top = y
@@ -146,12 +138,12 @@ class Overlay:
 			button_rect.bottom = box_rect.bottom - padding + 5
 			self.button_rect = button_rect
 
-			mx, my = pygame.mouse.get_pos()
+			mx, my = input_state.mouse_pos
 			hover = button_rect.collidepoint((mx, my))
 			button_color = (200, 200, 200) if not hover else (170, 170, 170)
 			pygame.draw.rect(self.display_surface, button_color, button_rect, border_radius=6)
 			pygame.draw.rect(self.display_surface, (0, 0, 0), button_rect, 2, border_radius=6)
-			btn_surf = self.objective_font.render('Dismiss', True, (0, 0, 0))
+			btn_surf = render_text(self.objective_font, 'Dismiss', (0, 0, 0))
 			btn_rect = btn_surf.get_rect(center=button_rect.center)
 			self.display_surface.blit(btn_surf, btn_rect)
 
@@ -1,13 +1,18 @@
 import pygame
 from settings import *
+from post_effects import post_effects
+from display_updates import display_updates
+from input_state import input_state
+from ui_widgets import Panel, Label, Button
+from text_cache import get_font, render_text
 
 class PauseMenu:
 	def __init__(self, toggle_pause, toggle_save_load):
 		self.display_surface = pygame.display.get_surface()
 		self.toggle_pause = toggle_pause
 		self.toggle_save_load = toggle_save_load
-		self.font = pygame.font.Font('font/LycheeSoda.ttf', 28)
-		self.title_font = pygame.font.Font('font/LycheeSoda.ttf', 48)
+		self.font = get_font(28)
+		self.title_font = get_font(48)
 
 		# layout
 		self.width = 640
@@ -16,21 +21,20 @@ class PauseMenu:
 							SCREEN_HEIGHT // 2 - self.height // 2,
 							self.width, self.height)
 
-		# buttons (label, rendered surf, rect, hitbox)
+		# buttons (sized around their label, like the old hitboxes)
+		button_style = {'bg': 'White', 'hover_bg': (220, 220, 220), 'border': 'Black', 'width': 2, 'radius': 6, 'text': 'Black', 'hover_text': 'Black'}
 		labels = ['How to Play', 'Credits', 'Save/Load', 'Exit']
 		self.buttons = []
 		for i, label in enumerate(labels):
-			surf = self.font.render(label, True, 'Black')
-			rect = surf.get_rect(center=(SCREEN_WIDTH // 2, self.rect.top + 120 + i * 80))
-			hit = rect.inflate(40, 18)
-			self.buttons.append({'label': label, 'surf': surf, 'rect': rect, 'hit': hit})
+			rect = render_text(self.font, label, 'Black').get_rect(center=(SCREEN_WIDTH // 2, self.rect.top + 120 + i * 80))
+			self.buttons.append(Button(rect.inflate(40, 18), label, self.font, button_style))
 
 		# subscreens
 		self.active = None  # None, 'how', 'credits'
 
 		# back button for subscreen
-		self.back_surf = self.font.render('Back', True, 'Black')
-		self.back_rect = self.back_surf.get_rect(midbottom=(self.rect.centerx, self.rect.bottom - 20))
+		back_rect = render_text(self.font, 'Back', 'Black').get_rect(midbottom=(self.rect.centerx, self.rect.bottom - 20))
+		self.back_button = Button(back_rect.inflate(20, 10), 'Back', self.font, dict(button_style, hover_bg='White'))
 
 		# content
 		self.how_lines = [
@@ -58,6 +62,23 @@ class PauseMenu:
 			"Pydew Valley by Clearcode"
 		]
 
+		self.screens = {
+			None: self.create_screen(self.buttons + [Label((self.rect.centerx, self.rect.bottom - 40), self.font, 'Use mouse to click. Press ESC to close.', 'Black')]),
+			'how': self.create_screen(self.create_lines(self.how_lines) + [self.back_button]),
+			'credits': self.create_screen(self.create_lines(self.credits_lines) + [self.back_button])
+		}
+
+	def create_lines(self, lines):
+		return [Label((self.rect.left + 30, self.rect.top + 110 + i * 30), self.font, line, 'Black', 'midleft') for i, line in enumerate(lines)]
+
+	def create_screen(self, widgets):
+		"""Panel with the title and the widgets of one screen"""
+		panel = Panel(self.rect, (255, 255, 255, 115), 'Black', 4, 8)
+		panel.add(Label((self.rect.centerx, self.rect.top + 50), self.title_font, 'Paused', 'Black'))
+		for widget in widgets:
+			panel.add(widget)
+		return panel
+
 	def handle_events(self, events):
 		for event in events:
 			if event.type == pygame.KEYDOWN:
@@ -70,22 +91,22 @@ class PauseMenu:
 
 			if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
 				# prefer the event position; fall back to current mouse position
-				pos = getattr(event, 'pos', pygame.mouse.get_pos())
+				pos = getattr(event, 'pos', input_state.mouse_pos)
 				if self.active:
 					# back button
-					if self.back_rect.collidepoint(pos):
+					if self.back_button.rect.collidepoint(pos):
 						self.active = None
 				else:
 					# main menu buttons
 					for b in self.buttons:
-						if b['hit'].collidepoint(pos):
-							if b['label'] == 'Exit':
+						if b.rect.collidepoint(pos):
+							if b.text == 'Exit':
 								self.toggle_pause()
-							elif b['label'] == 'How to Play':
+							elif b.text == 'How to Play':
 								self.active = 'how'
-							elif b['label'] == 'Credits':
+							elif b.text == 'Credits':
 								self.active = 'credits'
-							elif b['label'] == 'Save/Load':
+							elif b.text == 'Save/Load':
 								self.toggle_pause()
 								self.toggle_save_load()
 
@@ -95,58 +116,6 @@ class PauseMenu:
 
 	def draw(self):
 		# dim background
-		overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-		overlay.fill((0, 0, 0, 160))
-		self.display_surface.blit(overlay, (0, 0))
-
-		# panel
-		# panel - transparent background
-		panel_surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-		panel_surf.fill((255, 255, 255, 115))  # White with 200/255 opacity (adjust 200 to your liking)
-		self.display_surface.blit(panel_surf, self.rect.topleft)
-		pygame.draw.rect(self.display_surface, 'Black', self.rect, 4, 8)  # Keep the black border
-
-		# title
-		title_s = self.title_font.render('Paused', True, 'Black')
-		title_r = title_s.get_rect(center=(self.rect.centerx, self.rect.top + 50))
-		self.display_surface.blit(title_s, title_r)
-
-		# if subscreen active show content and back button
-		if self.active == 'how':
-			for i, line in enumerate(self.how_lines):
-				s = self.font.render(line, True, 'Black')
-				r = s.get_rect(midleft=(self.rect.left + 30, self.rect.top + 110 + i * 30))
-				self.display_surface.blit(s, r)
-
-			# back button
-			pygame.draw.rect(self.display_surface, 'White', self.back_rect.inflate(20, 10), 0, 6)
-			pygame.draw.rect(self.display_surface, 'Black', self.back_rect.inflate(20, 10), 2, 6)
-			self.display_surface.blit(self.back_surf, self.back_rect)
-
-		elif self.active == 'credits':
-			for i, line in enumerate(self.credits_lines):
-				s = self.font.render(line, True, 'Black')
-				r = s.get_rect(midleft=(self.rect.left + 30, self.rect.top + 110 + i * 30))
-				self.display_surface.blit(s, r)
-
-			# back button
-			pygame.draw.rect(self.display_surface, 'White', self.back_rect.inflate(20, 10), 0, 6)
-			pygame.draw.rect(self.display_surface, 'Black', self.back_rect.inflate(20, 10), 2, 6)
-			self.display_surface.blit(self.back_surf, self.back_rect)
-
-		else:
-			# draw buttons
-			for b in self.buttons:
-				# hover effect
-				if b['hit'].collidepoint(pygame.mouse.get_pos()):
-					pygame.draw.rect(self.display_surface, (220,220,220), b['hit'], 0, 6)
-				else:
-					pygame.draw.rect(self.display_surface, 'White', b['hit'], 0, 6)
-
-				pygame.draw.rect(self.display_surface, 'Black', b['hit'], 2, 6)
-				self.display_surface.blit(b['surf'], b['rect'])
-
-			# hint
-			hint = self.font.render('Use mouse to click. Press ESC to close.', True, 'Black')
-			hint_r = hint.get_rect(center=(self.rect.centerx, self.rect.bottom - 40))
-			self.display_surface.blit(hint, hint_r)
+		post_effects.blend(self.display_surface, (0, 0, 0), 160)
+		self.screens[self.active].draw(self.display_surface, input_state.mouse_pos)
+		display_updates.add(self.rect)
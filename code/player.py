@@ -2,6 +2,7 @@ import pygame
 from settings import *
 from support import *
 from timer import Timer
+from input_state import input_state
 
 class Player(pygame.sprite.Sprite):
 	def __init__(self, pos, group, collision_sprites, tree_sprites, interaction, soil_layer, toggle_shop):
@@ -22,6 +23,10 @@ class Player(pygame.sprite.Sprite):
 		self.target_pos = pygame.math.Vector2(self.rect.center)
 		self.speed = 200
 
+		# camera offset and zoom, kept up to date by the level for mouse control
+		self.offset = pygame.math.Vector2()
+		self.zoom = 1
+
 		# collision
 		self.hitbox = self.rect.copy().inflate((-126,-70))
 		self.collision_sprites = collision_sprites
@@ -77,7 +82,7 @@ class Player(pygame.sprite.Sprite):
 		self.toggle_shop = toggle_shop
 
 		# sound
-		self.watering = pygame.mixer.Sound('audio/water.mp3')
+		self.watering = import_sound('audio/water.mp3')
 		self.watering.set_volume(0.2)
 
 	def use_tool(self):
@@ -120,12 +125,15 @@ class Player(pygame.sprite.Sprite):
 				self.soil_layer.water(self.target_pos)
 				self.watering.play()
 
+	def mouse_world_pos(self, correction = (0, 0)):
+		"""World position under the mouse, correction is in screen pixels"""
+		return (input_state.mouse_pos - pygame.math.Vector2(correction)) / self.zoom + self.offset
+
 	def get_target_pos(self):
 		# added logic for target to follow mouse when using mouse. If gamit space, target is infront of character
-		if pygame.mouse.get_pressed()[0] or pygame.mouse.get_pressed()[2]:
+		if input_state.buttons[0] or input_state.buttons[2]:
 			player_pos = pygame.math.Vector2(self.rect.center)
-			corrected_mouse = pygame.mouse.get_pos() - pygame.math.Vector2(5,5)
-			mouse_world_pos = corrected_mouse + self.offset
+			mouse_world_pos = self.mouse_world_pos((5, 5))
 			
 			distance = player_pos.distance_to(mouse_world_pos)
 
@@ -179,9 +187,9 @@ class Player(pygame.sprite.Sprite):
 		self.image = self.animations[self.status][int(self.frame_index)]
 
 	def input(self):
-		keys = pygame.key.get_pressed()
+		keys = input_state.get_pressed()
 		# mouse support
-		buttons = pygame.mouse.get_pressed() 
+		buttons = input_state.buttons 
 
 		if not self.timers['tool use'].active and not self.timers['seed use'].active and not self.sleep:
 
@@ -223,7 +231,7 @@ class Player(pygame.sprite.Sprite):
 
 				elif buttons[0]:
 					# Calculate world mouse position
-					mouse_world_pos = pygame.mouse.get_pos() + self.offset
+					mouse_world_pos = self.mouse_world_pos()
 					# Check distance betweem player and mouse
 					distance = pygame.math.Vector2(self.rect.center).distance_to(mouse_world_pos)
 
@@ -257,7 +265,7 @@ class Player(pygame.sprite.Sprite):
 			elif buttons[2] or keys[pygame.K_LCTRL]:
 				use_seed = False
 				if buttons[2]:
-					mouse_world_pos = pygame.mouse.get_pos() + self.offset
+					mouse_world_pos = self.mouse_world_pos()
 					distance = pygame.math.Vector2(self.rect.center).distance_to(mouse_world_pos)
 
 					if distance <= PLAYER_REACH_LIMIT:
@@ -303,10 +311,6 @@ class Player(pygame.sprite.Sprite):
 		if self.timers['tool use'].active:
 			self.status = self.status.split('_')[0] + '_' + self.selected_tool
 
-	def update_timers(self):
-		for timer in self.timers.values():
-			timer.update()
-
 	def collision(self, direction):
 		for sprite in self.collision_sprites.sprites():
 			if hasattr(sprite, 'hitbox'):
@@ -337,18 +341,21 @@ class Player(pygame.sprite.Sprite):
 		self.pos.x += self.direction.x * self.speed * dt
 		self.hitbox.centerx = round(self.pos.x)
 		self.rect.centerx = self.hitbox.centerx
-		self.collision('horizontal')
+		if self.direction.x:
+			self.collision('horizontal')
 
 		# vertical movement
 		self.pos.y += self.direction.y * self.speed * dt
 		self.hitbox.centery = round(self.pos.y)
 		self.rect.centery = self.hitbox.centery
-		self.collision('vertical')
+		if self.direction.y:
+			self.collision('vertical')
 
 	def update(self, dt):
+		# where the last step left the player, for drawing between steps
+		self.prev_pos = self.pos.copy()
 		self.input()
 		self.get_status()
-		self.update_timers()
 		if not self.timers['tool use'].active and not self.timers['seed use'].active:
 			self.get_target_pos()
 
@@ -0,0 +1,75 @@
+import time
+import pygame
+
+class PostEffects:
+	"""Full-screen passes (sky tint, flashes, fades) drawn from two reusable screen-sized
+	buffers, refilled only when their colour changes, instead of a new surface per pass"""
+	def __init__(self):
+		self.multiply_buffer = None
+		self.multiply_color = None
+		self.blend_buffer = None
+		self.blend_color = None
+
+		# stats for the frame being drawn and the last finished one
+		self.passes = 0
+		self.time = 0
+		self.last_passes = 0
+		self.last_time = 0
+
+	def get_buffers(self, surface):
+		if not self.multiply_buffer or self.multiply_buffer.get_size() != surface.get_size():
+			self.multiply_buffer = pygame.Surface(surface.get_size())
+			self.blend_buffer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+			self.multiply_color = None
+			self.blend_color = None
+
+	def multiply(self, surface, color, rect = None):
+		"""Multiply the surface (or one rect of it) by a colour, e.g. the day/night tint or a fade"""
+		start = time.perf_counter()
+		self.get_buffers(surface)
+		color = tuple(color)[:3]
+		if color != self.multiply_color:
+			self.multiply_buffer.fill(color)
+			self.multiply_color = color
+
+		if rect:
+			surface.blit(self.multiply_buffer, rect, rect, special_flags = pygame.BLEND_RGB_MULT)
+		else:
+			surface.blit(self.multiply_buffer, (0, 0), special_flags = pygame.BLEND_RGB_MULT)
+		self.passes += 1
+		self.time += time.perf_counter() - start
+
+	def multiply_surface(self, surface, source, area = None):
+		"""Multiply the surface by a prepared map (e.g. the night light map)"""
+		start = time.perf_counter()
+		surface.blit(source, (0, 0), area, special_flags = pygame.BLEND_RGB_MULT)
+		self.passes += 1
+		self.time += time.perf_counter() - start
+
+	def blend(self, surface, color, alpha, rects = None):
+		"""Alpha-blend a flat colour over the surface, or only over rects
+		(which must not overlap, or the overlapping parts get blended twice)"""
+		if alpha <= 0:
+			return
+		start = time.perf_counter()
+		self.get_buffers(surface)
+		color = tuple(color)[:3] + (min(255, int(alpha)),)
+		if color != self.blend_color:
+			self.blend_buffer.fill(color)
+			self.blend_color = color
+
+		if rects:
+			for rect in rects:
+				surface.blit(self.blend_buffer, rect, rect)
+		else:
+			surface.blit(self.blend_buffer, (0, 0))
+		self.passes += 1
+		self.time += time.perf_counter() - start
+
+	def end_frame(self):
+		self.last_passes = self.passes
+		self.last_time = self.time
+		self.passes = 0
+		self.time = 0
+
+post_effects = PostEffects()
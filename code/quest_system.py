@@ -1,5 +1,8 @@
 import pygame
 from settings import *
+from hud import Badge, PaintedWidget
+from text_cache import get_font, render_text
+from timer import sim_clock
 
 class Quest:
     def __init__(self, quest_id, title, description, objectives, rewards, next_quest=None):
@@ -51,9 +54,9 @@ class QuestManager:
     def __init__(self, player):
         self.player = player
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font('font/LycheeSoda.ttf', 20)
-        self.title_font = pygame.font.Font('font/LycheeSoda.ttf', 28)
-        self.small_font = pygame.font.Font('font/LycheeSoda.ttf', 16)
+        self.font = get_font(20)
+        self.title_font = get_font(28)
+        self.small_font = get_font(16)
         
         # Define all quests
         self.all_quests = self.create_quests()
@@ -62,12 +65,20 @@ class QuestManager:
         
         # UI state
         self.show_completion = False
-        self.completion_timer = 0
+        self.completion_call = None
         self.completion_duration = 3.0  # Show for 3 seconds
         
         # Toggle state
         self.quest_ui_visible = True  # Quest UI visible by default
 
+        # HUD widgets, re-rendered only when the quest or its progress changes
+        self.quest_box = PaintedWidget(
+            lambda: (self.active_quest.title, self.active_quest.get_progress_text()),
+            self.render_quest_ui
+        )
+        self.quest_hint = Badge((10, 220), self.small_font, "Press 'O' to show quest", (200, 200, 200),
+                                padding=(16, 8), radius=6, antialias=True)
+
     def create_quests(self):
         """Define all quests in the game"""
         quests = [
@@ -128,15 +139,13 @@ class QuestManager:
         if self.active_quest and not self.active_quest.completed:
             objective_key = f'harvest_{crop_type}'
             if self.active_quest.update_progress(objective_key):
-                self.show_completion = True
-                self.completion_timer = self.completion_duration
+                self.show_completion_message()
 
     def on_stage_progress(self):
         """Called when farm progresses to next stage"""
         if self.active_quest and not self.active_quest.completed:
             if self.active_quest.update_progress('cleanse_stage'):
-                self.show_completion = True
-                self.completion_timer = self.completion_duration
+                self.show_completion_message()
 
     def claim_rewards(self):
         """Give rewards to player and move to next quest"""
@@ -171,29 +180,37 @@ class QuestManager:
         
         return True
 
-    def update(self, dt):
-        """Update quest manager"""
-        if self.show_completion:
-            self.completion_timer -= dt
-            if self.completion_timer <= 0:
-                self.show_completion = False
+    def show_completion_message(self):
+        """Show the quest complete message for completion_duration seconds of game time"""
+        self.show_completion = True
+        if self.completion_call:
+            self.completion_call.cancel()
+        self.completion_call = sim_clock.schedule(self.completion_duration * 1000, self.hide_completion_message)
+
+    def hide_completion_message(self):
+        self.show_completion = False
+        self.completion_call = None
 
     def draw_quest_ui(self):
         """Draw quest progress in top-left corner (lowered position)"""
         if not self.active_quest or not self.quest_ui_visible:
             return
-        
+        self.quest_box.draw(self.display_surface)
+
+    def render_quest_ui(self, key):
+        """Render the quest box for (title, progress text), returns (surface, screen rect)"""
+        title, progress_text = key
+
         # Position (lowered by 120 pixels to avoid time system)
         x, y = 10, 220
         padding = 10
         
         # Quest title
-        title_text = f"Quest: {self.active_quest.title}"
-        title_surf = self.title_font.render(title_text, True, (255, 255, 255))
+        title_text = f"Quest: {title}"
+        title_surf = render_text(self.title_font, title_text, (255, 255, 255))
         title_rect = title_surf.get_rect(topleft=(x, y))
         
         # Progress text
-        progress_text = self.active_quest.get_progress_text()
         progress_lines = progress_text.split('\n')
         
         # Calculate total height
@@ -217,47 +234,34 @@ class QuestManager:
         max_width = max(max_width, hint_width)
         max_width += padding * 2
         
-        # Draw background
+        # Draw background (drawn in box coordinates, the box sits at bg_rect)
         bg_rect = pygame.Rect(x - padding, y - padding, max_width + padding * 2, total_height)
-        pygame.draw.rect(self.display_surface, (0, 0, 0, 180), bg_rect, border_radius=8)
-        pygame.draw.rect(self.display_surface, (255, 255, 255), bg_rect, 2, border_radius=8)
+        surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, (0, 0, 0), surf.get_rect(), border_radius=8)
+        pygame.draw.rect(surf, (255, 255, 255), surf.get_rect(), 2, border_radius=8)
+        x, y = padding, padding
         
         # Draw title
-        self.display_surface.blit(title_surf, title_rect)
+        surf.blit(title_surf, (x, y))
         
         # Draw progress
         current_y = y + title_rect.height + padding
         for line in progress_lines:
-            line_surf = self.font.render(line, True, (200, 200, 200))
-            self.display_surface.blit(line_surf, (x, current_y))
+            line_surf = render_text(self.font, line, (200, 200, 200))
+            surf.blit(line_surf, (x, current_y))
             current_y += self.font.get_linesize()
         
         # Draw hint text at bottom
         current_y += 5
-        hint_surf = self.small_font.render(hint_text, True, (150, 150, 150))
-        self.display_surface.blit(hint_surf, (x, current_y))
+        hint_surf = render_text(self.small_font, hint_text, (150, 150, 150))
+        surf.blit(hint_surf, (x, current_y))
+        return surf, bg_rect
 
     def draw_quest_hint(self):
         """Draw a small hint when quest UI is hidden"""
         if self.quest_ui_visible or not self.active_quest:
             return
-        
-        # Position
-        x, y = 10, 220
-        padding = 8
-        
-        # Hint text
-        hint_text = "Press 'O' to show quest"
-        hint_surf = self.small_font.render(hint_text, True, (200, 200, 200))
-        hint_rect = hint_surf.get_rect(topleft=(x, y))
-        
-        # Background
-        bg_rect = hint_rect.inflate(padding * 2, padding)
-        pygame.draw.rect(self.display_surface, (0, 0, 0, 180), bg_rect, border_radius=6)
-        pygame.draw.rect(self.display_surface, (200, 200, 200), bg_rect, 2, border_radius=6)
-        
-        # Draw text
-        self.display_surface.blit(hint_surf, hint_rect)
+        self.quest_hint.draw(self.display_surface)
 
     def draw_completion_popup(self):
         """Draw quest completion popup"""
@@ -278,18 +282,18 @@ class QuestManager:
         
         # Title
         title = "Quest Complete!"
-        title_surf = self.title_font.render(title, True, (255, 215, 0))
+        title_surf = render_text(self.title_font, title, (255, 215, 0))
         title_rect = title_surf.get_rect(center=(popup_x + popup_width // 2, popup_y + 40))
         self.display_surface.blit(title_surf, title_rect)
         
         # Quest name
-        quest_surf = self.font.render(self.active_quest.title, True, (255, 255, 255))
+        quest_surf = render_text(self.font, self.active_quest.title, (255, 255, 255))
         quest_rect = quest_surf.get_rect(center=(popup_x + popup_width // 2, popup_y + 80))
         self.display_surface.blit(quest_surf, quest_rect)
         
         # Rewards text
         reward_text = "Press ENTER to claim rewards"
-        reward_surf = self.font.render(reward_text, True, (200, 200, 200))
+        reward_surf = render_text(self.font, reward_text, (200, 200, 200))
         reward_rect = reward_surf.get_rect(center=(popup_x + popup_width // 2, popup_y + 120))
         self.display_surface.blit(reward_surf, reward_rect)
 
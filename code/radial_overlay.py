@@ -0,0 +1,72 @@
+import pygame
+import weakref
+from settings import *
+from scale_cache import scaled
+
+# Pre-composited ward radius overlays, keyed by everything that shapes them.
+# Each effect becomes a single blit. Pulsing picks one of a few pre-faded copies,
+# since blitting with set_alpha takes SDL's slow path (about 4x slower here).
+radial_overlays = {}
+glow_overlays = {}
+# source surface -> {level: faded copy}, weak so the copies of text the text cache
+# dropped go with it
+faded_overlays = weakref.WeakKeyDictionary()
+PULSE_LEVELS = 16
+
+def get_radial_overlay(radius, color, peak_alpha, falloff = None, circular = True):
+	"""(2 * radius + 1) tiles square, one tinted tile per cell fading out with distance.
+	falloff is the distance in tiles where the alpha reaches 0 (None keeps it flat)"""
+	key = (radius, tuple(color), peak_alpha, falloff, circular)
+	if key not in radial_overlays:
+		size = (2 * radius + 1) * TILE_SIZE
+		surf = pygame.Surface((size, size), pygame.SRCALPHA)
+		for dx in range(-radius, radius + 1):
+			for dy in range(-radius, radius + 1):
+				distance = (dx * dx + dy * dy) ** 0.5
+				if circular and distance > radius:
+					continue
+				alpha = peak_alpha if falloff is None else int(peak_alpha * (1 - distance / falloff))
+				tile_rect = ((dx + radius) * TILE_SIZE, (dy + radius) * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+				surf.fill(tuple(color) + (max(0, alpha),), tile_rect)
+		radial_overlays[key] = surf
+	return radial_overlays[key]
+
+def get_glow_overlay(radius, color, ring_alphas, ring_step):
+	"""Concentric filled circles (outermost first), shrinking by ring_step each ring"""
+	key = (radius, tuple(color), tuple(ring_alphas), ring_step)
+	if key not in glow_overlays:
+		surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+		# start from transparent pixels of the same colour so blending doesn't darken the rings
+		surf.fill(tuple(color) + (0,))
+		for i, alpha in enumerate(ring_alphas):
+			ring_radius = radius - i * ring_step
+			if alpha > 0 and ring_radius > 0:
+				ring = pygame.Surface((ring_radius * 2, ring_radius * 2), pygame.SRCALPHA)
+				pygame.draw.circle(ring, tuple(color) + (alpha,), (ring_radius, ring_radius), ring_radius)
+				surf.blit(ring, ring.get_rect(center = (radius, radius)))
+		glow_overlays[key] = surf
+	return glow_overlays[key]
+
+def faded(overlay, alpha):
+	"""Copy of overlay with its alpha scaled by alpha / 255, rounded to one of PULSE_LEVELS"""
+	level = round(max(0, min(255, alpha)) / 255 * PULSE_LEVELS)
+	if level == PULSE_LEVELS:
+		return overlay
+	levels = faded_overlays.get(overlay)
+	if levels is None:
+		levels = faded_overlays[overlay] = {}
+	if level not in levels:
+		surf = overlay.copy()
+		surf.fill((255, 255, 255, int(255 * level / PULSE_LEVELS)), special_flags = pygame.BLEND_RGBA_MULT)
+		levels[level] = surf
+	return levels[level]
+
+def draw_radial_overlay(surface, overlay, center_tile_pos, offset, alpha = 255, zoom = 1):
+	"""Blit a radial overlay centred on the tile whose world top-left is center_tile_pos"""
+	radius_px = (overlay.get_width() - TILE_SIZE) // 2
+	rect = overlay.get_rect(topleft = (center_tile_pos[0] - radius_px, center_tile_pos[1] - radius_px))
+	if zoom == 1:
+		surface.blit(faded(overlay, alpha), rect.move(-offset))
+	else:
+		pos = (round((rect.x - offset[0]) * zoom), round((rect.y - offset[1]) * zoom))
+		surface.blit(scaled(faded(overlay, alpha), zoom), pos)
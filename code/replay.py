@@ -0,0 +1,185 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import hashlib
+import tempfile
+from datetime import datetime
+
+import pygame
+from settings import *
+from input_state import input_state
+from jobs import jobs
+
+# Replays
+# With RECORD_REPLAYS on, every new game writes REPLAY_FOLDER/<date>.replay: a JSON header
+# with the random seed the level was built with, then one JSON line per frame with the
+# frame's dt, its input events and the polled keyboard/mouse state (only when it changed),
+# and a last line with a fingerprint of the world when the game was closed.
+# The level takes all of its randomness from the seeded `random` module and steps the
+# world in FIXED_DT steps from the recorded dt, so feeding the same frames back rebuilds
+# the same session. Playing one back runs headless and unthrottled:
+#
+#   python code/replay.py replays/<date>.replay [--times]
+#
+# Jobs (jobs.py) run to the end as soon as they're queued while recording or replaying,
+# as time slicing them would make the world depend on how fast the machine is.
+#
+# Replays start from a new game: a save loaded with F9 or the menu is read from a copy
+# of the saves folder taken when the replay starts, so it has to be the same save.
+
+REPLAY_VERSION = 1
+REPLAY_EXTENSION = '.replay'
+RECORDED_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                   pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.TEXTINPUT)
+REPLAY_FLUSH_FRAMES = 300  # frames between flushes, so a crash keeps most of the recording
+
+def encode_event(event):
+	data = {}
+	for key, value in event.dict.items():
+		if isinstance(value, (int, float, str, bool)):
+			data[key] = value
+		elif isinstance(value, tuple):
+			data[key] = list(value)
+	return [event.type, data]
+
+def decode_event(encoded):
+	event_type, data = encoded
+	return pygame.event.Event(event_type, {key: tuple(value) if isinstance(value, list) else value for key, value in data.items()})
+
+def world_fingerprint(level):
+	"""Short hash of the state a replay has to reproduce (time, progress, inventories,
+	the player, soil, corruption and wards)"""
+	player = level.player
+	state = [
+		(level.time_system.day, level.time_system.hour, level.time_system.minute),
+		level.cleanse_stage, level.cleanse_points,
+		player.money, player.item_inventory, player.seed_inventory, player.crop_inventory, player.ward_count,
+		(round(player.pos.x, 3), round(player.pos.y, 3)),
+		level.energy_system.current_energy, level.health_system.current_health,
+		level.soil_layer.grid,
+		sorted(level.corruption_spread.corrupted_tiles) if level.corruption_spread else [],
+		sorted((ward.grid_x, ward.grid_y) for ward in level.ward_system.ward_sprites),
+	]
+	return hashlib.sha1(json.dumps(state, sort_keys = True).encode()).hexdigest()[:16]
+
+class ReplayRecorder:
+	"""Seeds the random module for a new level and writes its input frame by frame"""
+	def __init__(self, folder = REPLAY_FOLDER):
+		os.makedirs(folder, exist_ok = True)
+		jobs.time_sliced = False  # how far a job gets each frame depends on the machine
+		self.seed = random.randrange(2 ** 32)
+		random.seed(self.seed)
+
+		self.path = os.path.join(folder, datetime.now().strftime('%Y-%m-%d_%H-%M-%S') + REPLAY_EXTENSION)
+		self.file = open(self.path, 'w')
+		self.write({'version': REPLAY_VERSION, 'seed': self.seed, 'fixed_dt': FIXED_DT, 'max_frame_time': MAX_FRAME_TIME})
+		self.last_state = None
+		self.frames = 0
+		print(f"⏺️ Recording replay to {self.path}")
+
+	def write(self, line):
+		self.file.write(json.dumps(line, separators = (',', ':')) + '\n')
+
+	def record(self, dt, events):
+		"""Call with the frame's dt and events right before the level runs them"""
+		frame = [dt, [encode_event(event) for event in events if event.type in RECORDED_EVENTS]]
+		state = input_state.get_state()
+		if state != self.last_state:
+			frame.append(state)
+			self.last_state = state
+		self.write(frame)
+
+		self.frames += 1
+		if self.frames % REPLAY_FLUSH_FRAMES == 0:
+			self.file.flush()
+
+	def close(self, level = None):
+		if self.file.closed:
+			return
+		if level:
+			self.write({'frames': self.frames, 'fingerprint': world_fingerprint(level)})
+		self.file.close()
+		print(f"⏹️ Replay saved: {self.path} ({self.frames} frames)")
+
+class Replay:
+	"""A recording read back: header, frames and (if the game was closed normally) the end fingerprint"""
+	def __init__(self, path):
+		with open(path) as file:
+			self.header = json.loads(file.readline())
+			lines = [json.loads(line) for line in file if line.strip()]
+		self.end = lines.pop() if lines and isinstance(lines[-1], dict) else None
+		self.frames = lines
+
+		if self.header.get('version') != REPLAY_VERSION:
+			print(f"⚠️ Replay version {self.header.get('version')}, this game writes {REPLAY_VERSION}")
+		if (self.header.get('fixed_dt'), self.header.get('max_frame_time')) != (FIXED_DT, MAX_FRAME_TIME):
+			print("⚠️ Replay was recorded with a different FIXED_DT/MAX_FRAME_TIME, it won't play back the same")
+
+	def play(self):
+		"""Rebuild the session without a window or sound, as fast as it runs.
+		Returns the level and the wall time of every frame"""
+		os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+		os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+		pygame.init()
+		pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+		# saving during the replay writes to a throwaway copy of the saves
+		import save_load
+		save_copy = tempfile.mkdtemp(prefix = 'replay_saves_')
+		if os.path.isdir(save_load.SAVE_FOLDER):
+			shutil.copytree(save_load.SAVE_FOLDER, save_copy, dirs_exist_ok = True)
+		save_load.SAVE_FOLDER = save_copy
+
+		from level import Level
+		from display_updates import display_updates
+		input_state.replaying = True
+		jobs.time_sliced = False
+		random.seed(self.header['seed'])
+		level = Level()
+
+		frame_times = []
+		try:
+			for frame in self.frames:
+				start = time.perf_counter()
+				if len(frame) > 2:
+					input_state.set_state(frame[2])
+				level.run(frame[0], [decode_event(event) for event in frame[1]])
+				display_updates.flush()
+				frame_times.append(time.perf_counter() - start)
+		finally:
+			shutil.rmtree(save_copy, ignore_errors = True)
+		return level, frame_times
+
+def main(argv):
+	if not argv or argv[0].startswith('-'):
+		print('usage: python code/replay.py <file.replay> [--times]')
+		return 2
+	replay = Replay(argv[0])
+	level, frame_times = replay.play()
+
+	game_time = sum(frame[0] for frame in replay.frames)
+	wall_time = sum(frame_times)
+	ordered = sorted(frame_times)
+	fingerprint = world_fingerprint(level)
+	print(f"▶️ {len(frame_times)} frames ({game_time:.1f} s of play) replayed in {wall_time:.2f} s ({game_time / wall_time:.1f}x)")
+	if ordered:
+		print(f"⏱️ frame ms: mean {wall_time / len(ordered) * 1000:.2f}, p95 {ordered[int(len(ordered) * 0.95)] * 1000:.2f}, max {ordered[-1] * 1000:.2f}")
+	print(f"🧬 fingerprint {fingerprint}")
+	if replay.end:
+		if replay.end['fingerprint'] == fingerprint:
+			print("✅ Matches the recorded session")
+		else:
+			print(f"❌ Recorded session ended at {replay.end['fingerprint']}")
+			return 1
+	if '--times' in argv:
+		for frame_time in frame_times:
+			print(f"{frame_time * 1000:.3f}")
+	return 0
+
+if __name__ == '__main__':
+	# run from the project root like main.py does
+	os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+	sys.exit(main(sys.argv[1:]))
@@ -1,10 +1,13 @@
 import json
 import os
 from datetime import datetime
+from jobs import jobs
+
+SAVE_FOLDER = "saves"  # replays point this elsewhere so they never touch the real saves
 
 class SaveLoadSystem:
     def __init__(self):
-        self.save_folder = "saves"
+        self.save_folder = SAVE_FOLDER
         self.ensure_save_folder()
     
     def ensure_save_folder(self):
@@ -25,6 +28,8 @@ class SaveLoadSystem:
     
     def save_game(self, level, slot_name="autosave"):
         """Save the entire game state"""
+        # queued world changes (a spread, the day rollover) land before the snapshot
+        jobs.finish_all()
         try:
             save_data = {
                 # Metadata
@@ -105,6 +110,15 @@ class SaveLoadSystem:
             
             print(f"📂 Loading save from {save_data.get('timestamp', 'unknown time')}...")
             
+            # queued work (a spread, a surge, a day rollover) belongs to the world being replaced
+            if level.transition.rollover:
+                level.transition.rollover.cancel()
+                level.transition.rollover = None
+            jobs.clear()
+            if level.corruption_spread:
+                level.corruption_spread.spread_job = None
+            level.corruption_surge.destroy_job = None
+            
             # Load player data
             self._load_player(level.player, save_data['player'])
             
@@ -144,6 +158,9 @@ class SaveLoadSystem:
             level.raining = save_data['weather']['raining']
             level.soil_layer.raining = level.raining
             
+            # the world changed under whatever menu is open
+            level.invalidate_world_snapshot()
+            
             print(f"✅ Game loaded from '{slot_name}'")
             return True
             
@@ -321,6 +338,7 @@ class SaveLoadSystem:
             for x in range(len(soil_layer.grid[0])):
                 if y < len(data['grid']) and x < len(data['grid'][0]):
                     soil_layer.grid[y][x] = data['grid'][y][x]
+                    soil_layer.notify_tile(x, y)
         
         # Recreate soil tiles
         soil_layer.create_soil_tiles()
@@ -390,6 +408,7 @@ class SaveLoadSystem:
         # Clear existing wards
         for ward in ward_system.ward_sprites.sprites():
             ward.kill()
+            ward_system.notify_tile(ward.grid_x, ward.grid_y)
         
         # Recreate wards
         from ward_system import Ward
@@ -399,6 +418,7 @@ class SaveLoadSystem:
             ward.grid_x = ward_data['grid_x']
             ward.grid_y = ward_data['grid_y']
             ward.protection_radius = ward_data['protection_radius']
+            ward_system.notify_tile(ward.grid_x, ward.grid_y)
 
 
 import pygame
\ No newline at end of file
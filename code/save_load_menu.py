@@ -1,15 +1,20 @@
 import pygame
 from settings import *
 from save_load import SaveLoadSystem
+from post_effects import post_effects
+from display_updates import display_updates
+from input_state import input_state
+from ui_widgets import Panel, Label, Button, ListRow, ScrollList
+from text_cache import get_font
 
 class SaveLoadMenu:
     def __init__(self, level, toggle_menu):
         self.level = level
         self.toggle_menu = toggle_menu
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font('font/LycheeSoda.ttf', 24)
-        self.title_font = pygame.font.Font('font/LycheeSoda.ttf', 40)
-        self.small_font = pygame.font.Font('font/LycheeSoda.ttf', 18)
+        self.font = get_font(24)
+        self.title_font = get_font(40)
+        self.small_font = get_font(18)
         
         # Save/Load system
         self.save_system = SaveLoadSystem()
@@ -25,8 +30,6 @@ class SaveLoadMenu:
         
         self.renaming_slot = None  # Track which slot is being renamed
         self.rename_text = ""  
-        # Scroll
-        self.scroll_offset = 0
         
         # UI dimensions
         self.width = 700
@@ -37,10 +40,85 @@ class SaveLoadMenu:
         # Hover tracking
         self.hovered_button = None
         self.hovered_slot = None
+
+        # Save names, read from disk when a list is shown rather than every frame
+        self.saves = []
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Build each screen once; widgets only re-render when hover, text or the save list change"""
+        button_style = {'bg': (50, 50, 50), 'hover_bg': (80, 80, 80), 'border': (150, 150, 150), 'width': 3, 'radius': 10, 'text': (255, 255, 255), 'hover_text': (255, 215, 0)}
+        back_style = dict(button_style, width=2, radius=8, hover_text=(255, 255, 255))
+        new_save_style = dict(back_style, bg=(50, 80, 50), hover_bg=(80, 120, 80), border=(100, 200, 100))
+        self.save_row_style = {'bg': (50, 50, 50), 'hover_bg': (70, 70, 70), 'border': (150, 150, 150), 'width': 2, 'radius': 8}
+        self.load_row_style = {'bg': (50, 50, 70), 'hover_bg': (70, 70, 100), 'border': (100, 150, 200), 'width': 2, 'radius': 8}
+
+        self.background = Panel((self.x, self.y, self.width, self.height), (30, 30, 30), (200, 200, 200), 3, 12)
+        self.back_button = Button((self.x + 20, self.y + self.height - 60, 120, 45), 'Back', self.font, back_style)
+
+        # main
+        self.main_screen = Panel((self.x, self.y, self.width, self.height))
+        self.main_screen.add(Label((SCREEN_WIDTH // 2, self.y + 60), self.title_font, "Save / Load Game", (255, 255, 255)))
+        self.main_buttons = {}
+        for i, (text, button_id) in enumerate([('Save Game', 'save'), ('Load Game', 'load'), ('Back', 'back')]):
+            button_rect = pygame.Rect(SCREEN_WIDTH // 2 - 175, self.y + 150 + i * 90, 350, 70)
+            self.main_buttons[button_id] = self.main_screen.add(Button(button_rect, text, self.font, button_style))
+
+        # save
+        self.save_screen = Panel((self.x, self.y, self.width, self.height))
+        self.save_screen.add(Label((SCREEN_WIDTH // 2, self.y + 40), self.title_font, "Save Game", (255, 255, 255)))
+        self.new_save_button = self.save_screen.add(Button((self.x + 50, self.y + 90, 200, 50), '+ New Save', self.font, new_save_style))
+        self.save_list = self.save_screen.add(ScrollList((self.x + 50, self.y + 180), (self.width - 100, 60), 10, max_rows=4))
+        self.save_screen.add(self.back_button)
+        self.no_saves_label = Label((SCREEN_WIDTH // 2, self.y + 230), self.font, "No saved games", (150, 150, 150))
+
+        # text input, for a new save name or a rename
+        input_rect = (self.x + 270, self.y + 90, 350, 50)
+        self.rename_input = Panel(input_rect, (70, 70, 70), (255, 200, 0), 2, 8)
+        self.rename_input.add(Label((self.x + 280, self.y + 115), self.font, lambda: self.rename_text + "|", (255, 255, 255), 'midleft'))  # Cursor
+        self.rename_input.add(Label((SCREEN_WIDTH // 2, self.y + 155), self.small_font, "Renaming - Press ENTER to save, ESC to cancel", (200, 200, 200)))
+        self.name_input = Panel(input_rect, (70, 70, 70), (255, 215, 0), 2, 8)
+        self.name_input.add(Label((self.x + 280, self.y + 115), self.font, lambda: self.new_save_name + "|", (255, 255, 255), 'midleft'))  # Cursor
+        self.name_input.add(Label((SCREEN_WIDTH // 2, self.y + 155), self.small_font, "Press ENTER to save, ESC to cancel", (200, 200, 200)))
+
+        # load
+        self.load_screen = Panel((self.x, self.y, self.width, self.height))
+        self.load_screen.add(Label((SCREEN_WIDTH // 2, self.y + 40), self.title_font, "Load Game", (255, 255, 255)))
+        self.load_list = self.load_screen.add(ScrollList((self.x + 50, self.y + 100), (self.width - 100, 70), 10, max_rows=5))
+        self.load_screen.add(self.back_button)
+        self.no_loads_label = Label((SCREEN_WIDTH // 2, self.y + 200), self.font, "No saved games found", (150, 150, 150))
+
+    def refresh_saves(self):
+        """Re-read the save folder (rows are rebuilt so timestamps are current)"""
+        self.saves = self.save_system.get_save_files()
+        self.save_list.clear()
+        self.load_list.clear()
+
+    def create_save_row(self, save_name, rect):
+        def bind():
+            i = self.saves.index(save_name)
+            hint_text = "Click to rename" if self.renaming_slot != i else "Renaming..."
+            return ((save_name, (255, 255, 255)), (hint_text, (180, 180, 180)))
+        return ListRow(rect, self.save_row_style, bind, (self.font, self.small_font), (-10, 12))
+
+    def create_load_row(self, save_name, rect):
+        lines = [(save_name, (255, 255, 255))]
+        # Try to get timestamp
+        try:
+            import json
+            filepath = f"saves/{save_name}.json"
+            with open(filepath, 'r') as f:
+                data = json.load(f)
+                timestamp = data.get('timestamp', 'Unknown time')
+                lines.append((f"Saved: {timestamp}", (180, 180, 180)))
+        except:
+            pass
+        lines = tuple(lines)
+        return ListRow(rect, self.load_row_style, lambda: lines, (self.font, self.small_font), (-12, 10))
     
     def handle_input(self, events):
         """Handle menu input"""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = input_state.mouse_pos
         
         for event in events:
             if event.type == pygame.KEYDOWN:
@@ -53,7 +131,6 @@ class SaveLoadMenu:
                         self.toggle_menu()
                     else:
                         self.mode = 'main'
-                        self.scroll_offset = 0
                 
                 # Text input for new save name
                 elif self.typing_new_name:
@@ -71,8 +148,7 @@ class SaveLoadMenu:
                 elif self.renaming_slot is not None:
                     if event.key == pygame.K_RETURN:
                         if self.rename_text.strip():
-                            saves = self.save_system.get_save_files()
-                            old_name = saves[self.renaming_slot]
+                            old_name = self.saves[self.renaming_slot]
                             new_name = self.rename_text.strip()
                             
                             # Rename the file
@@ -82,6 +158,7 @@ class SaveLoadMenu:
                             if os.path.exists(old_path):
                                 os.rename(old_path, new_path)
                                 print(f"âœ… Renamed '{old_name}' to '{new_name}'")
+                                self.refresh_saves()
                         
                         self.renaming_slot = None
                         self.rename_text = ""
@@ -91,13 +168,21 @@ class SaveLoadMenu:
                         if len(self.rename_text) < 20 and event.unicode.isprintable():
                             self.rename_text += event.unicode
 
+            elif event.type == pygame.MOUSEWHEEL:
+                if self.mode == 'save':
+                    self.save_list.scroll_by(-event.y)
+                elif self.mode == 'load':
+                    self.load_list.scroll_by(-event.y)
+
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # Main menu buttons
                 if self.mode == 'main':
                     if self.hovered_button == 'save':
                         self.mode = 'save'
+                        self.refresh_saves()
                     elif self.hovered_button == 'load':
                         self.mode = 'load'
+                        self.refresh_saves()
                     elif self.hovered_button == 'back':
                         self.toggle_menu()
                 
@@ -110,10 +195,9 @@ class SaveLoadMenu:
                         self.mode = 'main'
                     elif self.hovered_slot is not None:
                         # Quick save to existing slot
-                        saves = self.save_system.get_save_files()
-                        if 0 <= self.hovered_slot < len(saves):
+                        if 0 <= self.hovered_slot < len(self.saves):
                             self.renaming_slot = self.hovered_slot
-                            self.rename_text = saves[self.hovered_slot]
+                            self.rename_text = self.saves[self.hovered_slot]
                 
                 # Load menu
                 elif self.mode == 'load':
@@ -121,9 +205,8 @@ class SaveLoadMenu:
                         self.mode = 'main'
                     elif self.hovered_slot is not None:
                         # Load selected slot
-                        saves = self.save_system.get_save_files()
-                        if 0 <= self.hovered_slot < len(saves):
-                            slot_name = saves[self.hovered_slot]
+                        if 0 <= self.hovered_slot < len(self.saves):
+                            slot_name = self.saves[self.hovered_slot]
                             if self.save_system.load_game(self.level, slot_name):
                                 self.toggle_menu()  # Close menu on successful load
     
@@ -136,14 +219,11 @@ class SaveLoadMenu:
     def draw(self):
         """Draw save/load menu"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.display_surface.blit(overlay, (0, 0))
+        post_effects.blend(self.display_surface, (0, 0, 0), 180)
         
         # Menu background
-        menu_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(self.display_surface, (30, 30, 30), menu_rect, border_radius=12)
-        pygame.draw.rect(self.display_surface, (200, 200, 200), menu_rect, 3, border_radius=12)
+        self.background.draw(self.display_surface)
+        display_updates.add(self.background.rect)
         
         if self.mode == 'main':
             self.draw_main_menu()
@@ -154,233 +234,34 @@ class SaveLoadMenu:
     
     def draw_main_menu(self):
         """Draw main save/load menu"""
-        mouse_pos = pygame.mouse.get_pos()
+        self.main_screen.draw(self.display_surface, input_state.mouse_pos)
         self.hovered_button = None
-        
-        # Title
-        title = "Save / Load Game"
-        title_surf = self.title_font.render(title, True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 60))
-        self.display_surface.blit(title_surf, title_rect)
-        
-        # Buttons
-        buttons = [
-            {'text': 'Save Game', 'id': 'save'},
-            {'text': 'Load Game', 'id': 'load'},
-            {'text': 'Back', 'id': 'back'}
-        ]
-        
-        start_y = self.y + 150
-        button_width = 350
-        button_height = 70
-        
-        for i, button in enumerate(buttons):
-            button_rect = pygame.Rect(
-                SCREEN_WIDTH // 2 - button_width // 2,
-                start_y + i * 90,
-                button_width,
-                button_height
-            )
-            
-            is_hovering = button_rect.collidepoint(mouse_pos)
-            if is_hovering:
-                self.hovered_button = button['id']
-            
-            # Button background
-            button_color = (80, 80, 80) if is_hovering else (50, 50, 50)
-            pygame.draw.rect(self.display_surface, button_color, button_rect, border_radius=10)
-            pygame.draw.rect(self.display_surface, (150, 150, 150), button_rect, 3, border_radius=10)
-            
-            # Button text
-            text_color = (255, 215, 0) if is_hovering else (255, 255, 255)
-            text_surf = self.font.render(button['text'], True, text_color)
-            text_rect = text_surf.get_rect(center=button_rect.center)
-            self.display_surface.blit(text_surf, text_rect)
+        for button_id, button in self.main_buttons.items():
+            if button.hovered:
+                self.hovered_button = button_id
     
     def draw_save_menu(self):
         """Draw save slot selection menu"""
-        mouse_pos = pygame.mouse.get_pos()
-        self.hovered_button = None
-        self.hovered_slot = None
-        
-        # Title
-        title = "Save Game"
-        title_surf = self.title_font.render(title, True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 40))
-        self.display_surface.blit(title_surf, title_rect)
-        
-        # New save button
-        new_save_rect = pygame.Rect(self.x + 50, self.y + 90, 200, 50)
-        is_new_hover = new_save_rect.collidepoint(mouse_pos)
-        if is_new_hover:
-            self.hovered_button = 'new_save'
-        
-        new_color = (80, 120, 80) if is_new_hover else (50, 80, 50)
-        pygame.draw.rect(self.display_surface, new_color, new_save_rect, border_radius=8)
-        pygame.draw.rect(self.display_surface, (100, 200, 100), new_save_rect, 2, border_radius=8)
-        
-        new_text = self.font.render('+ New Save', True, (255, 255, 255))
-        new_text_rect = new_text.get_rect(center=new_save_rect.center)
-        self.display_surface.blit(new_text, new_text_rect)
+        self.save_list.sync(self.saves, self.create_save_row)
+        self.save_screen.draw(self.display_surface, input_state.mouse_pos)
 
         if self.renaming_slot is not None:
-            input_rect = pygame.Rect(self.x + 270, self.y + 90, 350, 50)
-            pygame.draw.rect(self.display_surface, (70, 70, 70), input_rect, border_radius=8)
-            pygame.draw.rect(self.display_surface, (255, 200, 0), input_rect, 2, border_radius=8)
-            
-            # Show current rename text
-            input_text = self.rename_text + "|"  # Cursor
-            input_surf = self.font.render(input_text, True, (255, 255, 255))
-            input_surf_rect = input_surf.get_rect(midleft=(input_rect.left + 10, input_rect.centery))
-            self.display_surface.blit(input_surf, input_surf_rect)
-            
-            # Hint
-            hint = "Renaming - Press ENTER to save, ESC to cancel"
-            hint_surf = self.small_font.render(hint, True, (200, 200, 200))
-            hint_rect = hint_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 155))
-            self.display_surface.blit(hint_surf, hint_rect)
-                
+            self.rename_input.draw(self.display_surface)
         # Text input field if typing
         if self.typing_new_name:
-            input_rect = pygame.Rect(self.x + 270, self.y + 90, 350, 50)
-            pygame.draw.rect(self.display_surface, (70, 70, 70), input_rect, border_radius=8)
-            pygame.draw.rect(self.display_surface, (255, 215, 0), input_rect, 2, border_radius=8)
-            
-            # Show current text
-            input_text = self.new_save_name + "|"  # Cursor
-            input_surf = self.font.render(input_text, True, (255, 255, 255))
-            input_surf_rect = input_surf.get_rect(midleft=(input_rect.left + 10, input_rect.centery))
-            self.display_surface.blit(input_surf, input_surf_rect)
-            
-            # Hint
-            hint = "Press ENTER to save, ESC to cancel"
-            hint_surf = self.small_font.render(hint, True, (200, 200, 200))
-            hint_rect = hint_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 155))
-            self.display_surface.blit(hint_surf, hint_rect)
-        
-        # Existing saves
-        saves = self.save_system.get_save_files()
-        
-        saves_y = self.y + 180
-        save_height = 60
-        
-        if not saves:
-            no_saves = "No saved games"
-            no_saves_surf = self.font.render(no_saves, True, (150, 150, 150))
-            no_saves_rect = no_saves_surf.get_rect(center=(SCREEN_WIDTH // 2, saves_y + 50))
-            self.display_surface.blit(no_saves_surf, no_saves_rect)
-        else:
-            for i, save_name in enumerate(saves):
-                slot_rect = pygame.Rect(
-                    self.x + 50,
-                    saves_y + i * (save_height + 10),
-                    self.width - 100,
-                    save_height
-                )
-                
-                is_hovering = slot_rect.collidepoint(mouse_pos)
-                if is_hovering:
-                    self.hovered_slot = i
-                
-                slot_color = (70, 70, 70) if is_hovering else (50, 50, 50)
-                pygame.draw.rect(self.display_surface, slot_color, slot_rect, border_radius=8)
-                pygame.draw.rect(self.display_surface, (150, 150, 150), slot_rect, 2, border_radius=8)
-                
-                # Save name
-                name_surf = self.font.render(save_name, True, (255, 255, 255))
-                name_rect = name_surf.get_rect(midleft=(slot_rect.left + 15, slot_rect.centery - 10))
-                self.display_surface.blit(name_surf, name_rect)
-                
-            
+            self.name_input.draw(self.display_surface)
+        if not self.saves:
+            self.no_saves_label.draw(self.display_surface)
 
-                hint_text = "Click to rename" if self.renaming_slot != i else "Renaming..."
-                hint_surf = self.small_font.render(hint_text, True, (180, 180, 180))
-                hint_rect = hint_surf.get_rect(midleft=(slot_rect.left + 15, slot_rect.centery + 12))
-                self.display_surface.blit(hint_surf, hint_rect)
-        
-        # Back button
-        back_rect = pygame.Rect(self.x + 20, self.y + self.height - 60, 120, 45)
-        is_back_hover = back_rect.collidepoint(mouse_pos)
-        if is_back_hover:
-            self.hovered_button = 'back'
-        
-        back_color = (80, 80, 80) if is_back_hover else (50, 50, 50)
-        pygame.draw.rect(self.display_surface, back_color, back_rect, border_radius=8)
-        pygame.draw.rect(self.display_surface, (150, 150, 150), back_rect, 2, border_radius=8)
-        
-        back_text = self.font.render('Back', True, (255, 255, 255))
-        back_text_rect = back_text.get_rect(center=back_rect.center)
-        self.display_surface.blit(back_text, back_text_rect)
+        self.hovered_button = 'new_save' if self.new_save_button.hovered else 'back' if self.back_button.hovered else None
+        self.hovered_slot = self.saves.index(self.save_list.hovered_key) if self.save_list.hovered_key else None
     
     def draw_load_menu(self):
         """Draw load slot selection menu"""
-        mouse_pos = pygame.mouse.get_pos()
-        self.hovered_button = None
-        self.hovered_slot = None
-        
-        # Title
-        title = "Load Game"
-        title_surf = self.title_font.render(title, True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 40))
-        self.display_surface.blit(title_surf, title_rect)
-        
-        # Get saves
-        saves = self.save_system.get_save_files()
-        
-        saves_y = self.y + 100
-        save_height = 70
-        
-        if not saves:
-            no_saves = "No saved games found"
-            no_saves_surf = self.font.render(no_saves, True, (150, 150, 150))
-            no_saves_rect = no_saves_surf.get_rect(center=(SCREEN_WIDTH // 2, saves_y + 100))
-            self.display_surface.blit(no_saves_surf, no_saves_rect)
-        else:
-            for i, save_name in enumerate(saves):
-                slot_rect = pygame.Rect(
-                    self.x + 50,
-                    saves_y + i * (save_height + 10),
-                    self.width - 100,
-                    save_height
-                )
-                
-                is_hovering = slot_rect.collidepoint(mouse_pos)
-                if is_hovering:
-                    self.hovered_slot = i
-                
-                slot_color = (70, 70, 100) if is_hovering else (50, 50, 70)
-                pygame.draw.rect(self.display_surface, slot_color, slot_rect, border_radius=8)
-                pygame.draw.rect(self.display_surface, (100, 150, 200), slot_rect, 2, border_radius=8)
-                
-                # Save name
-                name_surf = self.font.render(save_name, True, (255, 255, 255))
-                name_rect = name_surf.get_rect(midleft=(slot_rect.left + 15, slot_rect.centery - 12))
-                self.display_surface.blit(name_surf, name_rect)
-                
-                # Try to get timestamp
-                try:
-                    import json
-                    filepath = f"saves/{save_name}.json"
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                        timestamp = data.get('timestamp', 'Unknown time')
-                        
-                        time_surf = self.small_font.render(f"Saved: {timestamp}", True, (180, 180, 180))
-                        time_rect = time_surf.get_rect(midleft=(slot_rect.left + 15, slot_rect.centery + 10))
-                        self.display_surface.blit(time_surf, time_rect)
-                except:
-                    pass
-        
-        # Back button
-        back_rect = pygame.Rect(self.x + 20, self.y + self.height - 60, 120, 45)
-        is_back_hover = back_rect.collidepoint(mouse_pos)
-        if is_back_hover:
-            self.hovered_button = 'back'
-        
-        back_color = (80, 80, 80) if is_back_hover else (50, 50, 50)
-        pygame.draw.rect(self.display_surface, back_color, back_rect, border_radius=8)
-        pygame.draw.rect(self.display_surface, (150, 150, 150), back_rect, 2, border_radius=8)
-        
-        back_text = self.font.render('Back', True, (255, 255, 255))
-        back_text_rect = back_text.get_rect(center=back_rect.center)
-        self.display_surface.blit(back_text, back_text_rect)
\ No newline at end of file
+        self.load_list.sync(self.saves, self.create_load_row)
+        self.load_screen.draw(self.display_surface, input_state.mouse_pos)
+        if not self.saves:
+            self.no_loads_label.draw(self.display_surface)
+
+        self.hovered_button = 'back' if self.back_button.hovered else None
+        self.hovered_slot = self.saves.index(self.load_list.hovered_key) if self.load_list.hovered_key else None
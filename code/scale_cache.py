@@ -0,0 +1,44 @@
+import pygame
+from collections import OrderedDict
+
+SCALE_CACHE_SIZE = 4096  # scaled images kept, least recently used are dropped first
+
+class ScaleCache:
+	"""LRU of scaled copies of sprite images keyed by (image, size), so the camera can draw
+	the world at another scale without rescaling every sprite every frame.
+	Images that get drawn into after being cached need their own invalidation"""
+	def __init__(self, max_size = SCALE_CACHE_SIZE):
+		self.max_size = max_size
+		self.surfaces = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def scaled(self, image, scale):
+		if scale == 1:
+			return image
+		width, height = image.get_size()
+		key = (image, round(width * scale), round(height * scale))
+		surf = self.surfaces.get(key)
+		if surf is not None:
+			self.surfaces.move_to_end(key)
+			self.hits += 1
+			return surf
+
+		self.misses += 1
+		try:
+			surf = pygame.transform.smoothscale(image, key[1:])
+		except ValueError:
+			# smoothscale only takes 24 and 32 bit surfaces
+			surf = pygame.transform.scale(image, key[1:])
+		self.surfaces[key] = surf
+		if len(self.surfaces) > self.max_size:
+			self.surfaces.popitem(last = False)
+		return surf
+
+	def clear(self):
+		self.surfaces.clear()
+
+scale_cache = ScaleCache()
+
+def scaled(image, scale):
+	return scale_cache.scaled(image, scale)
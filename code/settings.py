@@ -4,6 +4,33 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 TILE_SIZE = 64
 
+# the world is drawn at this fraction of the screen and scaled up once per frame
+# (0.75 = 960x540, 0.5 = 640x360 for low-end machines), the UI stays at full resolution
+RENDER_SCALE = 1
+# camera zoom levels cycled with Z (the smallest shows the whole farm)
+ZOOM_LEVELS = (1, 0.5, 0.25)
+# static sprites are baked into chunks this big (world pixels) for every zoom level,
+# keeping at most this many baked pixels (4 bytes each) before dropping the oldest
+STATIC_CHUNK_SIZE = 512
+STATIC_CHUNK_PIXELS = 16 * 1024 * 1024
+# window size, the game still lays out at SCREEN_WIDTH x SCREEN_HEIGHT and is scaled to fit
+WINDOW_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+# the world is simulated in fixed steps of FIXED_DT whatever the display rate, and a slow
+# frame (a stall, loading) is only caught up to MAX_FRAME_TIME instead of all at once
+FIXED_DT = 1 / 60
+MAX_FRAME_TIME = 0.25
+
+# milliseconds of each frame given to queued jobs (see jobs.py)
+JOB_FRAME_BUDGET = 4
+
+# record every new game's input and random seed to REPLAY_FOLDER (python code/replay.py plays one back)
+RECORD_REPLAYS = False
+REPLAY_FOLDER = 'replays'
+
+# minimap pixels per map tile (M toggles it)
+MINIMAP_TILE = 3
+
 # maximum reach distance (pixels) for interacting with tiles
 PLAYER_REACH_LIMIT = 150
 
@@ -33,11 +60,35 @@ LAYERS = {
 	'rain drops': 10
 }
 
+# rain particles spawned per second across the whole map
+# (only the part that can reach the camera is actually simulated)
+RAIN_DENSITY = {
+	'rain': 60,
+	'thunderstorm': 1020
+}
+RAIN_POOL_SIZE = 1500
+
+# night light pools: radius in pixels and the colour at their centre
+LIGHT_SOURCES = {
+	'ward': (192, (150, 210, 255)),
+	'Trader': (256, (255, 200, 140)),
+	'Bed': (224, (255, 190, 120))
+}
+
 APPLE_POS = {
 	'Small': [(18,17), (30,37), (12,50), (30,45), (20,30), (30,10)],
 	'Large': [(30,24), (60,65), (50,50), (16,40),(45,50), (42,70)]
 }
 
+# seconds a watered crop takes to grow from seed to harvest
+GROW_TIMES = {
+	'corn': 60,
+	'tomato': 90,
+	'moon_melon': 120,
+	'pumpkin': 120,
+	'cactus': 180
+}
+
 GROW_SPEED = {
 	'corn': 1,
 	'tomato': 1,
@@ -1,14 +1,16 @@
 import pygame 
 from settings import *
-from support import import_folder
-from sprites import Generic
-from random import randint, choice
+from support import import_folder, import_image_size
+from post_effects import post_effects
+from display_updates import display_updates
+from lighting import Lighting
+from scale_cache import scaled
+import numpy as np
+from random import Random, randrange
 
 class Sky:
 	def __init__(self):
 		self.display_surface = pygame.display.get_surface()
-		self.full_surf = pygame.Surface((SCREEN_WIDTH,SCREEN_HEIGHT))
-		self.start_color = [255,255,255]
 		self.end_color = (38,101,189)
 		self.initialized = False
 		self.corruption_tint = pygame.Color(120, 40, 160)  # purple corruption
@@ -17,16 +19,22 @@ class Sky:
 		self.flash_timer = 0
 		self.flash_rects = None  # ADD THIS - stores where the flash appears
 		self.is_thunderstorm = False  # ADD THIS LINE
+		self.lighting = Lighting()
+		# lightning is drawn once per frame, its own random numbers keep the frame rate
+		# from changing the simulation's random sequence (seeded from it, for replays)
+		self.random = Random(randrange(2 ** 32))
 
 	def create_side_flash_rect(self, side):
 		"""Create thin rectangles for all side lightning flashes"""
-		flash_thickness = randint(80, 120)  # Thin but visible border
+		flash_thickness = self.random.randint(80, 120)  # Thin but visible border
 		
+		# (non-overlapping, so the corners are not blended twice)
 		rects = []
+		side_height = SCREEN_HEIGHT - 2 * flash_thickness
 		# Left side
-		rects.append(pygame.Rect(0, 0, flash_thickness, SCREEN_HEIGHT))
+		rects.append(pygame.Rect(0, flash_thickness, flash_thickness, side_height))
 		# Right side
-		rects.append(pygame.Rect(SCREEN_WIDTH - flash_thickness, 0, flash_thickness, SCREEN_HEIGHT))
+		rects.append(pygame.Rect(SCREEN_WIDTH - flash_thickness, flash_thickness, flash_thickness, side_height))
 		# Top side
 		rects.append(pygame.Rect(0, 0, SCREEN_WIDTH, flash_thickness))
 		# Bottom side
@@ -34,30 +42,9 @@ class Sky:
 
 		return rects
 	
-	def display(self, time_system, corruption_surge=None, is_thunderstorm=False):
-		hour = time_system.hour
-		minute = time_system.minute
-		current_time = hour + minute / 60
-
-		# --- base day/night factor ---
-		if 6 <= current_time < 8:               # sunrise
-			factor = 1 - (current_time - 6) / 2
-		elif 18 <= current_time < 20:            # sunset
-			factor = (current_time - 18) / 2
-		elif current_time >= 20 or current_time < 6:  # night
-			factor = 1
-		else:
-			factor = 0
-
-		# --- base sky color ---
-		day = pygame.Color(255, 255, 255)
-		night = pygame.Color(38, 101, 189)
-
-		r = day.r + (night.r - day.r) * factor
-		g = day.g + (night.g - day.g) * factor
-		b = day.b + (night.b - day.b) * factor
-
-		sky_color = pygame.Color(int(r), int(g), int(b))
+	def display(self, time_system, corruption_surge=None, is_thunderstorm=False, offset=None, zoom=1):
+		# --- base sky color (precomputed per minute of the day) ---
+		sky_color = pygame.Color(self.lighting.sky_color(time_system.hour, time_system.minute))
 
 		# --- corruption surge effect ---
 		if corruption_surge and corruption_surge.is_active():
@@ -67,103 +54,138 @@ class Sky:
 			sky_color.r = min(255, int(sky_color.r + self.corruption_tint.r * pulse_strength))
 			sky_color.g = min(255, int(sky_color.g + self.corruption_tint.g * pulse_strength))
 			sky_color.b = min(255, int(sky_color.b + self.corruption_tint.b * pulse_strength))
+			display_updates.add_full()
 
 			# White lightning during corruption (rare) - sides only
-			if randint(0, 300) == 1:
+			if self.random.randint(0, 300) == 1:
 				self.flash_alpha = 180
 				self.flash_color = (255, 255, 255)
 				# Random side flash
-				side = choice(['left', 'right', 'top', 'bottom'])
+				side = self.random.choice(['left', 'right', 'top', 'bottom'])
 				self.flash_rect = self.create_side_flash_rect(side)
 
 		# --- thunderstorm lightning (yellow, more frequent) - all sides ---
-		if is_thunderstorm and randint(0, 50) == 1:
+		if is_thunderstorm and self.random.randint(0, 50) == 1:
 			self.flash_alpha = 220
 			self.flash_color = (255, 255, 150)  # Yellow flash
 			# Flash on all sides at once
 			self.flash_rects = self.create_side_flash_rect(None)  # CHANGE THIS
 
-		# --- draw base sky ---
-		self.full_surf.fill(sky_color)
-		self.display_surface.blit(
-			self.full_surf, (0, 0),
-			special_flags=pygame.BLEND_RGBA_MULT
-		)
+		# --- draw base sky with the night light pools ---
+		self.lighting.draw(self.display_surface, offset or pygame.Vector2(), sky_color, zoom)
 
 		# --- lightning flash overlay ---
 		if self.flash_alpha > 0:
-			flash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-			if self.flash_rects:
-				# Draw flash on all sides
-				for rect in self.flash_rects:
-					pygame.draw.rect(flash, self.flash_color + (self.flash_alpha,), rect)
-			else:
-				# Fallback to full screen
-				flash.fill(self.flash_color + (self.flash_alpha,))
-			
-			self.display_surface.blit(flash, (0, 0))
+			# Draw flash on all sides (falls back to full screen without rects)
+			post_effects.blend(self.display_surface, self.flash_color, self.flash_alpha, self.flash_rects)
+			for rect in self.flash_rects or [self.display_surface.get_rect()]:
+				display_updates.add(rect)
 			self.flash_alpha -= 15
 
 
 
-class Drop(Generic):
-	def __init__(self, surf, pos, moving, groups, z):
-		
-		# general setup
-		super().__init__(pos, surf, groups, z)
-		self.lifetime = randint(400,500)
-		self.start_time = pygame.time.get_ticks()
-
-		# moving 
-		self.moving = moving
-		if self.moving:
-			self.pos = pygame.math.Vector2(self.rect.topleft)
-			self.direction = pygame.math.Vector2(-3,6)  # CHANGE - more diagonal and faster
-			self.speed = randint(300,400)  # CHANGE - much faster fall speed
-
-	def update(self,dt):
-		# movement
-		if self.moving:
-			self.pos += self.direction * self.speed * dt
-			self.rect.topleft = (round(self.pos.x), round(self.pos.y))
-
-		# timer
-		if pygame.time.get_ticks() - self.start_time >= self.lifetime:
-			self.kill()
+class ParticlePool:
+	"""Fixed-size pool of short-lived particles kept in flat arrays instead of sprites"""
+	def __init__(self, frames, capacity):
+		self.frames = frames
+		self.capacity = capacity
+		self.count = 0
+		self.margin = max(max(frame.get_size()) for frame in frames)
+
+		self.pos = np.zeros((capacity, 2), np.float32)
+		self.vel = np.zeros((capacity, 2), np.float32)
+		self.life = np.zeros(capacity, np.float32)
+		self.frame = np.zeros(capacity, np.int32)
+
+		# how many particles spawn depends on the camera view, so they get their own random
+		# numbers to keep the simulation's random sequence the same (seeded from it, for replays)
+		self.random = np.random.default_rng(randrange(2 ** 32))
+
+	def spawn(self, amount, area, direction = (0, 0), speed = (0, 0), lifetime = (0.4, 0.5)):
+		amount = min(amount, self.capacity - self.count)
+		if amount <= 0:
+			return
+
+		new = slice(self.count, self.count + amount)
+		speeds = self.random.uniform(speed[0], speed[1], amount)
+		self.pos[new, 0] = self.random.uniform(area.left, area.right, amount)
+		self.pos[new, 1] = self.random.uniform(area.top, area.bottom, amount)
+		self.vel[new, 0] = direction[0] * speeds
+		self.vel[new, 1] = direction[1] * speeds
+		self.life[new] = self.random.uniform(lifetime[0], lifetime[1], amount)
+		self.frame[new] = self.random.integers(0, len(self.frames), amount)
+		self.count += amount
+
+	def update(self, dt):
+		if not self.count:
+			return
+
+		n = self.count
+		self.pos[:n] += self.vel[:n] * dt
+		self.life[:n] -= dt
+		alive = self.life[:n] > 0
+		if not alive.all():
+			# compact the survivors to the front of the arrays
+			self.count = int(alive.sum())
+			for array in (self.pos, self.vel, self.life, self.frame):
+				array[:self.count] = array[:n][alive]
+
+	def draw(self, surface, camera):
+		"""Blit every on-screen particle in a single batched call"""
+		if not self.count:
+			return
+
+		width, height = surface.get_size()
+		offset = camera.offset
+		scale = camera.scale
+		frames = [scaled(frame, scale) for frame in self.frames]
+		margin = self.margin
+
+		n = self.count
+		screen_pos = ((self.pos[:n] - (offset.x, offset.y)) * scale).astype(np.int32)
+		visible = ((screen_pos[:, 0] > -margin) & (screen_pos[:, 0] < width) &
+			(screen_pos[:, 1] > -margin) & (screen_pos[:, 1] < height))
+		surface.blits([(frames[index], pos) for pos, index in
+			zip(screen_pos[visible].tolist(), self.frame[:n][visible].tolist())], False)
 
 class Rain:
 	def __init__(self, all_sprites):
 		self.all_sprites = all_sprites
 		self.rain_drops = import_folder('graphics/rain/drops/')
 		self.rain_floor = import_folder('graphics/rain/floor/')
-		self.floor_w, self.floor_h =  pygame.image.load('graphics/world/ground.png').get_size()
+		self.floor_w, self.floor_h = import_image_size('graphics/world/ground.png')
 		self.is_thunderstorm = False  # ADD THIS
 
-	def create_floor(self):
-		Drop(
-			surf = choice(self.rain_floor), 
-			pos = (randint(0,self.floor_w),randint(0,self.floor_h)), 
-			moving = False, 
-			groups = self.all_sprites, 
-			z = LAYERS['rain floor'])
-
-	def create_drops(self):
-		# Faster drops during thunderstorm
-		speed = randint(350, 450) if self.is_thunderstorm else randint(200, 250)
-		direction = pygame.math.Vector2(-3, 6) if self.is_thunderstorm else pygame.math.Vector2(-2, 4)
-		
-		drop = Drop(
-			surf = choice(self.rain_drops), 
-			pos = (randint(0,self.floor_w),randint(0,self.floor_h)), 
-			moving = True, 
-			groups = self.all_sprites, 
-			z = LAYERS['rain drops'])
-		
-		# Override speed and direction for thunderstorm
-		if self.is_thunderstorm:
-			drop.speed = speed
-			drop.direction = direction
-
-	def update(self):
-		self.create_floor()
-		self.create_drops()
\ No newline at end of file
+		# particles (drawn by the camera in their own layers)
+		self.drops = ParticlePool(self.rain_drops, RAIN_POOL_SIZE)
+		self.floor = ParticlePool(self.rain_floor, RAIN_POOL_SIZE // 2)
+		self.spawn_budget = {'drops': 0.0, 'floor': 0.0}
+		self.all_sprites.add_draw_hook(LAYERS['rain floor'], self.floor.draw)
+		self.all_sprites.add_draw_hook(LAYERS['rain drops'], self.drops.draw)
+
+	def spawn_amount(self, kind, area, dt):
+		"""Whole particles to spawn this frame in area, keeping the map-wide density"""
+		map_area = self.floor_w * self.floor_h
+		density = RAIN_DENSITY['thunderstorm' if self.is_thunderstorm else 'rain']
+		self.spawn_budget[kind] += density * dt * area.width * area.height / map_area
+		amount = int(self.spawn_budget[kind])
+		self.spawn_budget[kind] -= amount
+		return amount
+
+	def update(self, dt, raining = True):
+		if raining:
+			map_rect = pygame.Rect(0, 0, self.floor_w, self.floor_h)
+			view = self.all_sprites.view
+
+			# splashes only matter where the camera can see them
+			floor_area = view.clip(map_rect)
+			self.floor.spawn(self.spawn_amount('floor', floor_area, dt), floor_area)
+
+			# drops travel down-left, so they also start above and right of the view
+			speed = (350, 450) if self.is_thunderstorm else (300, 400)
+			reach = pygame.Vector2(-3, 6) * speed[1] * 0.5
+			drop_area = pygame.Rect(view.left, view.top - reach.y, view.width - reach.x, view.height + reach.y).clip(map_rect)
+			self.drops.spawn(self.spawn_amount('drops', drop_area, dt), drop_area, (-3, 6), speed)
+
+		self.floor.update(dt)
+		self.drops.update(dt)
@@ -18,26 +18,27 @@ class WaterTile(pygame.sprite.Sprite):
 		self.rect = self.image.get_rect(topleft = pos)
 		self.z = LAYERS['soil water']
 
+# growth frames per plant type, shared by every plant of that type (they're only read,
+# and a shared surface also keeps its particle silhouette cached in sprites.py)
+plant_frames = {}
+
+def get_plant_frames(plant_type):
+	if plant_type not in plant_frames:
+		plant_frames[plant_type] = import_folder(f'graphics/fruit/{plant_type}')
+	return plant_frames[plant_type]
+
 class Plant(pygame.sprite.Sprite):
 	def __init__(self, plant_type, groups, soil, check_watered):
 		super().__init__(groups)
 		
 		# setup
 		self.plant_type = plant_type
-		self.frames = import_folder(f'graphics/fruit/{plant_type}')
+		self.frames = get_plant_frames(plant_type)
 		self.soil = soil
 		self.check_watered = check_watered
 
 		# Time-based growing (in seconds)
-		self.growth_times = {
-			'corn': 60,        # 1 minute
-			'tomato': 90,      # 1.5 minutes
-			'moon_melon': 120, # 2 minutes
-			'pumpkin': 120,    # 2 minutes
-			'cactus': 180      # 3 minutes
-		}
-		
-		self.total_grow_time = self.growth_times.get(plant_type, 60)
+		self.total_grow_time = GROW_TIMES.get(plant_type, 60)
 		self.current_grow_time = 0
 		self.max_age = len(self.frames) - 1
 		self.harvestable = False
@@ -139,6 +140,9 @@ class SoilLayer:
 		
 		self.raining = False
 
+		# called with (grid x, grid y) whenever a cell's flags change (e.g. the minimap)
+		self.tile_listeners = []
+
 		# graphics
 		self.soil_surfs = import_folder_dict('graphics/soil/')
 		self.water_surfs = import_folder('graphics/soil_water')
@@ -148,10 +152,10 @@ class SoilLayer:
 		self.create_hit_rects()
 
 		# sounds
-		self.hoe_sound = pygame.mixer.Sound('audio/hoe.wav')
+		self.hoe_sound = import_sound('audio/hoe.wav')
 		self.hoe_sound.set_volume(0.1)
 
-		self.plant_sound = pygame.mixer.Sound('audio/plant.wav') 
+		self.plant_sound = import_sound('audio/plant.wav') 
 		self.plant_sound.set_volume(0.2)
 
 	def create_soil_grid(self, map_path=None):
@@ -163,9 +167,9 @@ class SoilLayer:
 			tmx_data = load_pygame(map_path)
 			
 			# Get map dimensions
-			ground = pygame.image.load('graphics/world/ground.png')
-			h_tiles = ground.get_width() // TILE_SIZE
-			v_tiles = ground.get_height() // TILE_SIZE
+			ground_w, ground_h = import_image_size('graphics/world/ground.png')
+			h_tiles = ground_w // TILE_SIZE
+			v_tiles = ground_h // TILE_SIZE
 			
 			# Initialize empty grid
 			self.grid = [[[] for col in range(h_tiles)] for row in range(v_tiles)]
@@ -198,11 +202,15 @@ class SoilLayer:
 			
 		except Exception as e:
 			# Create empty grid as fallback
-			ground = pygame.image.load('graphics/world/ground.png')
-			h_tiles = ground.get_width() // TILE_SIZE
-			v_tiles = ground.get_height() // TILE_SIZE
+			ground_w, ground_h = import_image_size('graphics/world/ground.png')
+			h_tiles = ground_w // TILE_SIZE
+			v_tiles = ground_h // TILE_SIZE
 			self.grid = [[[] for col in range(h_tiles)] for row in range(v_tiles)]
 
+	def notify_tile(self, x, y):
+		for listener in self.tile_listeners:
+			listener(x, y)
+
 	def create_hit_rects(self):
 		self.hit_rects = []
 		for index_row, row in enumerate(self.grid):
@@ -223,6 +231,7 @@ class SoilLayer:
 
 				if 'F' in self.grid[y][x]:
 					self.grid[y][x].append('X')
+					self.notify_tile(x, y)
 					self.create_soil_tiles()
 					if self.raining:
 						self.water_all()
@@ -234,6 +243,7 @@ class SoilLayer:
 				x = soil_sprite.rect.x // TILE_SIZE
 				y = soil_sprite.rect.y // TILE_SIZE
 				self.grid[y][x].append('W')
+				self.notify_tile(x, y)
 
 				pos = soil_sprite.rect.topleft
 				surf = choice(self.water_surfs)
@@ -244,6 +254,7 @@ class SoilLayer:
 			for index_col, cell in enumerate(row):
 				if 'X' in cell and 'W' not in cell:
 					cell.append('W')
+					self.notify_tile(index_col, index_row)
 					x = index_col * TILE_SIZE
 					y = index_row * TILE_SIZE
 					WaterTile((x,y), choice(self.water_surfs), [self.all_sprites, self.water_sprites])
@@ -255,10 +266,11 @@ class SoilLayer:
 			sprite.kill()
 
 		# clean up the grid
-		for row in self.grid:
-			for cell in row:
+		for index_row, row in enumerate(self.grid):
+			for index_col, cell in enumerate(row):
 				if 'W' in cell:
 					cell.remove('W')
+					self.notify_tile(index_col, index_row)
 
 	def check_watered(self, pos):
 		x = pos[0] // TILE_SIZE
@@ -277,6 +289,7 @@ class SoilLayer:
 				if 'X' in self.grid[y][x] and 'P' not in self.grid[y][x]:
 					self.plant_sound.play()
 					self.grid[y][x].append('P')
+					self.notify_tile(x, y)
 					Plant(seed, [self.all_sprites, self.plant_sprites, self.collision_sprites], soil_sprite, self.check_watered)
 					return True  # Planting successful
 				else:
@@ -351,6 +364,7 @@ class SoilLayer:
 						self.grid[y][x].append('X')
 					if 'W' in saved_grid[y][x] and 'W' not in self.grid[y][x]:
 						self.grid[y][x].append('W')
+					self.notify_tile(x, y)
 		
 		# Recreate soil tiles
 		self.create_soil_tiles()
@@ -383,6 +397,7 @@ class SoilLayer:
 				# Mark as planted
 				if 'P' not in self.grid[grid_y][grid_x]:
 					self.grid[grid_y][grid_x].append('P')
+					self.notify_tile(grid_x, grid_y)
 				
 				# Create plant
 				plant = Plant(
@@ -1,7 +1,10 @@
 import pygame
+import weakref
 from settings import *
 from random import randint, choice
-from timer import Timer
+from timer import Timer, sim_clock
+from support import import_image, import_sound
+from animation import animation_clock
 
 class Generic(pygame.sprite.Sprite):
 	def __init__(self, pos, surf, groups, z = LAYERS['main']):
@@ -20,47 +23,70 @@ class Interaction(Generic):
 class Water(Generic):
 	def __init__(self, pos, frames, groups):
 
-		#animation setup
-		self.frames = frames
-		self.frame_index = 0
+		#animation setup (all water tiles share one animation on the clock)
+		self.animation = animation_clock.get('water', frames, 5)
 
 		# sprite setup
 		super().__init__(
 				pos = pos, 
-				surf = self.frames[self.frame_index], 
+				surf = self.animation.frame, 
 				groups = groups, 
 				z = LAYERS['water']) 
 
-	def animate(self,dt):
-		self.frame_index += 5 * dt
-		if self.frame_index >= len(self.frames):
-			self.frame_index = 0
-		self.image = self.frames[int(self.frame_index)]
+	@property
+	def image(self):
+		return self.animation.frame
 
-	def update(self,dt):
-		self.animate(dt)
+	@image.setter
+	def image(self, surf):
+		pass  # the frame always comes from the shared animation
 
 class WildFlower(Generic):
 	def __init__(self, pos, surf, groups):
 		super().__init__(pos, surf, groups)
 		self.hitbox = self.rect.copy().inflate(-20,-self.rect.height * 0.9)
 
-class Particle(Generic):
-	def __init__(self, pos, surf, groups, z, duration = 200):
-		super().__init__(pos, surf, groups, z)
-		self.start_time = pygame.time.get_ticks()
-		self.duration = duration
+# white silhouettes, built once per source surface
+silhouettes = weakref.WeakKeyDictionary()
 
-		# white surface 
-		mask_surf = pygame.mask.from_surface(self.image)
+def get_silhouette(surf):
+	if surf not in silhouettes:
+		mask_surf = pygame.mask.from_surface(surf)
 		new_surf = mask_surf.to_surface()
 		new_surf.set_colorkey((0,0,0))
-		self.image = new_surf
+		silhouettes[surf] = new_surf
+	return silhouettes[surf]
 
-	def update(self,dt):
-		current_time = pygame.time.get_ticks()
-		if current_time - self.start_time > self.duration:
-			self.kill()
+class Particle(Generic):
+	# finished particles waiting to be reused by spawn()
+	pool = []
+	pool_size = 64
+
+	def __init__(self, pos, surf, groups, z, duration = 200):
+		super().__init__(pos, get_silhouette(surf), groups, z)
+		self.duration = duration
+		sim_clock.schedule(duration, self.finish)
+
+	@classmethod
+	def spawn(cls, pos, surf, groups, z, duration = 200):
+		"""Like Particle(...), but reuses a finished particle when one is free"""
+		if not cls.pool:
+			return cls(pos, surf, groups, z, duration)
+
+		particle = cls.pool.pop()
+		particle.image = get_silhouette(surf)
+		particle.rect = particle.image.get_rect(topleft = pos)
+		particle.hitbox = particle.rect.copy().inflate(-particle.rect.width * 0.2, -particle.rect.height * 0.75)
+		particle.z = z
+		particle.duration = duration
+		particle.add(groups)
+		sim_clock.schedule(duration, particle.finish)
+		return particle
+
+	def finish(self):
+		self.kill()
+		if len(Particle.pool) < Particle.pool_size:
+			Particle.pool.append(self)
 
 class Tree(Generic):
 	def __init__(self, pos, surf, groups, name, player_add):
@@ -70,10 +96,10 @@ class Tree(Generic):
 		self.health = 5
 		self.alive = True
 		stump_path = f'graphics/stumps/{"small" if name == "Small" else "large"}.png'
-		self.stump_surf = pygame.image.load(stump_path).convert_alpha()
+		self.stump_surf = import_image(stump_path)
 
 		# apples
-		self.apple_surf = pygame.image.load('graphics/fruit/apple.png')
+		self.apple_surf = import_image('graphics/fruit/apple.png')
 		self.apple_pos = APPLE_POS[name]
 		self.apple_sprites = pygame.sprite.Group()
 		self.create_fruit()
@@ -81,7 +107,7 @@ class Tree(Generic):
 		self.player_add = player_add
 
 		# sounds
-		self.axe_sound = pygame.mixer.Sound('audio/axe.mp3')
+		self.axe_sound = import_sound('audio/axe.mp3')
 
 	def damage(self):
 		
@@ -94,7 +120,7 @@ class Tree(Generic):
 		# remove an apple
 		if len(self.apple_sprites.sprites()) > 0:
 			random_apple = choice(self.apple_sprites.sprites())
-			Particle(
+			Particle.spawn(
 				pos = random_apple.rect.topleft,
 				surf = random_apple.image, 
 				groups = self.groups()[0], 
@@ -104,7 +130,7 @@ class Tree(Generic):
 
 	def check_death(self):
 		if self.health <= 0:
-			Particle(self.rect.topleft, self.image, self.groups()[0], LAYERS['fruit'], 300)
+			Particle.spawn(self.rect.topleft, self.image, self.groups()[0], LAYERS['fruit'], 300)
 			self.image = self.stump_surf
 			self.rect = self.image.get_rect(midbottom = self.rect.midbottom)
 			self.hitbox = self.rect.copy().inflate(-10,-self.rect.height * 0.6)
@@ -1,11 +1,13 @@
 import pygame
 from settings import *
+from text_cache import get_font, render_text
+from display_updates import display_updates
 
 class StageCutscene:
 	def __init__(self, stage):
 		self.display_surface = pygame.display.get_surface()
-		self.font_large = pygame.font.Font('font/LycheeSoda.ttf', 36)
-		self.font_small = pygame.font.Font('font/LycheeSoda.ttf', 20)
+		self.font_large = get_font(36)
+		self.font_small = get_font(20)
 		
 		# Define scripts for each stage
 		self.scripts = {
@@ -49,6 +51,7 @@ class StageCutscene:
 		self.total_duration = 0
 		self.finished = False
 		self.skipped = False
+		self.drawn_key = None  # (scene, alpha) last reported to the display
 		
 		# Calculate total duration
 		for scene in self.script:
@@ -80,16 +83,19 @@ class StageCutscene:
 		total_height = len(lines) * font.get_linesize()
 		y_offset = center_pos[1] - total_height // 2
 		
+		drawn_rect = None
 		for line in lines:
-			text_surf = font.render(line, True, color)
+			text_surf = render_text(font, line, color)
 			text_rect = text_surf.get_rect(center=(center_pos[0], y_offset))
 			self.display_surface.blit(text_surf, text_rect)
+			drawn_rect = drawn_rect.union(text_rect) if drawn_rect else text_rect
 			y_offset += font.get_linesize()
+		return drawn_rect
 	
 	def draw_skip_button(self):
 		"""Draw skip button in bottom right"""
 		skip_text = "Press SPACE to skip"
-		skip_surf = self.font_small.render(skip_text, True, (200, 200, 200))
+		skip_surf = render_text(self.font_small, skip_text, (200, 200, 200))
 		skip_rect = skip_surf.get_rect(bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20))
 		self.display_surface.blit(skip_surf, skip_rect)
 	
@@ -151,7 +157,15 @@ class StageCutscene:
 		# Draw text with alpha
 		color = (alpha, alpha, alpha)
 		center_pos = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-		self.draw_text_multiline(current["content"], self.font_large, color, center_pos)
+		text_rect = self.draw_text_multiline(current["content"], self.font_large, color, center_pos)
+		
+		# Only the text changes while a scene fades, and nothing during its hold
+		key = (self.current_scene, alpha)
+		if key != self.drawn_key:
+			if not self.drawn_key or self.drawn_key[0] != self.current_scene:
+				display_updates.add_full()
+			display_updates.add(text_rect)
+			self.drawn_key = key
 		
 		# Draw skip button
 		self.draw_skip_button()
@@ -0,0 +1,117 @@
+import time
+import weakref
+import pygame
+from collections import OrderedDict
+from settings import *
+from scale_cache import scaled
+
+# premultiplied copies of (scaled) sprite images, so baked chunks blend like separate blits
+premultiplied = weakref.WeakKeyDictionary()
+
+def get_premultiplied(image):
+	"""Per-pixel alpha copy of image with its colour premultiplied (None if it's invisible)"""
+	if image not in premultiplied:
+		alpha = image.get_alpha()
+		if alpha == 0:
+			premultiplied[image] = None
+		else:
+			surf = image.convert_alpha()
+			if alpha is not None and alpha < 255 and not image.get_flags() & pygame.SRCALPHA:
+				# surface-wide alpha isn't carried over by convert_alpha
+				surf.fill((255, 255, 255, alpha), special_flags = pygame.BLEND_RGBA_MULT)
+			premultiplied[image] = surf.premul_alpha()
+	return premultiplied[image]
+
+class StaticChunks:
+	"""Sprites that never change (plain Generic tiles, buildings, decorations) baked into
+	STATIC_CHUNK_SIZE chunks per band of layers and per camera scale. A band is a run of
+	layers with nothing else drawn between them, so it can be drawn as one surface.
+	Chunks are baked when first seen and rebaked when a sprite in them is added or removed"""
+	def __init__(self):
+		self.size = STATIC_CHUNK_SIZE
+		self.index = {}  # (chunk x, chunk y) -> sprites overlapping the chunk
+		self.chunks = OrderedDict()  # (band, scale, chunk x, chunk y) -> surface or None
+		self.pixels = 0  # pixels held by the baked chunks, kept under STATIC_CHUNK_PIXELS
+
+		self.bakes = 0
+		self.bake_time = 0
+
+	def chunk_keys(self, rect):
+		for chunk_y in range(rect.top // self.size, (rect.bottom - 1) // self.size + 1):
+			for chunk_x in range(rect.left // self.size, (rect.right - 1) // self.size + 1):
+				yield chunk_x, chunk_y
+
+	def add(self, sprite):
+		for key in self.chunk_keys(sprite.rect):
+			self.index.setdefault(key, set()).add(sprite)
+			self.invalidate(key)
+
+	def remove(self, sprite):
+		for key in self.chunk_keys(sprite.rect):
+			sprites = self.index.get(key)
+			if sprites and sprite in sprites:
+				sprites.discard(sprite)
+				self.invalidate(key)
+
+	def invalidate(self, chunk_key):
+		for key in [key for key in self.chunks if key[2:] == chunk_key]:
+			self.forget(key)
+
+	def forget(self, key):
+		chunk = self.chunks.pop(key)
+		if chunk:
+			self.pixels -= chunk.get_width() * chunk.get_height()
+
+	def clear(self):
+		self.chunks.clear()
+		self.pixels = 0
+
+	def bake(self, band, scale, chunk_key, order):
+		"""Premultiplied surface of the band's sprites in one chunk, None if there are none"""
+		start = time.perf_counter()
+		sprites = [sprite for sprite in self.index.get(chunk_key, ()) if sprite.z in band]
+		surf = None
+		if sprites:
+			size = round(self.size * scale)
+			surf = pygame.Surface((size, size), pygame.SRCALPHA)
+			left, top = chunk_key[0] * self.size, chunk_key[1] * self.size
+			for sprite in sorted(sprites, key = lambda sprite: (sprite.z, sprite.rect.centery, order[sprite])):
+				image = get_premultiplied(scaled(sprite.image, scale))
+				if image:
+					pos = (round((sprite.rect.left - left) * scale), round((sprite.rect.top - top) * scale))
+					surf.blit(image, pos, special_flags = pygame.BLEND_PREMULTIPLIED)
+
+		self.bakes += 1
+		self.bake_time += time.perf_counter() - start
+		return surf
+
+	def draw_all(self, surface, scale, band, order):
+		"""Draw the whole band onto surface at scale without keeping the chunks (e.g. the minimap)"""
+		for chunk_key in self.index:
+			chunk = self.bake(band, scale, chunk_key, order)
+			if chunk:
+				pos = (round(chunk_key[0] * self.size * scale), round(chunk_key[1] * self.size * scale))
+				surface.blit(chunk, pos, special_flags = pygame.BLEND_PREMULTIPLIED)
+
+	def draw(self, surface, camera, band, order):
+		"""Blit the band's chunks that overlap the camera view"""
+		scale = camera.scale
+		for chunk_x, chunk_y in self.chunk_keys(camera.view):
+			if (chunk_x, chunk_y) not in self.index:
+				continue
+			key = (band, scale, chunk_x, chunk_y)
+			if key in self.chunks:
+				self.chunks.move_to_end(key)
+			else:
+				chunk = self.bake(band, scale, (chunk_x, chunk_y), order)
+				self.chunks[key] = chunk
+				if chunk:
+					self.pixels += chunk.get_width() * chunk.get_height()
+					# drop the least recently drawn chunks (never the one just baked)
+					while self.pixels > STATIC_CHUNK_PIXELS and next(iter(self.chunks)) != key:
+						self.forget(next(iter(self.chunks)))
+
+			chunk = self.chunks[key]
+			if chunk:
+				pos = camera.to_render((chunk_x * self.size, chunk_y * self.size))
+				surface.blit(chunk, pos, special_flags = pygame.BLEND_PREMULTIPLIED)
@@ -1,9 +1,28 @@
 from os import walk
 import pygame
+from asset_bundle import get_bundle, normalize_path
+
+# surfaces already decoded and converted by the AssetPreloader. Callers get copies, as
+# some draw into or set the alpha of what they imported
+preloaded_images = {}
+preloaded_folders = {}
+preloaded_sounds = {}
+
+def store_preloaded(images, folders, sounds):
+	preloaded_images.update(images)
+	preloaded_folders.update(folders)
+	preloaded_sounds.update(sounds)
 
 def import_folder(path):
 	surface_list = []
 
+	if normalize_path(path) in preloaded_folders:
+		return [preloaded_images[image].copy() for image in preloaded_folders[normalize_path(path)]]
+
+	bundle = get_bundle()
+	if bundle and bundle.has_folder(path):
+		return [surf.convert_alpha() for _, surf in bundle.load_folder(path)]
+
 	for _, __, img_files in walk(path):
 		for image in img_files:
 			full_path = path + '/' + image
@@ -15,10 +34,49 @@ def import_folder(path):
 def import_folder_dict(path):
 	surface_dict = {}
 
+	if normalize_path(path) in preloaded_folders:
+		return {image.split('/')[-1].split('.')[0]: preloaded_images[image].copy() for image in preloaded_folders[normalize_path(path)]}
+
+	bundle = get_bundle()
+	if bundle and bundle.has_folder(path):
+		return {name.split('.')[0]: surf.convert_alpha() for name, surf in bundle.load_folder(path)}
+
 	for _, __, img_files in walk(path):
 		for image in img_files:
 			full_path = path + '/' + image
 			image_surf = pygame.image.load(full_path).convert_alpha()
 			surface_dict[image.split('.')[0]] = image_surf
 
-	return surface_dict
\ No newline at end of file
+	return surface_dict
+
+def import_image(path, alpha = True):
+	"""Load a single image, from the asset bundle when it has it"""
+	if alpha and normalize_path(path) in preloaded_images:
+		return preloaded_images[normalize_path(path)].copy()
+
+	bundle = get_bundle()
+	if bundle and bundle.has_image(path):
+		surf = bundle.load_image(path)
+	else:
+		surf = pygame.image.load(path)
+	return surf.convert_alpha() if alpha else surf.convert()
+
+def import_image_size(path):
+	"""Size of an image without decoding it when it is bundled"""
+	bundle = get_bundle()
+	if bundle and bundle.has_image(path):
+		return bundle.image_size(path)
+	return pygame.image.load(path).get_size()
+
+def import_sound(path):
+	"""Load a sound effect, from the asset bundle when it has it"""
+	# each caller sets its own volume, so a preloaded sound is only handed out once
+	if normalize_path(path) in preloaded_sounds:
+		return preloaded_sounds.pop(normalize_path(path))
+
+	bundle = get_bundle()
+	if bundle and bundle.has_sound(path):
+		sound = bundle.load_sound(path)
+		if sound:
+			return sound
+	return pygame.mixer.Sound(path)
@@ -0,0 +1,50 @@
+import pygame
+from collections import OrderedDict
+
+FONT_PATH = 'font/LycheeSoda.ttf'
+TEXT_CACHE_SIZE = 512  # rendered strings kept, least recently used are dropped first
+
+fonts = {}
+
+def get_font(size, path = FONT_PATH):
+	"""Shared Font for (file, size), falling back to pygame's default font"""
+	key = (path, size)
+	if key not in fonts:
+		try:
+			fonts[key] = pygame.font.Font(path, size)
+		except (OSError, FileNotFoundError):
+			fonts[key] = pygame.font.Font(None, size)
+	return fonts[key]
+
+class TextCache:
+	"""LRU of rendered text keyed by (font, text, colour, antialias).
+	Fonts come from get_font, so one Font object stands for one (file, size).
+	The surfaces are shared: fade them with radial_overlay.faded instead of set_alpha"""
+	def __init__(self, max_size = TEXT_CACHE_SIZE):
+		self.max_size = max_size
+		self.surfaces = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def render(self, font, text, color, antialias = True):
+		key = (font, text, tuple(pygame.Color(color)), antialias)
+		surf = self.surfaces.get(key)
+		if surf is not None:
+			self.surfaces.move_to_end(key)
+			self.hits += 1
+			return surf
+
+		self.misses += 1
+		surf = font.render(text, antialias, color)
+		self.surfaces[key] = surf
+		if len(self.surfaces) > self.max_size:
+			self.surfaces.popitem(last = False)
+		return surf
+
+	def clear(self):
+		self.surfaces.clear()
+
+text_cache = TextCache()
+
+def render_text(font, text, color, antialias = True):
+	return text_cache.render(font, text, color, antialias)
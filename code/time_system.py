@@ -1,11 +1,13 @@
 import pygame
 from settings import *
+from hud import Badge
+from text_cache import get_font
 
 class TimeSystem:
     def __init__(self):
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font('font/LycheeSoda.ttf', 20)
-        self.large_font = pygame.font.Font('font/LycheeSoda.ttf', 24)
+        self.font = get_font(20)
+        self.large_font = get_font(24)
         
         # Time settings
         self.day = 1
@@ -20,32 +22,41 @@ class TimeSystem:
         self.is_night = False
         self.night_start_hour = 20  # 8 PM
         self.night_end_hour = 6     # 6 AM
+
+        # HUD badges (top-left), re-rendered only when their text changes
+        padding = 10
+        self.day_badge = Badge((padding, padding), self.large_font, self.get_day_string, 'White')
+        self.time_badge = Badge((padding, 0), self.font, self.get_time_string, 'White')
+        self.period_badge = Badge((padding, 0), self.font, self.get_time_period, self.get_period_color)
         
     def update(self, dt, corruption_surge=None):
         """Update time progression"""
         self.time_accumulator += dt
         
-        # Progress time when accumulator reaches threshold
-        if self.time_accumulator >= self.seconds_per_minute:
-            self.time_accumulator = 0
-            self.minute += 1
+        # Progress one minute per threshold reached, keeping the remainder
+        while self.time_accumulator >= self.seconds_per_minute:
+            self.time_accumulator -= self.seconds_per_minute
+            self.advance_minute(corruption_surge)
+
+    def advance_minute(self, corruption_surge=None):
+        self.minute += 1
+        
+        # Handle minute overflow
+        if self.minute >= 60:
+            self.minute = 0
+            self.hour += 1
             
-            # Handle minute overflow
-            if self.minute >= 60:
-                self.minute = 0
-                self.hour += 1
-                
-                # Try to trigger corruption surge each hour (passing current day)
-                if corruption_surge:
-                    corruption_surge.try_trigger_surge(self.hour, self.day)
-                
-                # Handle hour overflow (new day)
-                if self.hour >= 24:
-                    self.hour = 0
-                    self.day += 1
+            # Try to trigger corruption surge each hour (passing current day)
+            if corruption_surge:
+                corruption_surge.try_trigger_surge(self.hour, self.day)
             
-            # Update day/night status
-            self.update_day_night()
+            # Handle hour overflow (new day)
+            if self.hour >= 24:
+                self.hour = 0
+                self.day += 1
+        
+        # Update day/night status
+        self.update_day_night()
     
     def update_day_night(self):
         """Check if it's currently night time"""
@@ -77,46 +88,17 @@ class TimeSystem:
         else:
             return "Night"
     
+    def get_period_color(self):
+        return (255, 255, 150) if not self.is_night else (150, 150, 255)
+
     def draw(self):
         """Draw time and day display in top-left corner"""
-        # Position settings
-        padding = 10
-        x_pos = padding
-        y_pos = padding
-        
-        # Draw day
-        day_text = self.get_day_string()
-        day_surf = self.large_font.render(day_text, False, 'White')
-        day_rect = day_surf.get_rect(topleft=(x_pos, y_pos))
-        
-        # Background for day
-        day_bg_rect = day_rect.inflate(10, 6)
-        pygame.draw.rect(self.display_surface, 'Black', day_bg_rect, 0, 4)
-        pygame.draw.rect(self.display_surface, 'White', day_bg_rect, 2, 4)
-        self.display_surface.blit(day_surf, day_rect)
-        
-        # Draw time
-        time_text = self.get_time_string()
-        time_surf = self.font.render(time_text, False, 'White')
-        time_rect = time_surf.get_rect(topleft=(x_pos, day_bg_rect.bottom + 5))
-        
-        # Background for time
-        time_bg_rect = time_rect.inflate(10, 6)
-        pygame.draw.rect(self.display_surface, 'Black', time_bg_rect, 0, 4)
-        pygame.draw.rect(self.display_surface, 'White', time_bg_rect, 2, 4)
-        self.display_surface.blit(time_surf, time_rect)
-        
-        # Draw time period (Morning/Afternoon/Evening/Night)
-        period_text = self.get_time_period()
-        period_color = (255, 255, 150) if not self.is_night else (150, 150, 255)
-        period_surf = self.font.render(period_text, False, period_color)
-        period_rect = period_surf.get_rect(topleft=(x_pos, time_bg_rect.bottom + 5))
-        
-        # Background for period
-        period_bg_rect = period_rect.inflate(10, 6)
-        pygame.draw.rect(self.display_surface, 'Black', period_bg_rect, 0, 4)
-        pygame.draw.rect(self.display_surface, period_color, period_bg_rect, 2, 4)
-        self.display_surface.blit(period_surf, period_rect)
+        self.day_badge.draw(self.display_surface)
+        self.time_badge.pos = (self.time_badge.pos[0], self.day_badge.rect.bottom + 5)
+        self.time_badge.draw(self.display_surface)
+        # Time period (Morning/Afternoon/Evening/Night)
+        self.period_badge.pos = (self.period_badge.pos[0], self.time_badge.rect.bottom + 5)
+        self.period_badge.draw(self.display_surface)
     
     def advance_to_next_day(self):
         """Advance time to the start of next day (used when sleeping)"""
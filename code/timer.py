@@ -1,23 +1,92 @@
-import pygame 
+import pygame
+from heapq import heappush, heappop
+from itertools import count
+
+class ScheduledCall:
+	"""A callback waiting in the sim clock's queue, cancel() drops it"""
+	__slots__ = ('clock', 'due', 'callback', 'interval', 'cancelled')
+
+	def __init__(self, clock, due, callback, interval):
+		self.clock = clock
+		self.due = due
+		self.callback = callback
+		self.interval = interval
+		self.cancelled = False
+
+	def cancel(self):
+		if not self.cancelled:
+			self.cancelled = True
+			self.clock.cancelled += 1
+
+	def remaining(self):
+		"""Milliseconds of game time until it runs"""
+		return max(0.0, self.due - self.clock.ticks)
+
+class SimClock:
+	"""Game time in milliseconds. It only moves with the simulation steps, so it stops
+	while menus are open and runs the same at any frame rate.
+	Callbacks scheduled on it run from advance() once their time comes, in time order,
+	so a step only costs anything for the timers that actually fire"""
+	def __init__(self):
+		self.ticks = 0.0
+		self.queue = []  # heap of (due, order, call)
+		self.order = count()  # keeps calls due at the same time in scheduling order
+
+		# shown in the perf overlay
+		self.fired = 0
+		self.cancelled = 0
+
+	def advance(self, dt):
+		self.ticks += dt * 1000
+		queue = self.queue
+		while queue and queue[0][0] <= self.ticks:
+			due, order, call = heappop(queue)
+			if call.cancelled:
+				self.cancelled -= 1
+				continue
+			if call.interval:
+				call.due = due + call.interval
+				heappush(queue, (call.due, next(self.order), call))
+			else:
+				call.cancelled = True  # done, so a late cancel() is a no-op
+			self.fired += 1
+			call.callback()
+
+	def get_ticks(self):
+		return int(self.ticks)
+
+	def schedule(self, delay, callback, repeat = False):
+		"""Run callback after delay ms of game time (and every delay ms after that with repeat)"""
+		call = ScheduledCall(self, self.ticks + delay, callback, delay if repeat else 0)
+		heappush(self.queue, (call.due, next(self.order), call))
+		return call
+
+	def pending(self):
+		return len(self.queue) - self.cancelled
+
+sim_clock = SimClock()
 
 class Timer:
+	"""Active for duration ms of game time after activate(), then runs func"""
 	def __init__(self,duration,func = None):
 		self.duration = duration
 		self.func = func
-		self.start_time = 0
+		self.call = None
 		self.active = False
 
 	def activate(self):
+		self.deactivate()
 		self.active = True
-		self.start_time = pygame.time.get_ticks()
+		self.call = sim_clock.schedule(self.duration, self.finish)
 
 	def deactivate(self):
 		self.active = False
-		self.start_time = 0
-
-	def update(self):
-		current_time = pygame.time.get_ticks()
-		if current_time - self.start_time >= self.duration:
-			if self.func and self.start_time != 0:
-				self.func()
-			self.deactivate()
\ No newline at end of file
+		if self.call:
+			self.call.cancel()
+			self.call = None
+
+	def finish(self):
+		self.call = None
+		self.active = False
+		if self.func:
+			self.func()
@@ -1,6 +1,8 @@
 import pygame
 from settings import *
 from pathlib import Path
+from text_cache import get_font, render_text
+from display_updates import display_updates
 
 ASSET_PATH = Path('graphics/overlay/title_screen.png')
 
@@ -9,9 +11,9 @@ class TitleScreen:
         pygame.font.init()
         self.display_surface = pygame.display.get_surface()
         self.screen_rect = self.display_surface.get_rect()
-        self.title_font = pygame.font.Font('font/LycheeSoda.ttf', 72)
-        self.subtitle_font = pygame.font.Font('font/LycheeSoda.ttf', 28)
-        self.copyright_font = pygame.font.Font('font/LycheeSoda.ttf', 16)  # adjust size if needed
+        self.title_font = get_font(72)
+        self.subtitle_font = get_font(28)
+        self.copyright_font = get_font(16)  # adjust size if needed
         self.copyright_text = "© Credited to Music Owner and Assets Creators"
 
         # load the title image inserted by the user (required)
@@ -22,6 +24,9 @@ class TitleScreen:
         # scale to fit screen
         self.image = pygame.transform.smoothscale(self.image, (SCREEN_WIDTH, SCREEN_HEIGHT))
 
+        # the title is still until SPACE is pressed, so it's drawn once and then left alone
+        self.drawn = False
+
         # fade control
         self.fading = False
         self.done = False
@@ -67,16 +72,20 @@ class TitleScreen:
 
 
     def draw(self):
+        if self.drawn and not self.fading:
+            return
+        self.drawn = True
+        display_updates.add_full()
         self.display_surface.blit(self.image, (0, 0))
 
         # draw hint if not fading
         if not self.fading:
-            sub_s = self.subtitle_font.render('Press SPACE to start', True, (0, 0, 0))
+            sub_s = render_text(self.subtitle_font, 'Press SPACE to start', (0, 0, 0))
             sub_rect = sub_s.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60))
             self.display_surface.blit(sub_s, sub_rect)
 
         # draw copyright text
-        copyright_surf = self.copyright_font.render(self.copyright_text, True, (0, 0, 0))
+        copyright_surf = render_text(self.copyright_font, self.copyright_text, (0, 0, 0))
         self.display_surface.blit(copyright_surf, (10, 10))
 
         # draw fade surface
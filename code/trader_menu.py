@@ -1,15 +1,21 @@
 import pygame
 from settings import *
 from random import randint
+from support import import_image
+from post_effects import post_effects
+from display_updates import display_updates
+from input_state import input_state
+from ui_widgets import Panel, Label, Button, GridSlot, ScrollList
+from text_cache import get_font
 
 class TraderMenu:
 	def __init__(self, player, toggle_menu):
 		self.player = player
 		self.toggle_menu = toggle_menu
 		self.display_surface = pygame.display.get_surface()
-		self.font = pygame.font.Font('font/LycheeSoda.ttf', 24)
-		self.title_font = pygame.font.Font('font/LycheeSoda.ttf', 36)
-		self.small_font = pygame.font.Font('font/LycheeSoda.ttf', 18)
+		self.font = get_font(24)
+		self.title_font = get_font(36)
+		self.small_font = get_font(18)
 		self.item_icons = {}
 		self.load_icons()
 		self.hovered_button = None
@@ -34,8 +40,7 @@ class TraderMenu:
 		# Selection
 		self.selected_index = 0
 
-		# Scroll offset for buy/sell menus
-		self.scroll_offset = 0
+		# Rows shown at once in the buy/sell grids (the mouse wheel scrolls the rest)
 		self.max_visible_rows = 2 # Show 2 rows at a time
 		
 		# UI dimensions
@@ -43,7 +48,56 @@ class TraderMenu:
 		self.height = 500
 		self.x = SCREEN_WIDTH // 2 - self.width // 2
 		self.y = SCREEN_HEIGHT // 2 - self.height // 2
+
+		self.create_widgets()
 	
+	def create_widgets(self):
+		"""Build each screen once; widgets only re-render when money, stock, hover or scroll change"""
+		button_style = {'bg': (60, 45, 30), 'hover_bg': (100, 80, 60), 'border': (200, 180, 150), 'width': 3, 'radius': 10, 'text': (255, 255, 255), 'hover_text': (255, 215, 0)}
+		back_style = dict(button_style, width = 2, radius = 8, hover_text = (255, 255, 255))
+		self.slot_style = {'bg': (60, 45, 30), 'hover_bg': (80, 60, 40), 'border': (200, 180, 150), 'width': 2, 'radius': 8}
+		money_text = lambda: f"Money: ${self.player.money}"
+
+		self.background = Panel((self.x, self.y, self.width, self.height), (40, 30, 20), (200, 180, 150), 3, 12)
+
+		# main
+		self.main_screen = Panel((self.x, self.y, self.width, self.height))
+		self.main_screen.add(Label((SCREEN_WIDTH // 2, self.y + 50), self.title_font, "Trader's Shop", (255, 230, 200)))
+		self.main_buttons = {}
+		for i, (text, button_id) in enumerate([('Buy Seeds', 'buy'), ('Sell Crops', 'sell'), ('Exit', 'exit')]):
+			button_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, self.y + 140 + i * 80, 300, 60)
+			self.main_buttons[button_id] = self.main_screen.add(Button(button_rect, text, self.font, button_style))
+		self.main_screen.add(Label((SCREEN_WIDTH // 2, self.y + self.height - 50), self.font, money_text, (255, 215, 0)))
+
+		# buy
+		self.buy_screen = Panel((self.x, self.y, self.width, self.height))
+		self.buy_screen.add(Label((SCREEN_WIDTH // 2, self.y + 40), self.title_font, "Buy Seeds", (255, 230, 200)))
+		self.buy_screen.add(Label((SCREEN_WIDTH // 2, self.y + 75), self.small_font, self.get_timer_text, (180, 180, 180)))
+		self.buy_list = ScrollList((self.x + 30, self.y + 120), (100, 140), 10, 5, self.max_visible_rows)
+		self.buy_screen.add(self.buy_list)
+
+		# sell
+		self.sell_screen = Panel((self.x, self.y, self.width, self.height))
+		self.sell_screen.add(Label((SCREEN_WIDTH // 2, self.y + 40), self.title_font, "Sell Crops", (255, 230, 200)))
+		self.sell_list = ScrollList((self.x + 50, self.y + 100), (110, 150), 10, 4, self.max_visible_rows)
+		self.sell_screen.add(self.sell_list)
+		self.no_crops_label = Label((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), self.font, "No crops to sell!", (200, 200, 200))
+
+		self.back_button = Button((self.x + 20, self.y + self.height - 60, 100, 40), 'Back', self.font, back_style)
+		for screen in (self.buy_screen, self.sell_screen):
+			screen.add(self.back_button)
+			screen.add(Label((SCREEN_WIDTH // 2, self.y + self.height - 30), self.font, money_text, (255, 215, 0)))
+
+	def reset_scroll(self):
+		self.buy_list.scroll_by(-self.buy_list.scroll)
+		self.sell_list.scroll_by(-self.sell_list.scroll)
+
+	def get_timer_text(self):
+		time_left = self.stock_refresh_interval - self.stock_timer
+		minutes = int(time_left // 60)
+		seconds = int(time_left % 60)
+		return f"Stock refreshes in: {minutes}:{seconds:02d}"
+
 	def refresh_stock(self):
 		"""Refresh trader stock"""
 		for seed in self.stock:
@@ -58,13 +112,13 @@ class TraderMenu:
 			try:
 				# Seed icon (stage 0)
 				seed_path = f'graphics/fruit/{item}/0.png'
-				seed_icon = pygame.image.load(seed_path).convert_alpha()
+				seed_icon = import_image(seed_path)
 				seed_icon = pygame.transform.scale(seed_icon, (50, 50))
 				self.item_icons[f'{item}_seed'] = seed_icon
 				
 				# Crop icon (stage 3)
 				crop_path = f'graphics/fruit/{item}/3.png'
-				crop_icon = pygame.image.load(crop_path).convert_alpha()
+				crop_icon = import_image(crop_path)
 				crop_icon = pygame.transform.scale(crop_icon, (50, 50))
 				self.item_icons[f'{item}_crop'] = crop_icon
 			except:
@@ -84,7 +138,7 @@ class TraderMenu:
 	
 	def handle_input(self, events):
 		"""Handle menu input with mouse and scroll"""
-		mouse_pos = pygame.mouse.get_pos()
+		mouse_pos = input_state.mouse_pos
 		
 		for event in events:
 			if event.type == pygame.KEYDOWN:
@@ -93,29 +147,25 @@ class TraderMenu:
 						self.toggle_menu()
 					else:
 						self.mode = 'main'
-						self.scroll_offset = 0
+						self.reset_scroll()
 			
 			# Mouse wheel scrolling
 			elif event.type == pygame.MOUSEWHEEL:
-				if self.mode in ['buy', 'sell']:
-					self.scroll_offset -= event.y
-					# Clamp scroll offset
-					if self.mode == 'buy':
-						max_scroll = max(0, (len(self.stock) - 1) // 5)
-					elif self.mode == 'sell':
-						sellable = self.get_sellable_crops()
-						max_scroll = max(0, (len(sellable) - 1) // 4)
-					self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
+				# (the list clamps the offset to its rows)
+				if self.mode == 'buy':
+					self.buy_list.scroll_by(-event.y)
+				elif self.mode == 'sell':
+					self.sell_list.scroll_by(-event.y)
 			
 			elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
 				# Check main menu buttons
 				if self.mode == 'main':
 					if self.hovered_button == 'buy':
 						self.mode = 'buy'
-						self.scroll_offset = 0
+						self.reset_scroll()
 					elif self.hovered_button == 'sell':
 						self.mode = 'sell'
-						self.scroll_offset = 0
+						self.reset_scroll()
 					elif self.hovered_button == 'exit':
 						self.toggle_menu()
 				
@@ -130,7 +180,7 @@ class TraderMenu:
 				# Check back button
 				if self.hovered_button == 'back' and self.mode != 'main':
 					self.mode = 'main'
-					self.scroll_offset = 0
+					self.reset_scroll()
 
 	def buy_seed(self, seed):
 		"""Buy a seed"""
@@ -180,14 +230,11 @@ class TraderMenu:
 	def draw(self):
 		"""Draw trader menu"""
 		# Semi-transparent overlay
-		overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-		overlay.fill((0, 0, 0, 180))
-		self.display_surface.blit(overlay, (0, 0))
+		post_effects.blend(self.display_surface, (0, 0, 0), 180)
 		
 		# Menu background
-		menu_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-		pygame.draw.rect(self.display_surface, (40, 30, 20), menu_rect, border_radius=12)
-		pygame.draw.rect(self.display_surface, (200, 180, 150), menu_rect, 3, border_radius=12)
+		self.background.draw(self.display_surface)
+		display_updates.add(self.background.rect)
 		
 		if self.mode == 'main':
 			self.draw_main_menu()
@@ -198,255 +245,68 @@ class TraderMenu:
 	
 	def draw_main_menu(self):
 		"""Draw main trader menu with mouse support"""
-		mouse_pos = pygame.mouse.get_pos()
+		self.main_screen.draw(self.display_surface, input_state.mouse_pos)
 		self.hovered_button = None
-		
-		# Title
-		title = "Trader's Shop"
-		title_surf = self.title_font.render(title, True, (255, 230, 200))
-		title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 50))
-		self.display_surface.blit(title_surf, title_rect)
-		
-		# Buttons
-		buttons = [
-			{'text': 'Buy Seeds', 'id': 'buy'},
-			{'text': 'Sell Crops', 'id': 'sell'},
-			{'text': 'Exit', 'id': 'exit'}
-		]
-		
-		start_y = self.y + 140
-		button_width = 300
-		button_height = 60
-		
-		for i, button in enumerate(buttons):
-			button_rect = pygame.Rect(
-				SCREEN_WIDTH // 2 - button_width // 2,
-				start_y + i * 80,
-				button_width,
-				button_height
-			)
-			
-			is_hovering = button_rect.collidepoint(mouse_pos)
-			if is_hovering:
-				self.hovered_button = button['id']
-			
-			# Button background
-			button_color = (100, 80, 60) if is_hovering else (60, 45, 30)
-			pygame.draw.rect(self.display_surface, button_color, button_rect, border_radius=10)
-			pygame.draw.rect(self.display_surface, (200, 180, 150), button_rect, 3, border_radius=10)
-			
-			# Button text
-			text_color = (255, 215, 0) if is_hovering else (255, 255, 255)
-			text_surf = self.font.render(button['text'], True, text_color)
-			text_rect = text_surf.get_rect(center=button_rect.center)
-			self.display_surface.blit(text_surf, text_rect)
-		
-		# Money display
-		money_surf = self.font.render(f"Money: ${self.player.money}", True, (255, 215, 0))
-		money_rect = money_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + self.height - 50))
-		self.display_surface.blit(money_surf, money_rect)
+		for button_id, button in self.main_buttons.items():
+			if button.hovered:
+				self.hovered_button = button_id
 	
 	def draw_buy_menu(self):
 		"""Draw seed buying menu with icons"""
-		mouse_pos = pygame.mouse.get_pos()	
-		self.hovered_item = None
-		self.hovered_button = None
-		
-		# Title
-		title = "Buy Seeds"
-		title_surf = self.title_font.render(title, True, (255, 230, 200))
-		title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 40))
-		self.display_surface.blit(title_surf, title_rect)
-		
-		# Stock timer
-		time_left = self.stock_refresh_interval - self.stock_timer
-		minutes = int(time_left // 60)
-		seconds = int(time_left % 60)
-		timer_text = f"Stock refreshes in: {minutes}:{seconds:02d}"
-		timer_surf = self.small_font.render(timer_text, True, (180, 180, 180))
-		timer_rect = timer_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 75))
-		self.display_surface.blit(timer_surf, timer_rect)
-		
-		# Draw seed items in grid
-		seeds = list(self.stock.keys())
-		start_x = self.x + 30
-		start_y = self.y + 120
-		slot_width = 100
-		slot_height = 140
-		slots_per_row = 5
-		
-		for i, seed in enumerate(seeds):
-			row = i // slots_per_row
-			col = i % slots_per_row
-			
-			x = start_x + col * (slot_width + 10)
-			y = start_y + row * (slot_height + 10)
-			
-			# Slot rect
-			slot_rect = pygame.Rect(x, y, slot_width, slot_height)
-			is_hovering = slot_rect.collidepoint(mouse_pos)
-			
-			if is_hovering:
-				self.hovered_item = seed
-			
-			# Slot background
-			slot_color = (80, 60, 40) if is_hovering else (60, 45, 30)
-			pygame.draw.rect(self.display_surface, slot_color, slot_rect, border_radius=8)
-			pygame.draw.rect(self.display_surface, (200, 180, 150), slot_rect, 2, border_radius=8)
-			
-			# Icon
-			icon_key = f'{seed}_seed'
-			if icon_key in self.item_icons:
-				icon = self.item_icons[icon_key]
-				icon_rect = icon.get_rect(center=(x + slot_width // 2, y + 35))
-				self.display_surface.blit(icon, icon_rect)
-			
-			# Seed name
-			name = seed.replace('_', ' ').title()
-			name_surf = self.small_font.render(name, True, (255, 255, 255))
-			name_rect = name_surf.get_rect(center=(x + slot_width // 2, y + 75))
-			self.display_surface.blit(name_surf, name_rect)
-			
-			# Stock
+		self.buy_list.sync(self.stock.keys(), self.create_buy_slot)
+		self.buy_screen.draw(self.display_surface, input_state.mouse_pos)
+		self.hovered_item = self.buy_list.hovered_key
+		self.hovered_button = 'back' if self.back_button.hovered else None
+
+	def create_buy_slot(self, seed, rect):
+		icon = self.item_icons.get(f'{seed}_seed')
+		name = seed.replace('_', ' ').title()
+		price = PURCHASE_PRICES.get(seed, 10)
+
+		def bind():
 			stock = self.stock[seed]
 			stock_color = (100, 200, 100) if stock > 0 else (200, 100, 100)
-			stock_surf = self.small_font.render(f"Stock: {stock}", True, stock_color)
-			stock_rect = stock_surf.get_rect(center=(x + slot_width // 2, y + 95))
-			self.display_surface.blit(stock_surf, stock_rect)
-			
-			# Price
-			price = PURCHASE_PRICES.get(seed, 10)
-			price_surf = self.small_font.render(f"${price}", True, (255, 215, 0))
-			price_rect = price_surf.get_rect(center=(x + slot_width // 2, y + 115))
-			self.display_surface.blit(price_surf, price_rect)
-		
-		# Back button
-		back_rect = pygame.Rect(self.x + 20, self.y + self.height - 60, 100, 40)
-		is_back_hover = back_rect.collidepoint(mouse_pos)
-		if is_back_hover:
-			self.hovered_button = 'back'
-		
-		back_color = (100, 80, 60) if is_back_hover else (60, 45, 30)
-		pygame.draw.rect(self.display_surface, back_color, back_rect, border_radius=8)
-		pygame.draw.rect(self.display_surface, (200, 180, 150), back_rect, 2, border_radius=8)
-		
-		back_text = self.font.render('Back', True, (255, 255, 255))
-		back_text_rect = back_text.get_rect(center=back_rect.center)
-		self.display_surface.blit(back_text, back_text_rect)
-		
-		# Money display
-		money_surf = self.font.render(f"Money: ${self.player.money}", True, (255, 215, 0))
-		money_rect = money_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + self.height - 30))
-		self.display_surface.blit(money_surf, money_rect)
+			return icon, ((name, (255, 255, 255)), (f"Stock: {stock}", stock_color), (f"${price}", (255, 215, 0))), None
+
+		return GridSlot(rect, self.slot_style, bind, self.small_font, (rect.width // 2, 35), 75)
 	
 	def draw_sell_menu(self):
 		"""Draw crop selling menu with quality display"""
-		mouse_pos = pygame.mouse.get_pos()
-		self.hovered_item = None
-		self.hovered_button = None
-		
-		# Title
-		title = "Sell Crops"
-		title_surf = self.title_font.render(title, True, (255, 230, 200))
-		title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + 40))
-		self.display_surface.blit(title_surf, title_rect)
-		
-		# Get sellable crops
 		sellable = self.get_sellable_crops()
-		
+		self.sell_list.sync(sellable, self.create_sell_slot)
+		self.sell_screen.draw(self.display_surface, input_state.mouse_pos)
 		if not sellable:
-			no_crops = "No crops to sell!"
-			no_crops_surf = self.font.render(no_crops, True, (200, 200, 200))
-			no_crops_rect = no_crops_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-			self.display_surface.blit(no_crops_surf, no_crops_rect)
+			self.no_crops_label.draw(self.display_surface)
+		self.hovered_item = self.sell_list.hovered_key
+		self.hovered_button = 'back' if self.back_button.hovered else None
+
+	def create_sell_slot(self, crop_key, rect):
+		# Parse crop
+		parts = crop_key.split('_')
+		crop_type = '_'.join(parts[:-1])
+		quality = parts[-1]
+
+		# Get price
+		if isinstance(SALE_PRICES[crop_type], dict):
+			price = SALE_PRICES[crop_type][quality]
 		else:
-			# Draw items in grid
-			start_x = self.x + 50
-			start_y = self.y + 100
-			slot_width = 110
-			slot_height = 150
-			slots_per_row = 4
-			
-			for i, crop_key in enumerate(sellable):
-				row = i // slots_per_row
-				col = i % slots_per_row
-				
-				x = start_x + col * (slot_width + 10)
-				y = start_y + row * (slot_height + 10)
-				
-				# Parse crop
-				parts = crop_key.split('_')
-				crop_type = '_'.join(parts[:-1])
-				quality = parts[-1]
-				qty = self.player.crop_inventory[crop_key]
-				
-				# Get price
-				if isinstance(SALE_PRICES[crop_type], dict):
-					price = SALE_PRICES[crop_type][quality]
-				else:
-					price = SALE_PRICES[crop_type]
-				
-				# Slot rect
-				slot_rect = pygame.Rect(x, y, slot_width, slot_height)
-				is_hovering = slot_rect.collidepoint(mouse_pos)
-				
-				if is_hovering:
-					self.hovered_item = crop_key
-				
-				# Slot background
-				slot_color = (80, 60, 40) if is_hovering else (60, 45, 30)
-				pygame.draw.rect(self.display_surface, slot_color, slot_rect, border_radius=8)
-				pygame.draw.rect(self.display_surface, (200, 180, 150), slot_rect, 2, border_radius=8)
-				
-				# Icon
-				icon_key = f'{crop_type}_crop'
-				if icon_key in self.item_icons:
-					icon = self.item_icons[icon_key]
-					icon_rect = icon.get_rect(center=(x + slot_width // 2, y + 35))
-					self.display_surface.blit(icon, icon_rect)
-				
-				# Crop name
-				name = crop_type.replace('_', ' ').title()
-				name_surf = self.small_font.render(name, True, (255, 255, 255))
-				name_rect = name_surf.get_rect(center=(x + slot_width // 2, y + 75))
-				self.display_surface.blit(name_surf, name_rect)
-				
-				# Quality
-				quality_colors = {
-					'standard': (255, 255, 255),
-					'silver': (192, 192, 192),
-					'gold': (255, 215, 0),
-					'mythical': (138, 43, 226)
-				}
-				quality_surf = self.small_font.render(quality.upper(), True, quality_colors[quality])
-				quality_rect = quality_surf.get_rect(center=(x + slot_width // 2, y + 95))
-				self.display_surface.blit(quality_surf, quality_rect)
-				
-				# Quantity
-				qty_surf = self.small_font.render(f"x{qty}", True, (200, 200, 200))
-				qty_rect = qty_surf.get_rect(center=(x + slot_width // 2, y + 115))
-				self.display_surface.blit(qty_surf, qty_rect)
-				
-				# Price
-				price_surf = self.small_font.render(f"${price}", True, (100, 200, 100))
-				price_rect = price_surf.get_rect(center=(x + slot_width // 2, y + 135))
-				self.display_surface.blit(price_surf, price_rect)
-		
-		# Back button
-		back_rect = pygame.Rect(self.x + 20, self.y + self.height - 60, 100, 40)
-		is_back_hover = back_rect.collidepoint(mouse_pos)
-		if is_back_hover:
-			self.hovered_button = 'back'
-		
-		back_color = (100, 80, 60) if is_back_hover else (60, 45, 30)
-		pygame.draw.rect(self.display_surface, back_color, back_rect, border_radius=8)
-		pygame.draw.rect(self.display_surface, (200, 180, 150), back_rect, 2, border_radius=8)
-		
-		back_text = self.font.render('Back', True, (255, 255, 255))
-		back_text_rect = back_text.get_rect(center=back_rect.center)
-		self.display_surface.blit(back_text, back_text_rect)
-		
-		# Money display
-		money_surf = self.font.render(f"Money: ${self.player.money}", True, (255, 215, 0))
-		money_rect = money_surf.get_rect(center=(SCREEN_WIDTH // 2, self.y + self.height - 30))
-		self.display_surface.blit(money_surf, money_rect)
\ No newline at end of file
+			price = SALE_PRICES[crop_type]
+
+		quality_colors = {
+			'standard': (255, 255, 255),
+			'silver': (192, 192, 192),
+			'gold': (255, 215, 0),
+			'mythical': (138, 43, 226)
+		}
+		icon = self.item_icons.get(f'{crop_type}_crop')
+		name = crop_type.replace('_', ' ').title()
+
+		def bind():
+			qty = self.player.crop_inventory.get(crop_key, 0)
+			return icon, (
+				(name, (255, 255, 255)),
+				(quality.upper(), quality_colors[quality]),
+				(f"x{qty}", (200, 200, 200)),
+				(f"${price}", (100, 200, 100))), None
+
+		return GridSlot(rect, self.slot_style, bind, self.small_font, (rect.width // 2, 35), 75)
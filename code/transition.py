@@ -1,5 +1,7 @@
 import pygame
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from post_effects import post_effects
+from display_updates import display_updates
+from jobs import jobs
 
 class TransitionStack:
     def __init__(self, reset, player):
@@ -7,6 +9,7 @@ class TransitionStack:
         self.display_surface = pygame.display.get_surface()
         self.reset = reset
         self.player = player
+        self.rollover = None  # the day rollover job reset() queued, done by the end of the fade
 
         # Stack of transitions
         # Each element: {'color': int, 'speed': int}
@@ -26,20 +29,23 @@ class TransitionStack:
         # Update color
         transition['color'] += transition['speed']
 
-        # Trigger reset when fully black
+        # Trigger reset when fully black, it runs over the frames of the fade back in
         if transition['color'] <= 0:
             transition['speed'] *= -1  # reverse
             transition['color'] = 0
-            self.reset()
+            self.rollover = self.reset()
 
         # Finish transition when fully white
         if transition['color'] > 255:
             transition['color'] = 255
+            if self.rollover:
+                jobs.finish(self.rollover)
+                self.rollover = None
             self.player.sleep = False
             transition['speed'] = -2
             self.stack.pop()  # remove finished transition
 
         # Draw overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((transition['color'], transition['color'], transition['color']))
-        self.display_surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        color = transition['color']
+        post_effects.multiply(self.display_surface, (color, color, color))
+        display_updates.add_full()
@@ -0,0 +1,232 @@
+import pygame
+from text_cache import render_text
+
+def bound(value):
+	"""Widgets take either a value or a callable that returns the current value"""
+	return value() if callable(value) else value
+
+class Widget:
+	"""Retained UI element: keeps its rendered surface and only re-renders when get_key() changes"""
+	renders = 0  # re-renders across every widget, shown in the perf overlay
+
+	def __init__(self, rect):
+		self.rect = pygame.Rect(rect)
+		self.surf = None
+		self.key = None
+		self.hovered = False
+
+	def get_key(self):
+		"""The data this widget shows, anything that changes it needs a re-render"""
+		return None
+
+	def render(self):
+		raise NotImplementedError
+
+	def get_surf(self):
+		key = self.get_key()
+		if self.surf is None or key != self.key:
+			self.key = key
+			self.surf = self.render()
+			Widget.renders += 1
+		return self.surf
+
+	def draw(self, surface, mouse_pos = None):
+		self.hovered = mouse_pos is not None and self.rect.collidepoint(mouse_pos)
+		surface.blit(self.get_surf(), self.rect)
+
+class Panel(Widget):
+	"""Rounded box (or just a container without a colour) that draws its children on top"""
+	def __init__(self, rect, color = None, border_color = None, border = 0, radius = 0):
+		super().__init__(rect)
+		self.color = color
+		self.border_color = border_color
+		self.border = border
+		self.radius = radius
+		self.children = []
+
+	def add(self, widget):
+		self.children.append(widget)
+		return widget
+
+	def render(self):
+		surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+		if self.color:
+			pygame.draw.rect(surf, self.color, surf.get_rect(), 0, self.radius)
+		if self.border_color:
+			pygame.draw.rect(surf, self.border_color, surf.get_rect(), self.border, self.radius)
+		return surf
+
+	def draw(self, surface, mouse_pos = None):
+		if self.color or self.border_color:
+			super().draw(surface, mouse_pos)
+		for child in self.children:
+			child.draw(surface, mouse_pos)
+
+class Label(Widget):
+	"""Text anchored at a point, e.g. anchor = 'midleft'"""
+	def __init__(self, pos, font, text, color, anchor = 'center'):
+		super().__init__((pos, (0, 0)))
+		self.pos = pos
+		self.font = font
+		self.text = text
+		self.color = color
+		self.anchor = anchor
+
+	def get_key(self):
+		return (bound(self.text), bound(self.color))
+
+	def render(self):
+		text, color = self.key
+		return render_text(self.font, text, color)
+
+	def draw(self, surface, mouse_pos = None):
+		surf = self.get_surf()
+		self.rect = surf.get_rect(**{self.anchor: self.pos})
+		surface.blit(surf, self.rect)
+
+class Button(Widget):
+	"""Rounded button that re-renders when the mouse enters or leaves it.
+	style keys: bg, hover_bg, border, width, radius, text, hover_text"""
+	def __init__(self, rect, text, font, style):
+		super().__init__(rect)
+		self.text = text
+		self.font = font
+		self.style = style
+
+	def get_key(self):
+		return (self.hovered, bound(self.text))
+
+	def render(self):
+		hovered, text = self.key
+		style = self.style
+		surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+		surf_rect = surf.get_rect()
+		pygame.draw.rect(surf, style['hover_bg'] if hovered else style['bg'], surf_rect, 0, style['radius'])
+		pygame.draw.rect(surf, style['border'], surf_rect, style['width'], style['radius'])
+		text_surf = render_text(self.font, text, style['hover_text'] if hovered else style['text'])
+		surf.blit(text_surf, text_surf.get_rect(center = surf_rect.center))
+		return surf
+
+class GridSlot(Widget):
+	"""Item slot: an icon, a few centred lines of text under it and an optional
+	quantity badge in the corner. bind returns (icon, [(text, color), ...], badge)"""
+	def __init__(self, rect, style, bind, font, icon_center = None, first_line = 0, line_step = 20):
+		super().__init__(rect)
+		self.style = style
+		self.bind = bind
+		self.font = font
+		self.icon_center = icon_center
+		self.first_line = first_line
+		self.line_step = line_step
+
+	def get_key(self):
+		return (self.hovered, self.bind())
+
+	def render(self):
+		hovered, (icon, lines, badge) = self.key
+		style = self.style
+		surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+		surf_rect = surf.get_rect()
+		pygame.draw.rect(surf, style['hover_bg'] if hovered else style['bg'], surf_rect, 0, style['radius'])
+		pygame.draw.rect(surf, style['border'], surf_rect, style['width'], style['radius'])
+
+		if icon:
+			surf.blit(icon, icon.get_rect(center = self.icon_center or surf_rect.center))
+		for i, (text, color) in enumerate(lines):
+			text_surf = render_text(self.font, text, color)
+			surf.blit(text_surf, text_surf.get_rect(center = (surf_rect.centerx, self.first_line + i * self.line_step)))
+		if badge is not None:
+			badge_surf = render_text(self.font, str(badge), (255, 255, 255))
+			badge_rect = badge_surf.get_rect(bottomright = (surf_rect.right - 4, surf_rect.bottom - 4))
+			pygame.draw.rect(surf, (0, 0, 0), badge_rect.inflate(6, 4))
+			surf.blit(badge_surf, badge_rect)
+		return surf
+
+class ListRow(Widget):
+	"""Row of a ScrollList with left-aligned lines of text, one font and vertical offset
+	(from the row's centre) per line. bind returns [(text, color), ...]"""
+	def __init__(self, rect, style, bind, fonts, line_offsets, indent = 15):
+		super().__init__(rect)
+		self.style = style
+		self.bind = bind
+		self.fonts = fonts
+		self.line_offsets = line_offsets
+		self.indent = indent
+
+	def get_key(self):
+		return (self.hovered, self.bind())
+
+	def render(self):
+		hovered, lines = self.key
+		style = self.style
+		surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+		surf_rect = surf.get_rect()
+		pygame.draw.rect(surf, style['hover_bg'] if hovered else style['bg'], surf_rect, 0, style['radius'])
+		pygame.draw.rect(surf, style['border'], surf_rect, style['width'], style['radius'])
+		for (text, color), font, offset in zip(lines, self.fonts, self.line_offsets):
+			text_surf = render_text(font, text, color)
+			surf.blit(text_surf, text_surf.get_rect(midleft = (self.indent, surf_rect.centery + offset)))
+		return surf
+
+class ScrollList:
+	"""Rows (or a grid with columns) of widgets, one per item key, showing max_rows rows
+	from the scroll offset. Widgets are kept between frames and reused while their key is listed"""
+	def __init__(self, topleft, item_size, gap, columns = 1, max_rows = None):
+		self.topleft = topleft
+		self.item_size = item_size
+		self.gap = gap
+		self.columns = columns
+		self.max_rows = max_rows
+		self.keys = []
+		self.widgets = {}
+		self.scroll = 0
+		self.hovered_key = None
+
+	@property
+	def rows(self):
+		return (len(self.keys) - 1) // self.columns + 1 if self.keys else 0
+
+	def sync(self, keys, make_widget):
+		"""Show these keys, building a widget with make_widget(key, rect) for new ones"""
+		keys = list(keys)
+		if keys == self.keys:
+			return
+		self.keys = keys
+		self.widgets = {key: self.widgets.get(key) or make_widget(key, pygame.Rect((0, 0), self.item_size)) for key in keys}
+		self.scroll_by(0)
+
+	def clear(self):
+		self.keys = []
+		self.widgets = {}
+		self.scroll = 0
+
+	def move_to(self, topleft):
+		if topleft != self.topleft:
+			self.topleft = topleft
+			self.layout()
+
+	def scroll_by(self, rows):
+		max_scroll = max(0, self.rows - self.max_rows) if self.max_rows else 0
+		self.scroll = max(0, min(self.scroll + rows, max_scroll))
+		self.layout()
+
+	def layout(self):
+		width, height = self.item_size
+		for i, key in enumerate(self.keys):
+			row, col = divmod(i, self.columns)
+			self.widgets[key].rect.topleft = (
+				self.topleft[0] + col * (width + self.gap),
+				self.topleft[1] + (row - self.scroll) * (height + self.gap))
+
+	def visible_keys(self):
+		start = self.scroll * self.columns
+		end = len(self.keys) if not self.max_rows else start + self.max_rows * self.columns
+		return self.keys[start:end]
+
+	def draw(self, surface, mouse_pos = None):
+		self.hovered_key = None
+		for key in self.visible_keys():
+			widget = self.widgets[key]
+			widget.draw(surface, mouse_pos)
+			if widget.hovered:
+				self.hovered_key = key
@@ -1,6 +1,7 @@
 import pygame
 from settings import *
 from sprites import Generic
+from radial_overlay import get_radial_overlay, draw_radial_overlay
 
 class Ward(Generic):
     def __init__(self, pos, groups):
@@ -32,6 +33,9 @@ class Ward(Generic):
             for dy in range(-self.protection_radius, self.protection_radius + 1):
                 protected.append((self.grid_x + dx, self.grid_y + dy))
         return protected
+
+    def protects(self, grid_x, grid_y):
+        return abs(grid_x - self.grid_x) <= self.protection_radius and abs(grid_y - self.grid_y) <= self.protection_radius
     
     def update(self, dt):
         """Update ward animation"""
@@ -44,7 +48,12 @@ class WardSystem:
         self.all_sprites = all_sprites
         self.ward_sprites = pygame.sprite.Group()
         self.display_surface = pygame.display.get_surface()
-        
+        self.tile_listeners = []  # called with (grid x, grid y) when a ward is placed or removed
+
+    def notify_tile(self, grid_x, grid_y):
+        for listener in self.tile_listeners:
+            listener(grid_x, grid_y)
+
     def place_ward(self, grid_x, grid_y):
         """Place a ward at grid position"""
         # Check if ward already exists here
@@ -56,6 +65,7 @@ class WardSystem:
         # Create ward
         pos = (grid_x * TILE_SIZE, grid_y * TILE_SIZE)
         ward = Ward(pos, [self.all_sprites, self.ward_sprites])
+        self.notify_tile(grid_x, grid_y)
         print(f"🛡️ Ward placed at ({grid_x}, {grid_y})")
         
         # CLEAR CORRUPTION in ward radius
@@ -63,7 +73,7 @@ class WardSystem:
             protected_tiles = ward.get_protected_tiles()
             cleared_count = 0
             for tile_x, tile_y in protected_tiles:
-                if (tile_x, tile_y) in self.corruption_spread_ref.corrupted_tiles:
+                if (tile_x, tile_y) in self.corruption_spread_ref.corruption_map:
                     self.corruption_spread_ref.remove_corrupted_tile(tile_x, tile_y)
                     cleared_count += 1
             print(f"✨ Ward cleared {cleared_count} corruption tiles!")
@@ -75,6 +85,7 @@ class WardSystem:
         pos = (grid_x * TILE_SIZE, grid_y * TILE_SIZE)
         ward = Ward(pos, [self.all_sprites, self.ward_sprites])
         ward.protection_radius = radius  # Override with mega radius
+        self.notify_tile(grid_x, grid_y)
         print(f"🛡️ MEGA WARD placed at ({grid_x}, {grid_y}) with radius {radius}!")
         
         # Clear ALL corruption
@@ -92,29 +103,20 @@ class WardSystem:
     
     def is_tile_protected(self, grid_x, grid_y):
         """Check if a tile is protected by any ward"""
-        return (grid_x, grid_y) in self.get_all_protected_tiles()
+        # checked against each ward's square, building the tile sets is too slow for the mega ward
+        return any(ward.protects(grid_x, grid_y) for ward in self.ward_sprites)
     
     def draw_protection_radius(self, player_target_pos):
         """Draw ward placement preview"""
         grid_x = int(player_target_pos.x // TILE_SIZE)
         grid_y = int(player_target_pos.y // TILE_SIZE)
         
-        # Draw preview of protection area
-        for dx in range(-6, 7):
-            for dy in range(-6, 7):
-                tile_x = (grid_x + dx) * TILE_SIZE
-                tile_y = (grid_y + dy) * TILE_SIZE
-                
-                # Draw semi-transparent blue overlay
-                preview_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                preview_surf.fill((100, 200, 255, 50))
-                
-                # Get camera offset
-                from level import CameraGroup
-                if hasattr(self, 'camera_offset'):
-                    offset = self.camera_offset
-                else:
-                    offset = pygame.math.Vector2(0, 0)
-                
-                preview_rect = pygame.Rect(tile_x, tile_y, TILE_SIZE, TILE_SIZE)
-                self.display_surface.blit(preview_surf, preview_rect.move(-offset))
\ No newline at end of file
+        # Get camera offset
+        if hasattr(self, 'camera_offset'):
+            offset = self.camera_offset
+        else:
+            offset = pygame.math.Vector2(0, 0)
+        
+        # Draw preview of protection area (semi-transparent blue square)
+        preview_surf = get_radial_overlay(6, (100, 200, 255), 50, circular=False)
+        draw_radial_overlay(self.display_surface, preview_surf, (grid_x * TILE_SIZE, grid_y * TILE_SIZE), offset)
\ No newline at end of file